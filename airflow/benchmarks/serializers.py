@@ -0,0 +1,138 @@
+"""
+Micro-benchmark of the JSONL serializer backends used by `EdFiToADLSOperator`.
+
+Serializes pages of synthetic, Ed-Fi-shaped records and reports rows/sec per backend.
+Backends whose packages are not installed are skipped.
+
+Usage:
+    python -m tn_edu_airflow.benchmarks.serializers --num-rows 200000 --page-size 500
+"""
+import argparse
+import io
+import random
+import time
+import uuid
+
+from typing import List
+
+from tn_edu_airflow.util.serializers import SERIALIZERS, get_serializer
+
+
+DESCRIPTOR_PREFIX = "uri://ed-fi.org"
+
+
+def build_attendance_event(idx: int) -> dict:
+    """
+    Build a record shaped like a `studentSectionAttendanceEvents` row.
+    """
+    return {
+        "id": uuid.uuid4().hex,
+        "attendanceEventCategoryDescriptor": f"{DESCRIPTOR_PREFIX}/AttendanceEventCategoryDescriptor#{random.choice(['In Attendance', 'Excused Absence', 'Tardy'])}",
+        "eventDate": f"2025-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
+        "sectionReference": {
+            "localCourseCode": f"C{idx % 5000:05d}",
+            "schoolId": 190000000 + idx % 2000,
+            "schoolYear": 2025,
+            "sectionIdentifier": f"S{idx % 20000:06d}",
+            "sessionName": "2024-2025 Fall Semester",
+            "link": {"rel": "Section", "href": f"/ed-fi/sections/{uuid.uuid4().hex}"},
+        },
+        "studentReference": {
+            "studentUniqueId": str(1000000000 + idx),
+            "link": {"rel": "Student", "href": f"/ed-fi/students/{uuid.uuid4().hex}"},
+        },
+        "attendanceEventReason": None,
+        "educationalEnvironmentDescriptor": f"{DESCRIPTOR_PREFIX}/EducationalEnvironmentDescriptor#Classroom",
+        "eventDuration": round(random.random(), 4),
+        "_etag": str(random.randint(10 ** 17, 10 ** 18)),
+        "_lastModifiedDate": "2025-01-15T14:03:22.123Z",
+    }
+
+
+def build_school_association(idx: int) -> dict:
+    """
+    Build a record shaped like a `studentSchoolAssociations` row, with nested collections.
+    """
+    return {
+        "id": uuid.uuid4().hex,
+        "schoolReference": {"schoolId": 190000000 + idx % 2000, "link": {"rel": "School", "href": f"/ed-fi/schools/{uuid.uuid4().hex}"}},
+        "studentReference": {"studentUniqueId": str(1000000000 + idx), "link": {"rel": "Student", "href": f"/ed-fi/students/{uuid.uuid4().hex}"}},
+        "entryDate": "2024-08-05",
+        "entryGradeLevelDescriptor": f"{DESCRIPTOR_PREFIX}/GradeLevelDescriptor#{random.choice(['Ninth grade', 'Tenth grade', 'Eleventh grade'])}",
+        "entryTypeDescriptor": f"{DESCRIPTOR_PREFIX}/EntryTypeDescriptor#Transfer",
+        "exitWithdrawDate": None,
+        "primarySchool": True,
+        "repeatGradeIndicator": False,
+        "alternativeGraduationPlans": [],
+        "educationPlans": [
+            {"educationPlanDescriptor": f"{DESCRIPTOR_PREFIX}/EducationPlanDescriptor#{plan}"}
+            for plan in random.sample(["504", "IEP", "ILP", "Career"], k=random.randint(0, 3))
+        ],
+        "_ext": {"tdoe": {"isServiceSchool": False, "fundingEligibilityDescriptor": f"{DESCRIPTOR_PREFIX}/FundingEligibilityDescriptor#Eligible"}},
+        "_etag": str(random.randint(10 ** 17, 10 ** 18)),
+        "_lastModifiedDate": "2025-01-15T14:03:22.123Z",
+    }
+
+
+def build_pages(num_rows: int, page_size: int) -> List[List[dict]]:
+    builders = (build_attendance_event, build_school_association)
+    rows = [builders[idx % len(builders)](idx) for idx in range(num_rows)]
+    return [rows[idx: idx + page_size] for idx in range(0, num_rows, page_size)]
+
+
+def benchmark_serializer(name: str, pages: List[List[dict]], repeats: int) -> dict:
+    """
+    Serialize every page `repeats` times into an in-memory output and keep the fastest run.
+    """
+    serializer = get_serializer(name)
+
+    best_seconds = None
+    num_bytes = 0
+
+    for _ in range(repeats):
+        output = io.BytesIO()
+
+        start = time.perf_counter()
+        for page in pages:
+            serializer.write_rows(page, output)
+        seconds = time.perf_counter() - start
+
+        num_bytes = output.tell()
+        if best_seconds is None or seconds < best_seconds:
+            best_seconds = seconds
+
+    num_rows = sum(map(len, pages))
+    return {
+        "serializer": name,
+        "rows_per_sec": num_rows / best_seconds,
+        "mb_per_sec": num_bytes / best_seconds / 1024 ** 2,
+        "output_mb": num_bytes / 1024 ** 2,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-rows", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    pages = build_pages(args.num_rows, args.page_size)
+
+    print(f"Serializing {args.num_rows} rows in pages of {args.page_size} (best of {args.repeats}).")
+    print(f"{'serializer':<10} {'rows/sec':>12} {'MB/sec':>9} {'output MB':>10}")
+
+    for name in SERIALIZERS:
+        try:
+            result = benchmark_serializer(name, pages, args.repeats)
+        except ImportError as err:
+            print(f"{name:<10} skipped: {err}")
+            continue
+
+        print(f"{result['serializer']:<10} {result['rows_per_sec']:>12,.0f} {result['mb_per_sec']:>9.1f} {result['output_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,10 @@ import logging
 from typing import Dict, List, Tuple, Optional
 
 from airflow.exceptions import AirflowSkipException, AirflowFailException
-from airflow.providers.databricks.hooks.databricks_sql import DatabricksSqlHook
 
 from tn_edu_airflow.callables.databricks import insert_into_databricks
 from tn_edu_airflow.callables import airflow_util
+from tn_edu_airflow.util.databricks_pool import get_databricks_pool
 from edu_edfi_airflow.providers.edfi.hooks.edfi import EdFiHook
 
 
@@ -37,9 +37,13 @@ def reset_change_versions(
         *,
         databricks_conn_id: str,
         change_version_table: str,
+        api_years: Optional[List[int]] = None,
 
         **kwargs
 ) -> None:
+    """
+    If `api_years` is passed (multi-year extraction), reset the change versions of each of those years instead.
+    """
     # Airflow-skip if run not marked for a full-refresh.
     if not airflow_util.is_full_refresh(kwargs):
         raise AirflowSkipException(f"Full refresh not specified. Change version table `{change_version_table}` unchanged.")
@@ -53,7 +57,7 @@ def reset_change_versions(
         update {database}.{schema}.{change_version_table}
             set is_active = FALSE
         where tenant_code = '{tenant_code}'
-        and api_year = {api_year}
+        and api_year in ({', '.join(map(str, api_years or [api_year]))})
         and is_active
     """
 
@@ -63,7 +67,7 @@ def reset_change_versions(
 
     ### Connect to Snowflake and execute the query.
     logging.info("Full refresh: marking previous pulls inactive.")
-    DatabricksSqlHook(databricks_conn_id).run(qry_mark_inactive)
+    get_databricks_pool(databricks_conn_id).run(qry_mark_inactive)
 
 
 def get_previous_change_versions(
@@ -79,6 +83,7 @@ def get_previous_change_versions(
         get_key_changes: bool = False,
         has_key_changes: bool = False,
         use_edfi_token_cache: bool = False,
+        api_years: Optional[List[int]] = None,
 
         **context
 ) -> None:
@@ -95,6 +100,12 @@ def get_previous_change_versions(
     At the end of the ingest, the change version table is updated with the most recent version found in EdFi.
 
     If a full refresh is being completed, all change versions for this tenant-year have been set to inactive.
+
+    Return (endpoint, last_change_version, expected_row_count) tuples. Row counts are only known when checked against
+    the Ed-Fi API (see `get_previous_change_versions_with_deltas()`), so they are always None here.
+
+    If `api_years` is passed (multi-year extraction), each endpoint's change version is the earliest across those years,
+    so one pull covers the deltas of every year. Endpoints not yet pulled for every year start from zero.
     """
     # Skip deletes/key-changes if a full-refresh.
     if airflow_util.is_full_refresh(context) and (get_deletes or get_key_changes):
@@ -127,8 +138,24 @@ def get_previous_change_versions(
         group by all
     """
 
+    if api_years:
+        qry_prior_max = f"""
+            select name, min(max_version) as max_version
+            from (
+                select name, api_year, max(max_version) as max_version
+                from {database}.{schema}.{change_version_table}
+                where tenant_code = '{tenant_code}'
+                    and api_year in ({', '.join(map(str, api_years))})
+                    and is_active
+                    and {filter_clause}
+                group by all
+            )
+            group by name
+            having count(*) = {len(api_years)}
+        """
+
     ### Retrieve previous endpoint-level change versions and push as an XCom.
-    prior_change_versions = dict(DatabricksSqlHook(databricks_conn_id).get_records(qry_prior_max))
+    prior_change_versions = dict(get_databricks_pool(databricks_conn_id).get_records(qry_prior_max))
     logging.info(
         f"Collected prior change versions for {len(prior_change_versions)} endpoints."
     )
@@ -139,7 +166,7 @@ def get_previous_change_versions(
         if (last_max_version := prior_change_versions.get(endpoint, 0)):
             logging.info(f"    {namespace}/{endpoint}: {last_max_version}")
 
-        return_tuples.append((endpoint, last_max_version))
+        return_tuples.append((endpoint, last_max_version, None))
 
     return return_tuples
 
@@ -165,6 +192,7 @@ def get_previous_change_versions_with_deltas(
 ) -> None:
     """
     Overload get_previous_change_versions() with a check against the Ed-Fi API to only return endpoints with new data to process.
+    The delta row count of each endpoint is returned in the tuple, so pull operators do not need to count it again.
     """
     return_tuples = get_previous_change_versions(
         tenant_code=tenant_code, api_year=api_year, endpoints=endpoints,
@@ -189,7 +217,7 @@ def get_previous_change_versions_with_deltas(
 
     logging.info(f"Tuples: {return_tuples}")
 
-    for endpoint, last_max_version in return_tuples:
+    for endpoint, last_max_version, _ in return_tuples:
 
         # If a subset of endpoints have been selected, only get CV counts for these.
         if config_endpoints and endpoint not in config_endpoints:
@@ -214,7 +242,7 @@ def get_previous_change_versions_with_deltas(
                 continue
 
             logging.info(f"    {namespace}/{endpoint}: {delta_record_count} new records")
-            delta_endpoints.append((endpoint, last_max_version))
+            delta_endpoints.append((endpoint, last_max_version, delta_record_count))
 
         except Exception as e:
             print(f"Caught exception: {type(e).__name__} - {e}")
@@ -251,10 +279,13 @@ def update_change_versions(
         get_deletes: bool,
         get_key_changes: bool,
         has_key_changes: bool = False,
+        api_years: Optional[List[int]] = None,
 
         **kwargs
 ):
     """
+    If `api_years` is passed (multi-year extraction), the change version of each endpoint is updated in every one of those years.
+    The shared pull covered the change-version window of every year, including years that received no records.
 
     :return:
     """
@@ -293,9 +324,9 @@ def update_change_versions(
             row_sets.append({"get_deletes": False, "get_key_changes": True})
 
     for row_set in row_sets:
-        for endpoint in endpoints:
+        for endpoint, endpoint_year in ((endpoint, year) for year in (api_years or [api_year]) for endpoint in endpoints):
             row = [
-                tenant_code, api_year, endpoint,
+                tenant_code, endpoint_year, endpoint,
                 kwargs["ds"], kwargs["ts"],
                 edfi_change_version, True,
                 row_set["get_deletes"],
@@ -0,0 +1,33 @@
+import logging
+
+from typing import List, Optional, Tuple
+
+from airflow.exceptions import AirflowSkipException
+from airflow.models import Variable
+
+
+def update_content_hashes(
+        content_hash_variable: str,
+        endpoint_tuples: Optional[List[Optional[Tuple[str, str, Optional[str]]]]],
+        **kwargs
+):
+    """
+    Save the content hash of each endpoint that was landed and loaded, so unchanged endpoints are skipped next run.
+
+    :return:
+    """
+    # Default run-types pull one XCom per task, including `None` for skipped tasks.
+    content_hashes = {
+        endpoint_tuple[0]: endpoint_tuple[2]
+        for endpoint_tuple in (endpoint_tuples or [])
+        if endpoint_tuple and len(endpoint_tuple) > 2 and endpoint_tuple[2]
+    }
+
+    if not content_hashes:
+        raise AirflowSkipException("There are no new content hashes to update for any endpoints.")
+
+    saved_hashes = Variable.get(content_hash_variable, default_var={}, deserialize_json=True)
+    saved_hashes.update(content_hashes)
+    Variable.set(content_hash_variable, saved_hashes, serialize_json=True)
+
+    logging.info(f"Updated content hashes for {len(content_hashes)} endpoints in `{content_hash_variable}`.")
@@ -2,9 +2,8 @@ import logging
 
 from typing import List, Union
 
-from airflow.providers.databricks.hooks.databricks_sql import DatabricksSqlHook
-
 from tn_edu_airflow.callables import airflow_util
+from tn_edu_airflow.util.databricks_pool import get_databricks_pool
 
 
 def insert_into_databricks(
@@ -33,8 +32,7 @@ def insert_into_databricks(
         logging_string += f"   {idx}: {value}\n"
     logging.info(logging_string)
 
-    databricks_hook = DatabricksSqlHook(databricks_conn_id=databricks_conn_id)
-    databricks_hook.insert_rows(
+    get_databricks_pool(databricks_conn_id).insert_rows(
         table=f"{database}.{schema}.{table_name}",
         rows=values,
         target_fields=columns,
@@ -0,0 +1,63 @@
+import logging
+import time
+
+from typing import Dict, Optional
+
+from airflow.models import Variable
+
+from edu_edfi_airflow.providers.edfi.hooks.edfi import EdFiHook
+
+
+def get_edfi_version_variable(edfi_conn_id: str) -> str:
+    return f"edfi_versions__{edfi_conn_id}"
+
+
+def get_edfi_versions(
+        edfi_conn_id: str,
+        use_edfi_token_cache: bool = False,
+        cache_ttl_hours: Optional[float] = 24,
+        **kwargs
+) -> Dict[str, str]:
+    """
+    Resolve the ODS and data model versions of an Ed-Fi connection once per run, for every load task to pull via XCom.
+
+    Versions are cached per connection in an Airflow variable for `cache_ttl_hours`.
+    If the API cannot be reached, a stale cached value is used instead of failing the run.
+
+    :return:
+    """
+    version_variable = get_edfi_version_variable(edfi_conn_id)
+    cached = Variable.get(version_variable, default_var={}, deserialize_json=True)
+
+    if cached and cache_ttl_hours is not None and time.time() - cached['cached_at'] < cache_ttl_hours * 3600:
+        logging.info(f"Using cached Ed-Fi versions from `{version_variable}`.")
+        versions = cached['versions']
+
+    else:
+        try:
+            edfi_conn = EdFiHook(edfi_conn_id=edfi_conn_id, use_token_cache=use_edfi_token_cache).get_conn()
+
+            if edfi_conn.is_edfi2():
+                versions = {'ods_version': 'ED-FI2', 'data_model_version': 'ED-FI2'}
+            else:
+                versions = {
+                    'ods_version': edfi_conn.get_ods_version(),
+                    'data_model_version': edfi_conn.get_data_model_version(),
+                }
+
+            Variable.set(version_variable, {'versions': versions, 'cached_at': time.time()}, serialize_json=True)
+
+        except Exception as err:
+            if not cached:
+                raise err
+
+            logging.warning(f"Unable to retrieve Ed-Fi versions; using the versions cached in `{version_variable}`: {err}")
+            versions = cached['versions']
+
+    logging.info(f"ODS version is `{versions['ods_version']}`; data model version is `{versions['data_model_version']}`.")
+
+    # Push each version separately for templating into the load operators.
+    for key, value in versions.items():
+        kwargs['ti'].xcom_push(key=key, value=value)
+
+    return versions
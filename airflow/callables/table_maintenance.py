@@ -0,0 +1,147 @@
+import logging
+import time
+
+from typing import List, Optional, Tuple
+
+from airflow.exceptions import AirflowSkipException
+from airflow.models import Variable
+
+from tn_edu_airflow.callables import airflow_util
+from tn_edu_airflow.util.databricks_pool import get_databricks_pool
+
+
+TABLE_MAINTENANCE_VARIABLE = "databricks_table_maintenance"
+
+
+def maintain_raw_tables(
+        databricks_conn_id: str,
+        loaded_tables: Optional[List[Optional[List[str]]]],
+
+        *,
+        min_new_files: int = 500,
+        min_new_mb: float = 1024,
+        min_hours_between_optimize: float = 24,
+        vacuum_retention_hours: Optional[float] = 168,
+        min_hours_between_vacuum: float = 168,
+        max_minutes: float = 30,
+        cluster_columns: Tuple[str, ...] = ("tenant_code", "api_year", "name"),
+
+        **kwargs
+):
+    """
+    OPTIMIZE and VACUUM the raw tables loaded by this run once enough small files have been appended to them.
+
+    The files and bytes of each table at its last OPTIMIZE are saved in an Airflow variable shared by every DAG.
+    A table is optimized once it has grown by `min_new_files` files or `min_new_mb` since then (and not within the last
+    `min_hours_between_optimize`). Tables without liquid clustering are Z-ordered on `cluster_columns`.
+    Optimized tables are vacuumed at most every `min_hours_between_vacuum`, retaining `vacuum_retention_hours` of history.
+
+    Tables with the most new files go first. No new statement is started after `max_minutes`,
+    and each statement runs with a `STATEMENT_TIMEOUT` of the time left in the budget (a Databricks SQL warehouse setting),
+    so maintenance stays within its budget and never delays the next ingestion.
+    A statement stopped at the end of the budget ends maintenance; its table is retried on the next run.
+
+    :return:
+    """
+    # Each load task pushes a list of the tables it loaded (or nothing, if skipped).
+    tables = sorted({table for task_tables in (loaded_tables or []) if task_tables for table in task_tables})
+    if not tables:
+        raise AirflowSkipException("No raw tables were loaded in this run.")
+
+    database, schema = airflow_util.get_params_from_conn(databricks_conn_id, "extra__databricks__database")
+    pool = get_databricks_pool(databricks_conn_id)
+
+    start = time.monotonic()
+    deadline = start + max_minutes * 60
+    now = time.time()
+
+    saved_state = Variable.get(TABLE_MAINTENANCE_VARIABLE, default_var={}, deserialize_json=True)
+
+    ### Find the tables that have grown past either threshold since their last OPTIMIZE.
+    candidates = []
+    for table in tables:
+        full_table = f"{database}.{schema}.{table}"
+        detail = get_table_detail(pool, full_table)
+        state = saved_state.get(full_table, {'num_files': 0, 'size_bytes': 0, 'optimized_at': 0, 'vacuumed_at': 0})
+
+        new_files = detail['numFiles'] - state['num_files']
+        new_mb = (detail['sizeInBytes'] - state['size_bytes']) / 1024 ** 2
+        logging.info(f"    {full_table}: {detail['numFiles']} files ({new_files} new); {new_mb:.0f} MB new.")
+
+        if now - state['optimized_at'] < min_hours_between_optimize * 3600:
+            continue
+
+        if new_files >= min_new_files or new_mb >= min_new_mb:
+            candidates.append((new_files, full_table, detail, state))
+
+    if not candidates:
+        raise AirflowSkipException("No raw tables have crossed their maintenance thresholds.")
+
+    ### Optimize (and vacuum) the tables with the most new files first, until the budget is spent.
+    num_optimized = 0
+    for _, full_table, detail, state in sorted(candidates, key=lambda candidate: candidate[0], reverse=True):
+        if time.monotonic() > deadline:
+            logging.info(f"Maintenance budget of {max_minutes} minutes spent; remaining tables wait for the next run.")
+            break
+
+        # Liquid-clustered tables cluster on their own keys during OPTIMIZE; others are Z-ordered.
+        if detail.get('clusteringColumns'):
+            qry_optimize = f"OPTIMIZE {full_table}"
+        else:
+            qry_optimize = f"OPTIMIZE {full_table} ZORDER BY ({', '.join(cluster_columns)})"
+
+        logging.info(f"Optimizing `{full_table}`.")
+        if not run_within_budget(pool, qry_optimize, deadline):
+            break
+        num_optimized += 1
+
+        state['optimized_at'] = time.time()
+
+        if vacuum_retention_hours is not None and time.time() - state['vacuumed_at'] >= min_hours_between_vacuum * 3600:
+            if time.monotonic() <= deadline:
+                logging.info(f"Vacuuming `{full_table}`.")
+                if run_within_budget(pool, f"VACUUM {full_table} RETAIN {int(vacuum_retention_hours)} HOURS", deadline):
+                    state['vacuumed_at'] = time.time()
+
+        # Thresholds are measured from the table's compacted size.
+        optimized_detail = get_table_detail(pool, full_table)
+        state['num_files'] = optimized_detail['numFiles']
+        state['size_bytes'] = optimized_detail['sizeInBytes']
+
+        # Re-read the variable before saving, as other DAGs maintain their own tables at the same time.
+        saved_state = Variable.get(TABLE_MAINTENANCE_VARIABLE, default_var={}, deserialize_json=True)
+        saved_state[full_table] = state
+        Variable.set(TABLE_MAINTENANCE_VARIABLE, saved_state, serialize_json=True)
+
+    logging.info(f"Optimized {num_optimized} of {len(candidates)} raw tables in {(time.monotonic() - start) / 60:.1f} minutes.")
+
+
+def run_within_budget(pool, sql: str, deadline: float) -> bool:
+    """
+    Run a statement with a statement timeout of the seconds left until the deadline, resetting the timeout after.
+    Return False if the statement was stopped by the end of the budget.
+    """
+    timeout_seconds = max(int(deadline - time.monotonic()), 1)
+
+    try:
+        # A failed statement discards its pooled connection, so the timeout never outlives this call.
+        pool.run([f"SET STATEMENT_TIMEOUT = {timeout_seconds}", sql, "RESET STATEMENT_TIMEOUT"])
+    except Exception as err:
+        if time.monotonic() < deadline:
+            raise err
+
+        logging.warning(f"Maintenance budget spent mid-statement; remaining tables wait for the next run: {err}")
+        return False
+
+    return True
+
+
+def get_table_detail(pool, table: str) -> dict:
+    """
+    Return the Delta table detail (e.g., `numFiles`, `sizeInBytes`, `clusteringColumns`) of a table.
+    """
+    with pool.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DESCRIBE DETAIL {table}")
+            columns = [column[0] for column in cursor.description]
+            return dict(zip(columns, cursor.fetchone()))
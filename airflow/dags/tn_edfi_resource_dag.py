@@ -12,7 +12,7 @@ from airflow.utils.task_group import TaskGroup
 from ea_airflow_util import slack_callbacks, update_variable
 from edfi_api_client import camel_to_snake
 
-from tn_edu_airflow.callables import change_version
+from tn_edu_airflow.callables import change_version, content_hash, edfi_version, table_maintenance
 from ea_airflow_util import EACustomDAG
 from tn_edu_airflow.callables import airflow_util
 from tn_edu_airflow.providers.edfi.transfers.edfi_to_adls import EdFiToADLSOperator, BulkEdFiToADLSOperator
@@ -26,9 +26,10 @@ class TNEdFiResourceDAG:
 
     DAG Structure:
         (Ed-Fi3 Change Version Window) >> [Ed-Fi Resources/Descriptors (Deletes/KeyChanges)] >> (increment_dbt_variable) >> dag_state_sentinel
+        [Ed-Fi Resources/Descriptors (Deletes/KeyChanges)] >> (optimize_raw_tables)
 
     "Ed-Fi3 Change Version Window" TaskGroup:
-        get_latest_edfi_change_version >> reset_previous_change_versions_in_databricks
+        [get_latest_edfi_change_version, get_edfi_versions] >> reset_previous_change_versions_in_databricks
 
     "Ed-Fi Resources/Descriptors (Deletes/KeyChanges)" TaskGroup:
         (get_cv_operator) >> [Ed-Fi Endpoint Task] >> copy_all_endpoints_into_databricks >> (update_change_versions_in_databricks)
@@ -41,8 +42,14 @@ class TNEdFiResourceDAG:
         "Bulk" TaskGroup
         - Loop over each endpoint in a single task.
 
-    All task groups receive a list of (endpoint, last_change_version) tuples as input.
-    All that successfully retrieve records are passed onward as a (endpoint, filename) tuples to the ADLSToDatabricks and UpdateDatbricksCV operators.
+    All task groups receive a list of (endpoint, last_change_version, expected_row_count) tuples as input.
+    All that successfully retrieve records are passed onward as a (endpoint, filename, content_hash) tuples to the ADLSToDatabricks and UpdateDatbricksCV operators.
+
+    If multiyear_api_years is set (for a multiyear ODS), each endpoint is pulled once for all of those years.
+    Records are landed per year by their `schoolYear` and each year is copied separately; change versions advance in every year at once.
+
+    If skip_unchanged_descriptors is True, descriptors whose content hash is unchanged since their last load are not uploaded or loaded.
+    Hashes are saved per tenant-year by an `update_content_hashes` task after the load succeeds.
     """
     DEFAULT_CONFIGS = {
         'namespace': 'ed-fi',
@@ -50,10 +57,26 @@ class TNEdFiResourceDAG:
         'change_version_step_size': 50000,
         'num_retries': 5,
         'query_parameters': {},
-        'offset': 0
+        'offset': 0,
+        'max_concurrent_requests': 1,
     }
 
     newest_edfi_cv_task_id = "get_latest_edfi_change_version"  # Original name for historic run compatibility
+    edfi_versions_task_id = "get_edfi_versions"
+
+    @property
+    def page_size_variable(self) -> str:
+        """
+        Learned page sizes are saved in one JSON variable per tenant and year, keyed by endpoint.
+        """
+        return f"edfi_page_sizes__{self.tenant_code}__{self.api_year}"
+
+    @property
+    def descriptor_hash_variable(self) -> str:
+        """
+        Descriptor content hashes are saved per tenant and year.
+        """
+        return f"edfi_descriptor_hashes__{self.tenant_code}__{self.api_year}"
 
     def __init__(self,
                  *,
@@ -69,8 +92,22 @@ class TNEdFiResourceDAG:
 
                  pool: str,
                  tmp_dir: str,
+                 stream_to_adls: bool = False,
+                 compression: Optional[str] = None,
+                 serializer: str = 'json',
+                 landing_format: str = 'jsonl',
+                 checkpoint_windows: bool = False,
+                 max_part_mb: Optional[float] = None,
+                 adaptive_page_size: Optional[dict] = None,
+                 target_rows_per_window: Optional[int] = None,
+                 deduplicate_records: bool = False,
+                 skip_unchanged_descriptors: bool = False,
+                 spill_space: Optional[dict] = None,
+                 max_concurrent_endpoints: int = 1,
+                 max_in_flight_requests: Optional[int] = None,
 
                  multiyear: bool = False,
+                 multiyear_api_years: Optional[List[int]] = None,
                  schedule_interval_full_refresh: Optional[str] = None,
 
                  use_change_version: bool = True,
@@ -84,6 +121,12 @@ class TNEdFiResourceDAG:
                  key_changes_table: str = '_key_changes',
                  descriptors_table: str = '_descriptors',
                  get_deletes_cv_with_deltas: bool = False,
+                 batch_load: bool = False,
+                 max_concurrent_loads: int = 1,
+                 upsert: bool = False,
+                 apply_deletes: bool = False,
+                 edfi_version_cache_hours: Optional[float] = 24,
+                 table_maintenance: Optional[dict] = None,
                  dbt_incrementer_var: Optional[str] = None,
 
                  **kwargs
@@ -104,13 +147,34 @@ class TNEdFiResourceDAG:
 
         self.pool = pool
         self.tmp_dir = tmp_dir
+        self.stream_to_adls = stream_to_adls  # Append pages directly to ADLS instead of uploading a temp file.
+        self.compression = compression  # Optionally land gzip- or zstd-compressed JSONL.
+        self.serializer = serializer  # JSONL serializer backend: `json`, `orjson`, or `msgspec`.
+        self.landing_format = landing_format  # Land resources as `jsonl` or `parquet`.
+        self.checkpoint_windows = checkpoint_windows  # Land and checkpoint each change-version window so retries resume.
+        self.max_part_mb = max_part_mb  # Roll landed files into numbered parts of about this size for parallel COPY INTO.
+        self.adaptive_page_size = adaptive_page_size  # Page-size bounds for tuning page sizes between change-version windows.
+        self.target_rows_per_window = target_rows_per_window  # Plan change-version windows by row count instead of a fixed step.
+        self.deduplicate_records = deduplicate_records  # Drop records returned more than once while paging.
+        self.skip_unchanged_descriptors = skip_unchanged_descriptors  # Skip uploading and loading descriptors whose content hash is unchanged.
+        self.spill_space = spill_space  # Quota and reservation size for temporary files in `tmp_dir`, shared across the worker.
+        self.max_concurrent_endpoints = max_concurrent_endpoints  # Endpoints pulled at once in bulk run-type.
+        self.max_in_flight_requests = max_in_flight_requests  # Window requests in flight across concurrent endpoints in bulk run-type.
         self.multiyear = multiyear
+        self.multiyear_api_years = multiyear_api_years  # Pull a multiyear ODS once for all these years, routing records by `schoolYear`.
         self.schedule_interval_full_refresh = schedule_interval_full_refresh  # Force full-refresh on a scheduled cadence
 
         self.change_version_table = change_version_table
         self.deletes_table = deletes_table
         self.key_changes_table = key_changes_table
         self.descriptors_table = descriptors_table
+        self.batch_load = batch_load  # Copy the landed files of a task group in as few COPY INTO statements as possible.
+        self.max_concurrent_loads = max_concurrent_loads  # Endpoints copied into Databricks at once, each over its own connection.
+        self.upsert = upsert  # MERGE loads into raw tables, keeping only the newest version of each record.
+        self.apply_deletes = apply_deletes  # Remove newly landed deletes from their resource tables at load time.
+        self.edfi_version_cache_hours = edfi_version_cache_hours  # Reuse the ODS and data model versions of a connection for this long.
+        self.table_maintenance = table_maintenance  # Thresholds and budget for optimizing and vacuuming the raw tables after loading.
+        self.copy_task_ids: List[str] = []  # Filled as load operators are built, for post-load maintenance.
 
         self.dbt_incrementer_var = dbt_incrementer_var
 
@@ -159,7 +223,8 @@ class TNEdFiResourceDAG:
 
         ### For a multiyear ODS, we need to specify school year as an additional query parameter.
         # (This is an exception-case; we push all tenants to build year-specific ODSes when possible.)
-        if self.multiyear:
+        # Multi-year extraction pulls every year at once and routes records by their `schoolYear` instead.
+        if self.multiyear and not self.multiyear_api_years:
             configs['query_parameters']['schoolYear'] = self.api_year
 
         logging.info(f"Configurations: {configs}")
@@ -250,8 +315,10 @@ class TNEdFiResourceDAG:
             raise ValueError(f"Run type {self.run_type} is not one of the expected values: [default, dynamic, bulk].")
 
         # Set parent directory and create subfolders for each task group.
+        # In multi-year extraction, pull operators land each year's records under its own year.
         adls_parent_directory = os.path.join(
-            self.tenant_code, str(self.api_year), "{{ ds_nodash }}", "{{ ts_nodash }}"
+            self.tenant_code, "{school_year}" if self.multiyear_api_years else str(self.api_year),
+            "{{ ds_nodash }}", "{{ ts_nodash }}"
         )
 
         # Resources
@@ -267,7 +334,8 @@ class TNEdFiResourceDAG:
             group_id="Ed-Fi_Descriptors",
             endpoints=sorted(list(self.descriptors)),
             table=self.descriptors_table,
-            adls_destination_dir=os.path.join(adls_parent_directory, 'descriptors')
+            adls_destination_dir=os.path.join(adls_parent_directory, 'descriptors'),
+            content_hash_variable=self.descriptor_hash_variable if self.skip_unchanged_descriptors else None
         )
 
         # Resource Deletes
@@ -292,6 +360,21 @@ class TNEdFiResourceDAG:
         else:
             resource_key_changes_task_group = None
 
+        # Deletes are applied to the resource tables once the resources are loaded, so both never write to a table at once.
+        # The gate succeeds however the resource loads end, so the deletes load regardless.
+        if self.apply_deletes and resources_task_group and resource_deletes_task_group:
+            resource_loads_done = PythonOperator(
+                task_id='resource_loads_done',
+                python_callable=lambda **context: None,
+                trigger_rule='all_done',
+                dag=self.dag
+            )
+            airflow_util.chain_tasks(
+                self.get_copy_operators(resources_task_group),
+                resource_loads_done,
+                self.get_copy_operators(resource_deletes_task_group)
+            )
+
         ### Chain Ed-Fi task groups into the DAG between CV operators and Airflow state operators.
         edfi_task_groups = [
             resources_task_group,
@@ -329,9 +412,36 @@ class TNEdFiResourceDAG:
             dag=self.dag
         )
 
+        # Optimize and vacuum the raw tables once loading is done, in its own pool to not compete with ingestion.
+        # A dedicated Airflow `pool` is required; a separate `databricks_conn_id` (e.g., a maintenance warehouse) may be configured.
+        if self.table_maintenance is not None and not self.table_maintenance.get('pool'):
+            logging.warning("Table maintenance requires a dedicated `pool` in its configs; skipping maintenance.")
+
+        if self.table_maintenance is not None and self.table_maintenance.get('pool') and self.copy_task_ids:
+            maintenance_configs = dict(self.table_maintenance)
+            maintenance_conn_id = maintenance_configs.pop('databricks_conn_id', self.databricks_conn_id)
+            maintenance_pool = maintenance_configs.pop('pool')
+
+            maintenance_operator = PythonOperator(
+                task_id='optimize_raw_tables',
+                python_callable=table_maintenance.maintain_raw_tables,
+                op_kwargs={
+                    'databricks_conn_id': maintenance_conn_id,
+                    'loaded_tables': airflow_util.xcom_pull_template(self.copy_task_ids, key='loaded_tables'),
+                    **maintenance_configs,
+                },
+                pool=maintenance_pool,
+                priority_weight=1,
+                trigger_rule='all_done',
+                dag=self.dag
+            )
+        else:
+            maintenance_operator = None
+
         # Chain tasks and taskgroups into the DAG; chain sentinel after all task groups.
         airflow_util.chain_tasks(cv_task_group, edfi_task_groups, dbt_var_increment_operator)
         airflow_util.chain_tasks(edfi_task_groups, dag_state_sentinel)
+        airflow_util.chain_tasks(edfi_task_groups, maintenance_operator)
 
     ### Internal methods that should probably not be called directly.
     def build_change_version_task_group(self) -> TaskGroup:
@@ -365,12 +475,25 @@ class TNEdFiResourceDAG:
                     'api_year': self.api_year,
                     'databricks_conn_id': self.databricks_conn_id,
                     'change_version_table': self.change_version_table,
+                    'api_years': self.multiyear_api_years,
                 },
                 trigger_rule='all_success',
                 dag=self.dag
             )
 
-            get_newest_edfi_cv >> reset_databricks_cvs
+            # Resolve the ODS and data model versions once for every load task in the run.
+            get_edfi_versions = PythonOperator(
+                task_id=self.edfi_versions_task_id,
+                python_callable=edfi_version.get_edfi_versions,
+                op_kwargs={
+                    'edfi_conn_id': self.edfi_conn_id,
+                    'use_edfi_token_cache': self.use_edfi_token_cache,
+                    'cache_ttl_hours': self.edfi_version_cache_hours,
+                },
+                dag=self.dag
+            )
+
+            [get_newest_edfi_cv, get_edfi_versions] >> reset_databricks_cvs
 
         return cv_task_group
 
@@ -400,6 +523,7 @@ class TNEdFiResourceDAG:
                 'edfi_conn_id': self.edfi_conn_id,
                 'use_edfi_token_cache': self.use_edfi_token_cache,
                 'max_change_version': airflow_util.xcom_pull_template(self.newest_edfi_cv_task_id),
+                'api_years': self.multiyear_api_years,
             },
             trigger_rule='none_failed',  # Run regardless of whether the CV table was reset.
             dag=self.dag
@@ -429,6 +553,7 @@ class TNEdFiResourceDAG:
                                              endpoints: List[str],
                                              get_deletes: bool,
                                              get_key_changes: bool,
+                                             api_years: Optional[List[int]] = None,
                                              **kwargs
                                              ) -> PythonOperator:
         """
@@ -443,6 +568,7 @@ class TNEdFiResourceDAG:
                 'api_year': self.api_year,
                 'databricks_conn_id': self.databricks_conn_id,
                 'change_version_table': self.change_version_table,
+                'api_years': api_years,
 
                 'edfi_change_version': airflow_util.xcom_pull_template(self.newest_edfi_cv_task_id),
                 'endpoints': endpoints,
@@ -455,23 +581,126 @@ class TNEdFiResourceDAG:
             **kwargs
         )
 
+    def build_content_hash_update_operator(self, task_id: str, content_hash_variable: str, pull_operators) -> PythonOperator:
+        """
+
+        :return:
+        """
+        return PythonOperator(
+            task_id=task_id,
+            python_callable=content_hash.update_content_hashes,
+            op_kwargs={
+                'content_hash_variable': content_hash_variable,
+                'endpoint_tuples': airflow_util.xcom_pull_template(pull_operators),
+            },
+            trigger_rule='all_success',
+            dag=self.dag
+        )
+
+    def xcom_pull_edfi_version(self, key: str) -> Optional[str]:
+        """
+        Pull a version resolved in the change-version task group; without one, load operators retrieve it from the API.
+        """
+        if not self.use_change_version:
+            return None
+        return airflow_util.xcom_pull_template(self.edfi_versions_task_id, key=key)
+
+    def build_load_operators(self,
+                             pull_operators,
+                             *,
+                             table: Optional[str],
+                             get_deletes: bool,
+                             get_key_changes: bool,
+                             copy_trigger_rule: str,
+                             update_cv_task_id: str
+                             ) -> List[Tuple[BulkADLSToDatabricksOperator, Optional[PythonOperator]]]:
+        """
+        Build the operator copying the landed endpoints into Databricks, and the change-version update that follows it.
+        In multi-year extraction, build one copy per year from the pull operators' per-year XComs.
+        These share one change-version update, which advances every year for each endpoint the shared pull completed
+        (a year that received no records must still advance, or the next pull would restart from it).
+
+        :return:
+        """
+        load_operators = []
+
+        ### UPDATE DATABRICKS CHANGE VERSIONS
+        if self.use_change_version:
+            update_cv_operator = self.build_change_version_update_operator(
+                task_id=update_cv_task_id,
+                endpoints=self.xcom_pull_template_map_idx(pull_operators, 0),
+                get_deletes=get_deletes,
+                get_key_changes=get_key_changes,
+                api_years=self.multiyear_api_years,
+                # Copies of years without records skip.
+                trigger_rule='none_failed' if self.multiyear_api_years else 'all_success'
+            )
+        else:
+            update_cv_operator = None
+
+        for school_year in (self.multiyear_api_years or [None]):
+            if school_year:
+                task_id_suffix = f"__{school_year}"
+                xcom_key = EdFiToADLSOperator.get_school_year_xcom_key(school_year)
+            else:
+                task_id_suffix = ""
+                xcom_key = 'return_value'
+
+            copy_adls_to_databricks = BulkADLSToDatabricksOperator(
+                task_id=f"copy_all_endpoints_into_databricks{task_id_suffix}",
+                tenant_code=self.tenant_code,
+                api_year=school_year or self.api_year,
+
+                resource=self.xcom_pull_template_map_idx(pull_operators, 0, key=xcom_key),
+                table_name=table or self.xcom_pull_template_map_idx(pull_operators, 0, key=xcom_key),
+                edfi_conn_id=self.edfi_conn_id,
+                use_edfi_token_cache=self.use_edfi_token_cache,
+                databricks_conn_id=self.databricks_conn_id,
+                adls_destination_key=self.xcom_pull_template_map_idx(pull_operators, 1, key=xcom_key),
+                adls_storage_account=self.adls_storage_account,
+                adls_container=self.adls_container,
+                batch_load=self.batch_load,
+                max_concurrent_loads=self.max_concurrent_loads,
+                upsert=self.upsert,
+                apply_deletes=self.apply_deletes and get_deletes,
+                ods_version=self.xcom_pull_edfi_version('ods_version'),
+                data_model_version=self.xcom_pull_edfi_version('data_model_version'),
+                trigger_rule=copy_trigger_rule,
+                dag=self.dag
+            )
+
+            load_operators.append((copy_adls_to_databricks, update_cv_operator))
+            self.copy_task_ids.append(copy_adls_to_databricks.task_id)
+
+        return load_operators
+
+    def get_copy_operators(self, task_group: TaskGroup) -> List[BulkADLSToDatabricksOperator]:
+        """
+        Return the copy operators built in a task group.
+        """
+        return [
+            self.dag.get_task(task_id) for task_id in self.copy_task_ids
+            if task_id.startswith(f"{task_group.group_id}.")
+        ]
+
     # Polymorphic Ed-Fi TaskGroups
     @staticmethod
-    def xcom_pull_template_map_idx(task_ids, idx: int):
+    def xcom_pull_template_map_idx(task_ids, idx: int, key: str = 'return_value'):
         """
         Many XComs in this DAG are lists of tuples. This overloads xcom_pull_template to retrieve a list of items at a given index.
         """
         return airflow_util.xcom_pull_template(
-            task_ids, suffix=f" | map(attribute={idx}) | list"
+            task_ids, key=key, suffix=f" | map(attribute={idx}) | list"
         )
 
     @staticmethod
-    def xcom_pull_template_get_key(task_ids, key: str):
+    def xcom_pull_template_get_key(task_ids, key: str, idx: int = 1):
         """
-        Many XComs in this DAG are lists of tuples. This converts the XCom to a dictionary and returns the value for a given key.
+        Many XComs in this DAG are lists of tuples. This returns the item at a given index of the tuple whose first item is `key`
+        (None if there is no such tuple).
         """
         return airflow_util.xcom_pull_template(
-            task_ids, prefix="dict(", suffix=f").get('{key}')"
+            task_ids, prefix="((", suffix=f" or []) | selectattr(0, 'equalto', '{key}') | map(attribute={idx}) | list + [None]) | first"
         )
 
     def build_default_edfi_to_databricks_task_group(self,
@@ -484,6 +713,7 @@ class TNEdFiResourceDAG:
                                                     get_deletes: bool = False,
                                                     get_key_changes: bool = False,
                                                     get_with_deltas: bool = True,
+                                                    content_hash_variable: Optional[str] = None,
                                                     **kwargs
                                                     ) -> TaskGroup:
         """
@@ -536,11 +766,25 @@ class TNEdFiResourceDAG:
                     adls_conn_id=self.adls_conn_id,
                     adls_destination_dir=adls_destination_dir,
                     adls_destination_filename=f"{endpoint}.jsonl",
+                    stream_to_adls=self.stream_to_adls,
+                    compression=self.compression,
+                    serializer=self.serializer,
+                    landing_format=self.landing_format,
+                    checkpoint_windows=self.checkpoint_windows,
+                    max_part_mb=self.max_part_mb,
+                    spill_space=self.spill_space,
+                    school_years=self.multiyear_api_years,
+                    adaptive_page_size=self.adaptive_page_size,
+                    page_size_variable=self.page_size_variable,
+                    target_rows_per_window=self.target_rows_per_window,
+                    deduplicate_records=self.deduplicate_records,
+                    content_hash_variable=content_hash_variable,
 
                     get_deletes=get_deletes,
                     get_key_changes=get_key_changes,
                     use_edfi_token_cache=self.use_edfi_token_cache,
                     min_change_version=self.xcom_pull_template_get_key(get_cv_operator, endpoint) if get_cv_operator else None,
+                    expected_row_count=self.xcom_pull_template_get_key(get_cv_operator, endpoint, idx=2) if get_cv_operator else None,
                     max_change_version=airflow_util.xcom_pull_template(self.newest_edfi_cv_task_id),
                     reverse_paging=self.get_deletes_cv_with_deltas if get_deletes else True,
 
@@ -557,37 +801,30 @@ class TNEdFiResourceDAG:
 
                 pull_operators_list.append(pull_edfi_to_adls)
 
-            copy_adls_to_databricks = BulkADLSToDatabricksOperator(
-                task_id=f"copy_all_endpoints_into_databricks",
-                tenant_code=self.tenant_code,
-                api_year=self.api_year,
-
-                resource=self.xcom_pull_template_map_idx(pull_operators_list, 0),
-                table_name=table or self.xcom_pull_template_map_idx(pull_operators_list, 0),
-                edfi_conn_id=self.edfi_conn_id,
-                use_edfi_token_cache=self.use_edfi_token_cache,
-                databricks_conn_id=self.databricks_conn_id,
-                adls_destination_key=self.xcom_pull_template_map_idx(pull_operators_list, 1),
-                adls_storage_account=self.adls_storage_account,
-                adls_container=self.adls_container,
-                trigger_rule='all_done',
-                dag=self.dag
+            ### COPY FROM ADLS TO DATABRICKS AND UPDATE CHANGE VERSIONS (per school year in multi-year extraction)
+            load_operators = self.build_load_operators(
+                pull_operators_list,
+                table=table,
+                get_deletes=get_deletes,
+                get_key_changes=get_key_changes,
+                copy_trigger_rule='all_done',
+                update_cv_task_id="update_change_versions_in_databricls"
             )
 
-            ### UPDATE SNOWFLAKE CHANGE VERSIONS
-            if self.use_change_version:
-                update_cv_operator = self.build_change_version_update_operator(
-                    task_id=f"update_change_versions_in_databricls",
-                    endpoints=self.xcom_pull_template_map_idx(pull_operators_list, 0),
-                    get_deletes=get_deletes,
-                    get_key_changes=get_key_changes,
-                    trigger_rule='all_success'
+            ### SAVE CONTENT HASHES OF LOADED ENDPOINTS
+            if content_hash_variable:
+                update_hash_operator = self.build_content_hash_update_operator(
+                    task_id="update_content_hashes",
+                    content_hash_variable=content_hash_variable,
+                    pull_operators=pull_operators_list
                 )
             else:
-                update_cv_operator = None
+                update_hash_operator = None
 
             ### Chain tasks into final task-group
-            airflow_util.chain_tasks(get_cv_operator, pull_operators_list, copy_adls_to_databricks, update_cv_operator)
+            airflow_util.chain_tasks(get_cv_operator, pull_operators_list)
+            for copy_adls_to_databricks, update_cv_operator in load_operators:
+                airflow_util.chain_tasks(pull_operators_list, copy_adls_to_databricks, [update_cv_operator, update_hash_operator])
 
         return default_task_group
 
@@ -601,6 +838,7 @@ class TNEdFiResourceDAG:
                                                     get_deletes: bool = False,
                                                     get_key_changes: bool = False,
                                                     get_with_deltas: bool = True,
+                                                    content_hash_variable: Optional[str] = None,
 
                                                     **kwargs
                                                     ):
@@ -640,6 +878,7 @@ class TNEdFiResourceDAG:
                 kwargs_dicts = get_cv_operator.output.map(lambda endpoint__cv: {
                     'resource': endpoint__cv[0],
                     'min_change_version': endpoint__cv[1],
+                    'expected_row_count': endpoint__cv[2],
                     'adls_destination_filename': f"{endpoint__cv[0]}.json",
                     **self.endpoint_configs[endpoint__cv[0]],
                 })
@@ -664,6 +903,19 @@ class TNEdFiResourceDAG:
                 tmp_dir=self.tmp_dir,
                 adls_conn_id=self.adls_conn_id,
                 adls_destination_dir=adls_destination_dir,
+                stream_to_adls=self.stream_to_adls,
+                compression=self.compression,
+                serializer=self.serializer,
+                landing_format=self.landing_format,
+                checkpoint_windows=self.checkpoint_windows,
+                max_part_mb=self.max_part_mb,
+                spill_space=self.spill_space,
+                school_years=self.multiyear_api_years,
+                adaptive_page_size=self.adaptive_page_size,
+                page_size_variable=self.page_size_variable,
+                target_rows_per_window=self.target_rows_per_window,
+                deduplicate_records=self.deduplicate_records,
+                content_hash_variable=content_hash_variable,
 
                     get_deletes=get_deletes,
                     get_key_changes=get_key_changes,
@@ -682,37 +934,30 @@ class TNEdFiResourceDAG:
                                  .expand_kwargs(kwargs_dicts)
                                  )
 
-            copy_adls_to_databricks = BulkADLSToDatabricksOperator(
-                task_id=f"copy_all_endpoints_into_databricks",
-                tenant_code=self.tenant_code,
-                api_year=self.api_year,
-
-                resource=self.xcom_pull_template_map_idx(pull_edfi_to_adls, 0),
-                table_name=table or self.xcom_pull_template_map_idx(pull_edfi_to_adls, 0),
-                edfi_conn_id=self.edfi_conn_id,
-                use_edfi_token_cache=self.use_edfi_token_cache,
-                databricks_conn_id=self.databricks_conn_id,
-                adls_destination_key=self.xcom_pull_template_map_idx(pull_edfi_to_adls, 1),
-                adls_storage_account=self.adls_storage_account,
-                adls_container=self.adls_container,
-                trigger_rule='all_done',
-                dag=self.dag
+            ### COPY FROM ADLS TO DATABRICKS AND UPDATE CHANGE VERSIONS (per school year in multi-year extraction)
+            load_operators = self.build_load_operators(
+                pull_edfi_to_adls,
+                table=table,
+                get_deletes=get_deletes,
+                get_key_changes=get_key_changes,
+                copy_trigger_rule='all_done',
+                update_cv_task_id="update_change_versions_in_databricks"
             )
 
-            ### UPDATE DATABRICKS CHANGE VERSIONS
-            if self.use_change_version:
-                update_cv_operator = self.build_change_version_update_operator(
-                    task_id=f"update_change_versions_in_databricks",
-                    endpoints=self.xcom_pull_template_map_idx(pull_edfi_to_adls, 0),
-                    get_deletes=get_deletes,
-                    get_key_changes=get_key_changes,
-                    trigger_rule='all_success'
+            ### SAVE CONTENT HASHES OF LOADED ENDPOINTS
+            if content_hash_variable:
+                update_hash_operator = self.build_content_hash_update_operator(
+                    task_id="update_content_hashes",
+                    content_hash_variable=content_hash_variable,
+                    pull_operators=pull_edfi_to_adls
                 )
             else:
-                update_cv_operator = None
+                update_hash_operator = None
 
             ### Chain tasks into final task-group
-            airflow_util.chain_tasks(get_cv_operator, pull_edfi_to_adls, copy_adls_to_databricks, update_cv_operator)
+            airflow_util.chain_tasks(get_cv_operator, pull_edfi_to_adls)
+            for copy_adls_to_databricks, update_cv_operator in load_operators:
+                airflow_util.chain_tasks(pull_edfi_to_adls, copy_adls_to_databricks, [update_cv_operator, update_hash_operator])
 
         return dynamic_task_group
 
@@ -726,6 +971,7 @@ class TNEdFiResourceDAG:
                                                  get_deletes: bool = False,
                                                  get_key_changes: bool = False,
                                                  get_with_deltas: bool = True,
+                                                 content_hash_variable: Optional[str] = None,
                                                  **kwargs
                                                  ):
         """
@@ -764,12 +1010,17 @@ class TNEdFiResourceDAG:
                     self.xcom_pull_template_get_key(get_cv_operator, endpoint)
                     for endpoint in endpoints
                 ]
+                expected_row_counts = [
+                    self.xcom_pull_template_get_key(get_cv_operator, endpoint, idx=2)
+                    for endpoint in endpoints
+                ]
                 enabled_endpoints = self.xcom_pull_template_map_idx(get_cv_operator, 0)
 
             # Otherwise, iterate all endpoints.
             else:
                 get_cv_operator = None
                 min_change_versions = [None] * len(endpoints)
+                expected_row_counts = [None] * len(endpoints)
                 enabled_endpoints = endpoints
 
             # Build a dictionary of lists to pass into bulk operator.
@@ -783,8 +1034,21 @@ class TNEdFiResourceDAG:
                 edfi_conn_id=self.edfi_conn_id,
 
                 tmp_dir=self.tmp_dir,
-                adls_conn_id=self.databricks_conn_id,
+                adls_conn_id=self.adls_conn_id,
                 adls_destination_dir=adls_destination_dir,
+                stream_to_adls=self.stream_to_adls,
+                compression=self.compression,
+                serializer=self.serializer,
+                landing_format=self.landing_format,
+                checkpoint_windows=self.checkpoint_windows,
+                max_part_mb=self.max_part_mb,
+                spill_space=self.spill_space,
+                school_years=self.multiyear_api_years,
+                adaptive_page_size=self.adaptive_page_size,
+                page_size_variable=self.page_size_variable,
+                target_rows_per_window=self.target_rows_per_window,
+                deduplicate_records=self.deduplicate_records,
+                content_hash_variable=content_hash_variable,
 
                 get_deletes=get_deletes,
                 get_key_changes=get_key_changes,
@@ -792,9 +1056,13 @@ class TNEdFiResourceDAG:
                 max_change_version=airflow_util.xcom_pull_template(self.newest_edfi_cv_task_id),
                 reverse_paging=self.get_deletes_cv_with_deltas if get_deletes else True,
 
+                max_concurrent_endpoints=self.max_concurrent_endpoints,
+                max_in_flight_requests=self.max_in_flight_requests,
+
                 # Arguments that are required to be lists in Ed-Fi bulk-operator.
                 resource=endpoints,
                 min_change_version=min_change_versions,
+                expected_row_count=expected_row_counts,
                 adls_destination_filename=[f"{endpoint}.jsonl" for endpoint in endpoints],
 
                 # Optional config-specified run-attributes (overridden by those in configs)
@@ -808,37 +1076,29 @@ class TNEdFiResourceDAG:
                 dag=self.dag
             )
 
-            ### COPY FROM S3 TO SNOWFLAKE
-            copy_adls_to_databricks = BulkADLSToDatabricksOperator(
-                task_id=f"copy_all_endpoints_into_databricks",
-                tenant_code=self.tenant_code,
-                api_year=self.api_year,
-
-                resource=self.xcom_pull_template_map_idx(pull_edfi_to_adls, 0),
-                table_name=table or self.xcom_pull_template_map_idx(pull_edfi_to_adls, 0),
-                edfi_conn_id=self.edfi_conn_id,
-                use_edfi_token_cache=self.use_edfi_token_cache,
-                databricks_conn_id=self.databricks_conn_id,
-                adls_destination_key=self.xcom_pull_template_map_idx(pull_edfi_to_adls, 1),
-                adls_container=self.adls_container,
-                adls_storage_account=self.adls_storage_account,
-                trigger_rule='none_skipped',  # Different trigger rule than default.
-                dag=self.dag
+            ### COPY FROM ADLS TO DATABRICKS AND UPDATE CHANGE VERSIONS (per school year in multi-year extraction)
+            load_operators = self.build_load_operators(
+                pull_edfi_to_adls,
+                table=table,
+                get_deletes=get_deletes,
+                get_key_changes=get_key_changes,
+                copy_trigger_rule='none_skipped',  # Different trigger rule than default.
+                update_cv_task_id="update_change_versions_in_databricks"
             )
 
-            ### UPDATE SNOWFLAKE CHANGE VERSIONS
-            if self.use_change_version:
-                update_cv_operator = self.build_change_version_update_operator(
-                    task_id=f"update_change_versions_in_databricks",
-                    endpoints=self.xcom_pull_template_map_idx(pull_edfi_to_adls, 0),
-                    get_deletes=get_deletes,
-                    get_key_changes=get_key_changes,
-                    trigger_rule='all_success'
+            ### SAVE CONTENT HASHES OF LOADED ENDPOINTS
+            if content_hash_variable:
+                update_hash_operator = self.build_content_hash_update_operator(
+                    task_id="update_content_hashes",
+                    content_hash_variable=content_hash_variable,
+                    pull_operators=pull_edfi_to_adls
                 )
             else:
-                update_cv_operator = None
+                update_hash_operator = None
 
             ### Chain tasks into final task-group
-            airflow_util.chain_tasks(get_cv_operator, pull_edfi_to_adls, copy_adls_to_databricks, update_cv_operator)
+            airflow_util.chain_tasks(get_cv_operator, pull_edfi_to_adls)
+            for copy_adls_to_databricks, update_cv_operator in load_operators:
+                airflow_util.chain_tasks(pull_edfi_to_adls, copy_adls_to_databricks, [update_cv_operator, update_hash_operator])
 
         return bulk_task_group
@@ -2,24 +2,44 @@ import json
 import logging
 import os
 
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from airflow.exceptions import AirflowSkipException
+from airflow.exceptions import AirflowFailException, AirflowSkipException
 from airflow.models import BaseOperator
-from airflow.providers.databricks.hooks.databricks_sql import DatabricksSqlHook
 from airflow.utils.decorators import apply_defaults
 
 from tn_edu_airflow.callables import airflow_util
+from tn_edu_airflow.util.adls_sinks import COMPRESSION_EXTENSIONS
+from tn_edu_airflow.util.databricks_pool import get_databricks_pool
 from edu_edfi_airflow.providers.edfi.hooks.edfi import EdFiHook
 
 
 class ADLSToDatabricksOperator(BaseOperator):
     """
     Copy the Ed-Fi files saved to ADLS to Databricks raw resource tables.
+
+    Landed files may be gzip- or zstd-compressed JSONL (`.jsonl.gz` or `.jsonl.zst`).
+    Databricks infers the codec from the file extension when reading TEXT files.
+
+    Parquet files (`.parquet`) are copied with `FILEFORMAT = PARQUET`,
+    and their columns are packed into the variant `v` column without a per-row JSON parse.
+
+    A key may also be a pattern of part files (e.g., `resources/students/part-*.jsonl`).
+    These are copied from their directory with a COPY INTO `PATTERN`.
+
+    If `upsert` is True, rows are MERGEd into the table instead of appended, keeping one current row per
+    tenant_code, api_year, name, and Ed-Fi `id`. The newest version (`changeVersion`, else `_lastModifiedDate`) wins.
+    Rows without an `id` are always inserted. Run a full refresh after enabling this to compact an existing table.
+
+    If `apply_deletes` is True, the files being loaded are Ed-Fi deletes, and each endpoint's newly landed delete ids
+    are also removed from its resource table (named for the endpoint) in one set-based DELETE.
+    Endpoints without a resource table (e.g., never loaded) are skipped.
     """
     template_fields = (
     'resource', 'table_name', 'adls_destination_key', 'adls_destination_dir', 'adls_destination_filename',
-    'xcom_return',)
+    'ods_version', 'data_model_version', 'xcom_return',)
 
     @apply_defaults
     def __init__(self,
@@ -42,6 +62,8 @@ class ADLSToDatabricksOperator(BaseOperator):
                  use_edfi_token_cache: bool = False,
 
                  full_refresh: bool = False,
+                 upsert: bool = False,
+                 apply_deletes: bool = False,
                  xcom_return: Optional[Any] = None,
                  **kwargs
                  ) -> None:
@@ -66,6 +88,8 @@ class ADLSToDatabricksOperator(BaseOperator):
         self.data_model_version = data_model_version
 
         self.full_refresh = full_refresh
+        self.upsert = upsert
+        self.apply_deletes = apply_deletes
         self.xcom_return = xcom_return
 
     def execute(self, context):
@@ -88,7 +112,8 @@ class ADLSToDatabricksOperator(BaseOperator):
         # Build and run the SQL queries to Snowflake. Delete first if EdFi2 or a full-refresh.
         self.run_sql_queries(
             name=self.resource, table=self.table_name,
-            adls_key=self.adls_destination_key, full_refresh=airflow_util.is_full_refresh(context)
+            adls_key=self.adls_destination_key, full_refresh=airflow_util.is_full_refresh(context),
+            resource_tables=self.get_existing_tables([self.resource]) if self.apply_deletes else set()
         )
 
         return self.xcom_return
@@ -97,8 +122,20 @@ class ADLSToDatabricksOperator(BaseOperator):
         """
         Retrieve the Ed-Fi, ODS, and data model versions if not provided.
         This needs to occur in execute to not call the API at every Airflow synchronize.
+
+        Versions resolved earlier in the run (e.g., pulled from XCom) skip the API entirely.
         """
-        if self.edfi_conn_id:
+        # An XCom template renders a missing value as the string 'None'.
+        if self.ods_version == 'None':
+            self.ods_version = None
+        if self.data_model_version == 'None':
+            self.data_model_version = None
+
+        if self.ods_version and self.data_model_version:
+            if self.ods_version == 'ED-FI2':
+                self.full_refresh = True
+
+        elif self.edfi_conn_id:
             edfi_conn = EdFiHook(edfi_conn_id=self.edfi_conn_id, use_token_cache=self.use_edfi_token_cache).get_conn()
             if is_edfi2 := edfi_conn.is_edfi2():
                 self.full_refresh = True
@@ -114,14 +151,93 @@ class ADLSToDatabricksOperator(BaseOperator):
                 f"Arguments `ods_version` and `data_model_version` could not be retrieved and must be provided."
             )
 
-    def run_sql_queries(self, name: str, table: str, adls_key: str, full_refresh: bool = False):
+    @staticmethod
+    def get_copy_file_format(adls_key: str) -> str:
         """
+        Detect the COPY INTO file format of a landed file from its extension.
+        Compressed JSONL is read as TEXT; the codec is inferred from the extension.
+        """
+        root, extension = os.path.splitext(adls_key)
+
+        if extension == '.parquet':
+            return "PARQUET"
+
+        compression_codecs = {extension: codec for codec, extension in COMPRESSION_EXTENSIONS.items()}
+        if codec := compression_codecs.get(extension):
+            logging.info(f"    Loading {codec}-compressed file `{adls_key}`.")
+            root, extension = os.path.splitext(root)
+
+        if extension not in ('.jsonl', '.json'):
+            raise ValueError(f"Unable to determine the COPY INTO file format of `{adls_key}`.")
 
+        return "TEXT"
+
+    @staticmethod
+    def get_copy_source(adls_key: str) -> Tuple[str, str]:
+        """
+        Split a key into the path to COPY INTO from and an optional PATTERN clause.
         """
-        databricks_hook = DatabricksSqlHook(databricks_conn_id=self.databricks_conn_id)
+        directory, filename = os.path.split(adls_key)
+
+        if '*' in filename:
+            return directory, f"\n            PATTERN = '{filename}'"
+
+        return adls_key, ""
+
+    def build_copy_select(self, file_format: str, source_expr: str, *, name_expr: str, filename_expr: str) -> str:
+        """
+        Build the SELECT transformation of a COPY INTO, parsing each row into `v` and annotating its pull metadata in one pass.
+        Row numbers come from file metadata instead of a sort. For Parquet, they are 1-based and contiguous within each file
+        (`_metadata.row_index`). Text files have no row index, and COPY INTO allows no window function over them,
+        so their rows are numbered by `monotonically_increasing_id()`: increasing in file order, but not contiguous
+        and not restarting at each file.
+        """
+        # TEXT files are read as one JSON string per row in `value`; PARQUET files as one column per top-level field.
+        if file_format == "PARQUET":
+            variant_expr = "to_variant_object(struct(*))"
+            row_number_expr = "_metadata.row_index + 1"
+        else:
+            variant_expr = "parse_json(value)"
+            row_number_expr = "monotonically_increasing_id()"
+
+        return f"""
+                SELECT
+                    {variant_expr} as v,
+                    '{self.tenant_code}' as tenant_code,
+                    '{self.api_year}' as `api_year`,
+                    current_date() as `pull_date`,
+                    current_timestamp() as `pull_timestamp`,
+                    {row_number_expr} as `file_row_number`,
+                    {filename_expr} as `filename`,
+                    {name_expr} as name,
+                    '{self.ods_version}' as `ods_version`,
+                    '{self.data_model_version}' as `data_model_version`
+                FROM {source_expr}"""
+
+    def get_copy_uri(self, path: str) -> str:
+        return f"abfss://{self.adls_container}@{self.adls_storage_account}.dfs.core.windows.net/{path}"
+
+    def run_sql_queries(self,
+                        name: str,
+                        table: str,
+                        adls_key: str,
+                        full_refresh: bool = False,
+                        resource_tables: Set[str] = frozenset()
+                        ):
+        """
+        Copy the file(s) directly into the target table, transforming rows in the COPY INTO (no stage table and no sort).
+        Plain appends into a shared target table (e.g., `_descriptors`) do not conflict when run concurrently,
+        but full-refresh DELETEs, upsert MERGEs, and applied deletes do (see `run_concurrent_sql_queries`).
+        With `apply_deletes`, deletes are applied to the resource table only if it is among the existing `resource_tables`.
+        """
+        file_format = self.get_copy_file_format(adls_key)
+
+        # Part-file patterns are copied from their parent directory.
+        copy_path, pattern_clause = self.get_copy_source(adls_key)
+
         database, schema = airflow_util.get_params_from_conn(self.databricks_conn_id, "extra__databricks__database")
 
-        ### Build the SQL queries to be passed into `Hook.run()`.
+        ### Build the SQL queries to be run over one pooled session.
         qry_delete = f"""
             DELETE FROM {database}.{schema}.{table}
             WHERE tenant_code = '{self.tenant_code}'
@@ -129,51 +245,127 @@ class ADLSToDatabricksOperator(BaseOperator):
             AND name = '{name}'
         """
 
-        qry_create_table = f"""
-            CREATE TABLE IF NOT EXISTS {database}.{schema}.{table}_stage_{self.api_year}
-        """
+        if self.upsert:
+            qry_copy_into = self.build_merge_query(f"{database}.{schema}.{table}", name=name, adls_key=adls_key)
+        else:
+            copy_select = self.build_copy_select(
+                file_format, f"'{self.get_copy_uri(copy_path)}'", name_expr=f"'{name}'", filename_expr=f"'{adls_key}'"
+            )
+            qry_copy_into = f"""
+            COPY INTO {database}.{schema}.{table}
+            FROM ({copy_select}
+            )
+            FILEFORMAT = {file_format}{pattern_clause}
+            COPY_OPTIONS ('force' = 'true')"""
+
+        queries = [qry_copy_into]
+        if self.apply_deletes and name in resource_tables:
+            queries.append(self.build_apply_deletes_query(f"{database}.{schema}.{name}", name=name, adls_key=adls_key))
 
-        qry_drop_table = f"""
-            DROP TABLE {database}.{schema}.{table}_stage_{self.api_year}
+        # Incremental runs are only available in EdFi 3+.
+        if self.full_refresh or full_refresh:
+            queries.insert(0, qry_delete)
+
+        get_databricks_pool(self.databricks_conn_id).run(queries)
+
+    def get_existing_tables(self, tables: List[str]) -> Set[str]:
         """
-        qry_copy_into = f"""
-            COPY INTO {database}.{schema}.{table}_stage_{self.api_year}
-            FROM 'abfss://{self.adls_container}@{self.adls_storage_account}.dfs.core.windows.net/{adls_key}'
-            FILEFORMAT = TEXT
-            COPY_OPTIONS ('force' = 'true', 'mergeSchema' = 'true')"""
+        Return the tables that exist in the Databricks schema, logging those that do not.
+        Called once per task, as `SHOW TABLES` lists the entire schema.
+        """
+        database, schema = airflow_util.get_params_from_conn(self.databricks_conn_id, "extra__databricks__database")
+        records = get_databricks_pool(self.databricks_conn_id).get_records(f"SHOW TABLES IN {database}.{schema}")
+
+        # Records are (database, tableName, isTemporary); Databricks table names are lowercase.
+        existing_tables = {record[1] for record in records}
+        missing_tables = sorted(table for table in set(tables) if table.lower() not in existing_tables)
+        if missing_tables:
+            logging.info(f"    Tables do not exist in `{database}.{schema}` and are skipped: {missing_tables}")
+
+        return set(tables) - set(missing_tables)
 
-        qry_insert = f"""
-            INSERT INTO {database}.{schema}.{table}
-            SELECT 
-                parse_json(value) as v, 
-                '{self.tenant_code}' as tenant_code,
-                '{self.api_year}' as `api_year`, 
-                current_date() as `pull_date`, 
-                current_timestamp() as `pull_timestamp`, 
-                ROW_NUMBER() OVER (ORDER BY value) as `file_row_number`, 
-                '{adls_key}' as `filename`,
-                '{name}' as name, 
-                '{self.ods_version}' as `ods_version`, 
-                '{self.data_model_version}' as `data_model_version`
-            FROM {database}.{schema}.{table}_stage_{self.api_year}    
+    def build_apply_deletes_query(self, resource_table: str, *, name: str, adls_key: str) -> str:
         """
+        Remove the records of the landed delete file(s) from the resource table by `id`.
+        """
+        file_format = self.get_copy_file_format(adls_key)
+        id_expr = "id" if file_format == "PARQUET" else "parse_json(value):id::string"
 
-        # Incremental runs are only available in EdFi 3+.
-        if self.full_refresh or full_refresh:
-            databricks_hook.run(
-                sql=[qry_delete, qry_create_table, qry_copy_into, qry_insert, qry_drop_table],
-                autocommit=False
-            )
-        else:
-            databricks_hook.run(
-                sql=[qry_create_table, qry_copy_into, qry_insert, qry_drop_table]
+        return f"""
+            DELETE FROM {resource_table}
+            WHERE tenant_code = '{self.tenant_code}'
+            AND api_year = '{self.api_year}'
+            AND name = '{name}'
+            AND v:id::string IN (
+                SELECT {id_expr}
+                FROM read_files('{self.get_copy_uri(adls_key)}', format => '{file_format.lower()}')
             )
+        """
+
+    @staticmethod
+    def get_version_expr(alias: str) -> str:
+        """
+        Build a sortable version of a row: its zero-padded `changeVersion` (deletes and key changes), else its `_lastModifiedDate`.
+        """
+        return f"coalesce(lpad({alias}.v:changeVersion::string, 20, '0'), {alias}.v:_lastModifiedDate::string, '')"
+
+    def build_merge_query(self, table: str, *, name: str, adls_key: str) -> str:
+        """
+        MERGE the file(s) into the table, keeping only the newest version of each record by `id`.
+        Files are read with `read_files`, and records repeated within the batch are reduced to their newest version first.
+        """
+        file_format = self.get_copy_file_format(adls_key)
+
+        # `read_files` accepts globs in the path, so part-file patterns are read as-is.
+        copy_select = self.build_copy_select(
+            file_format, f"read_files('{self.get_copy_uri(adls_key)}', format => '{file_format.lower()}')",
+            name_expr=f"'{name}'", filename_expr=f"'{adls_key}'"
+        )
+
+        return f"""
+            MERGE INTO {table} AS t
+            USING (
+                SELECT * FROM ({copy_select}
+                ) AS s
+                QUALIFY s.v:id IS NULL OR ROW_NUMBER() OVER (
+                    PARTITION BY s.v:id::string
+                    ORDER BY {self.get_version_expr('s')} DESC, s.file_row_number DESC
+                ) = 1
+            ) AS s
+            ON t.tenant_code = s.tenant_code
+                AND t.api_year = s.api_year
+                AND t.name = s.name
+                AND t.v:id::string = s.v:id::string
+            WHEN MATCHED AND {self.get_version_expr('s')} >= {self.get_version_expr('t')} THEN UPDATE SET *
+            WHEN NOT MATCHED THEN INSERT *
+        """
+
 
 
 class BulkADLSToDatabricksOperator(ADLSToDatabricksOperator):
     """
     Copy the Ed-Fi files saved to S3 to Snowflake raw resource tables.
+
+    If `batch_load` is True, the landed files of all endpoints sharing a target table and file format are copied
+    in as few COPY INTO statements as possible (at most `MAX_FILES_PER_COPY` files or patterns each),
+    routing each row to its endpoint by `_metadata.file_path`. Endpoints with their own tables are still copied
+    one statement each, over the same pooled session.
+
+    Otherwise, endpoints are loaded one at a time, or `max_concurrent_loads` at a time over as many pooled Databricks connections.
+    Unless every load is a plain append, endpoints sharing a target table are loaded one after another.
     """
+    MAX_FILES_PER_COPY = 1000  # Databricks limit on the number of files listed in a COPY INTO `FILES` clause.
+
+    @apply_defaults
+    def __init__(self,
+                 *,
+                 batch_load: bool = False,
+                 max_concurrent_loads: int = 1,
+                 **kwargs
+                 ) -> None:
+        super(BulkADLSToDatabricksOperator, self).__init__(**kwargs)
+        self.batch_load = batch_load
+        self.max_concurrent_loads = max_concurrent_loads
 
     def execute(self, context):
         """
@@ -216,15 +408,37 @@ class BulkADLSToDatabricksOperator(ADLSToDatabricksOperator):
         ### Retrieve the Ed-Fi, ODS, and data model versions in execute to prevent excessive API calls.
         self.set_edfi_attributes()
 
+        # Deletes are only applied to resource tables that exist.
+        resource_tables = self.get_existing_tables(self.resource) if self.apply_deletes else set()
+
+        # Record the tables written to for post-load maintenance (deletes also write to their existing resource tables).
+        loaded_tables = set(self.table_name) | resource_tables
+        context['ti'].xcom_push(key='loaded_tables', value=sorted(loaded_tables))
+
         # Build and run the SQL queries to Snowflake. Delete first if EdFi2 or a full-refresh.
         xcom_returns = []
 
+        if self.batch_load:
+            self.run_batch_sql_queries(
+                endpoints=list(zip(self.resource, self.table_name, self.adls_destination_key)),
+                full_refresh=airflow_util.is_full_refresh(context), resource_tables=resource_tables
+            )
+            return self.xcom_return or xcom_returns
+
+        if self.max_concurrent_loads > 1:
+            self.run_concurrent_sql_queries(
+                endpoints=list(zip(self.resource, self.table_name, self.adls_destination_key)),
+                full_refresh=airflow_util.is_full_refresh(context), resource_tables=resource_tables
+            )
+            return self.xcom_return or xcom_returns
+
         for idx, (resource, table, adls_destination_key) in enumerate(
                 zip(self.resource, self.table_name, self.adls_destination_key), start=1):
             logging.info(f"[ENDPOINT {idx} / {len(self.resource)}]")
             self.run_sql_queries(
                 name=resource, table=table,
-                adls_key=adls_destination_key, full_refresh=airflow_util.is_full_refresh(context)
+                adls_key=adls_destination_key, full_refresh=airflow_util.is_full_refresh(context),
+                resource_tables=resource_tables
             )
 
         # Send the prebuilt-output if specified; otherwise, send the compiled list created above.
@@ -233,3 +447,178 @@ class BulkADLSToDatabricksOperator(ADLSToDatabricksOperator):
             return self.xcom_return
         else:
             return xcom_returns
+
+    def run_concurrent_sql_queries(self,
+                                   endpoints: List[Tuple[str, str, str]],
+                                   full_refresh: bool = False,
+                                   resource_tables: Set[str] = frozenset()
+                                   ):
+        """
+        Load each (name, table, adls_key) endpoint in a thread pool of `max_concurrent_loads`, each over its own connection.
+        Concurrent DELETEs and MERGEs on one Delta table fail with concurrent-modification conflicts, so when a load runs any
+        (a full refresh, `upsert`, or `apply_deletes`), the endpoints sharing a target table are loaded in order by one worker.
+        Every endpoint is attempted before failing the task with the list of those that failed.
+        """
+        if self.upsert or self.apply_deletes or self.full_refresh or full_refresh:
+            table_endpoints: Dict[str, List[Tuple[str, str, str]]] = {}
+            for endpoint in endpoints:
+                table_endpoints.setdefault(endpoint[1], []).append(endpoint)
+            endpoint_groups = list(table_endpoints.values())
+        else:
+            endpoint_groups = [[endpoint] for endpoint in endpoints]
+
+        logging.info(
+            f"Loading {len(endpoints)} endpoints in {len(endpoint_groups)} groups "
+            f"with up to {self.max_concurrent_loads} Databricks connections."
+        )
+
+        def load_endpoint_group(endpoint_group: List[Tuple[str, str, str]]) -> List[str]:
+            failed_names = []
+            for name, table, adls_key in endpoint_group:
+                try:
+                    self.run_sql_queries(
+                        name=name, table=table, adls_key=adls_key, full_refresh=full_refresh, resource_tables=resource_tables
+                    )
+                except Exception as err:
+                    failed_names.append(name)
+                    logging.warning(f"    Unable to copy endpoint `{name}` into Databricks ({err})")
+            return failed_names
+
+        failed_endpoints = []
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_loads) as executor:
+            for failed_names in executor.map(load_endpoint_group, endpoint_groups):
+                failed_endpoints.extend(failed_names)
+
+        if failed_endpoints:
+            raise AirflowFailException(
+                f"Failed copying one or more endpoints into Databricks: {failed_endpoints}"
+            )
+
+    def run_batch_sql_queries(self,
+                              endpoints: List[Tuple[str, str, str]],
+                              full_refresh: bool = False,
+                              resource_tables: Set[str] = frozenset()
+                              ):
+        """
+        Copy every (name, table, adls_key) endpoint directly into its target table, in as few COPY INTO statements as possible.
+        Only endpoints sharing a target table and file format share statements (e.g., descriptors into `_descriptors`);
+        resources, each with their own table, are still copied one statement per endpoint, over the same pooled session.
+
+        The statements of each target table and file format are run together. If one fails, that group's endpoints are
+        reported as failed and the remaining groups are still loaded, before failing the task with the list of those that failed.
+        """
+        database, schema = airflow_util.get_params_from_conn(self.databricks_conn_id, "extra__databricks__database")
+        group_queries: List[Tuple[List[str], List[str]]] = []  # (endpoint names, statements)
+
+        # Endpoints sharing a target table and file format are copied together.
+        endpoint_groups = sorted(
+            ((table, self.get_copy_file_format(adls_key), (name, table, adls_key)) for name, table, adls_key in endpoints),
+            key=lambda group: group[:2]
+        )
+        for (table, file_format), table_endpoints in groupby(endpoint_groups, key=lambda group: group[:2]):
+            table_endpoints = [endpoint for _, _, endpoint in table_endpoints]
+            queries = []
+
+            if self.full_refresh or full_refresh:
+                names = ", ".join(f"'{name}'" for name, _, _ in table_endpoints)
+                queries.append(f"""
+            DELETE FROM {database}.{schema}.{table}
+            WHERE tenant_code = '{self.tenant_code}'
+            AND api_year = '{self.api_year}'
+            AND name IN ({names})
+        """)
+
+            # Upserts are merged one endpoint at a time, so each endpoint's records are matched only against its own.
+            if self.upsert:
+                queries.extend(
+                    self.build_merge_query(f"{database}.{schema}.{table}", name=name, adls_key=adls_key)
+                    for name, _, adls_key in table_endpoints
+                )
+            else:
+                queries.extend(self.build_batch_copy_queries(
+                    f"{database}.{schema}.{table}", file_format=file_format, endpoints=table_endpoints
+                ))
+
+            if self.apply_deletes:
+                queries.extend(
+                    self.build_apply_deletes_query(f"{database}.{schema}.{name}", name=name, adls_key=adls_key)
+                    for name, _, adls_key in table_endpoints if name in resource_tables
+                )
+
+            group_queries.append(([name for name, _, _ in table_endpoints], queries))
+
+        num_statements = sum(len(queries) for _, queries in group_queries)
+        logging.info(f"Loading {len(endpoints)} endpoints in {num_statements} statements.")
+
+        failed_endpoints = []
+        for names, queries in group_queries:
+            try:
+                get_databricks_pool(self.databricks_conn_id).run(queries)
+            except Exception as err:
+                failed_endpoints.extend(names)
+                logging.warning(f"    Unable to copy endpoints {names} into Databricks ({err})")
+
+        if failed_endpoints:
+            raise AirflowFailException(
+                f"Failed copying one or more endpoints into Databricks: {failed_endpoints}"
+            )
+
+    def build_batch_copy_queries(self, table: str, *, file_format: str, endpoints: List[Tuple[str, str, str]]) -> List[str]:
+        """
+        Copy every key into the table from their common directory, listing at most `MAX_FILES_PER_COPY` per statement.
+        Exact keys are listed in `FILES`; part-file patterns are combined into a single `PATTERN` glob.
+        Each row's endpoint name and key are routed from its `_metadata.file_path`.
+        """
+        adls_keys = [adls_key for _, _, adls_key in endpoints]
+        root = os.path.commonpath([os.path.dirname(adls_key) for adls_key in adls_keys])
+
+        if len(endpoints) == 1:
+            name_expr, filename_expr = f"'{endpoints[0][0]}'", f"'{endpoints[0][2]}'"
+        else:
+            name_expr = self.build_file_path_case({adls_key: name for name, _, adls_key in endpoints})
+            filename_expr = self.build_file_path_case({adls_key: adls_key for adls_key in adls_keys})
+
+        copy_select = self.build_copy_select(
+            file_format, f"'{self.get_copy_uri(root)}'", name_expr=name_expr, filename_expr=filename_expr
+        )
+
+        files = [os.path.relpath(adls_key, root) for adls_key in adls_keys if '*' not in adls_key]
+        patterns = [os.path.relpath(adls_key, root) for adls_key in adls_keys if '*' in adls_key]
+
+        source_clauses = []
+        for idx in range(0, len(files), self.MAX_FILES_PER_COPY):
+            file_list = ", ".join(f"'{file}'" for file in files[idx: idx + self.MAX_FILES_PER_COPY])
+            source_clauses.append(f"FILES = ({file_list})")
+
+        for idx in range(0, len(patterns), self.MAX_FILES_PER_COPY):
+            pattern_chunk = patterns[idx: idx + self.MAX_FILES_PER_COPY]
+            glob = pattern_chunk[0] if len(pattern_chunk) == 1 else "{" + ",".join(pattern_chunk) + "}"
+            source_clauses.append(f"PATTERN = '{glob}'")
+
+        return [
+            f"""
+            COPY INTO {table}
+            FROM ({copy_select}
+            )
+            FILEFORMAT = {file_format}
+            {source_clause}
+            COPY_OPTIONS ('force' = 'true')"""
+            for source_clause in source_clauses
+        ]
+
+    def build_file_path_case(self, values: Dict[str, str]) -> str:
+        """
+        Build a CASE expression mapping each row's `_metadata.file_path` to the value of the key (or part-file pattern) it was read from.
+        """
+        whens = "\n".join(
+            f"                        WHEN _metadata.file_path LIKE '{self.get_file_path_pattern(adls_key)}' THEN '{value}'"
+            for adls_key, value in values.items()
+        )
+        return f"CASE\n{whens}\n                    END"
+
+    def get_file_path_pattern(self, adls_key: str) -> str:
+        """
+        Build a LIKE pattern matching the `_metadata.file_path` of every file landed to a key (or part-file pattern).
+        """
+        file_path = self.get_copy_uri(adls_key)
+        return file_path.replace('_', '\\_').replace('%', '\\%').replace('*', '%')
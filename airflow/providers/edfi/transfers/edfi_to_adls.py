@@ -1,16 +1,33 @@
-import json
 import logging
 import os
+import threading
+import time
 
-from typing import Iterator, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from airflow.models import BaseOperator
+from airflow.models import BaseOperator, Connection, Variable
 from airflow.exceptions import AirflowSkipException, AirflowFailException
-from airflow.providers.microsoft.azure.hooks.data_lake import AzureDataLakeStorageV2Hook
 from airflow.utils.decorators import apply_defaults
 
 from edu_edfi_airflow.dags.dag_util import airflow_util
 from edu_edfi_airflow.providers.edfi.hooks.edfi import EdFiHook
+from tn_edu_airflow.util import change_version_windows
+from tn_edu_airflow.util.adls_sinks import ADLSStreamingSink, CompressedSink, LocalFileSink, COMPRESSION_EXTENSIONS
+from tn_edu_airflow.util.adls_sinks import delete_adls_directory, delete_adls_file
+from tn_edu_airflow.util.checkpoints import ADLSWindowCheckpoint
+from tn_edu_airflow.util.content_hash import ContentHasher
+from tn_edu_airflow.util.landing_writers import JsonlLandingWriter, ParquetLandingWriter, RollingLandingWriter
+from tn_edu_airflow.util.landing_writers import SchoolYearRoutingWriter
+from tn_edu_airflow.util.deduplication import DeduplicationAttempt, RecordDeduplicator
+from tn_edu_airflow.util.page_size_controller import AdaptivePageSizeController, RequestTimer
+from tn_edu_airflow.util.rate_limiter import ODSRateLimiter
+from tn_edu_airflow.util.spill_space import SpillSpaceManager
+
+
+# Endpoints pulled concurrently in one task share the same page-size variable.
+_page_size_lock = threading.Lock()
 
 
 class EdFiToADLSOperator(BaseOperator):
@@ -21,9 +38,64 @@ class EdFiToADLSOperator(BaseOperator):
     Use a paged-get to retrieve a particular EdFi resource from the ODS.
     Save the results as JSON lines to `tmp_dir` on the server.
     Once pagination is complete, write the full results to S3.
+
+    If `stream_to_adls` is True, skip the temp file and append pages directly to an in-progress ADLS file instead.
+    The file is only moved to `adls_destination_key` once pagination succeeds.
+
+    If `compression` is set (`gzip` or `zstd`), the JSONL is compressed as it is written,
+    and the codec's extension (`.gz` or `.zst`) is appended to the destination key.
+
+    Rows are serialized to JSONL by `serializer` (`json`, `orjson`, or `msgspec`).
+
+    If `landing_format` is `parquet`, the resource is landed as a single Parquet file instead (`.parquet`).
+    Nested Ed-Fi collections are kept as struct/list columns, and rows are written in row groups of `row_group_pages` pages.
+    In this format, `compression` selects the Parquet codec (default snappy).
+
+    If `checkpoint_windows` is True, each change-version window is landed as its own part file and checkpointed,
+    so a retried task resumes from the last landed window. The XCom then returns a `part-*` pattern instead of a single key.
+
+    If `max_part_mb` is set, output is rolled into numbered part files of about that many megabytes of JSON lines
+    (`{destination_dir}/{name}/part-00000.jsonl`, ...), so large endpoints are loaded in parallel.
+    The XCom then returns a `part-*` pattern instead of a single key.
+
+    If `max_concurrent_requests` is greater than one, the change-version window is split into step-sized windows
+    that are paged concurrently. Results are still written to the output file in change-version order.
+
+    If `adaptive_page_size` is set (a dict of `AdaptivePageSizeController` arguments, e.g., `min_page_size` and `max_page_size`),
+    the page size is tuned between change-version windows from the observed request time, payload size, and failures.
+    The tuned page size is saved under `{namespace}/{resource}` in the JSON Airflow Variable `page_size_variable`
+    and used as the starting page size of the next run.
+
+    If `target_rows_per_window` is set, change-version windows are planned from `totalCount` probes
+    to hold roughly that many rows each, instead of being cut every `change_version_step_size` change versions.
+
+    If `expected_row_count` is passed (the delta count already retrieved by the change-version operator),
+    it is used to check the number of rows pulled instead of querying `totalCount` again.
+
+    If `deduplicate_records` is True, records whose `id` was already written at the same or a newer version
+    (`_lastModifiedDate`, or `changeVersion` for deletes and key-changes) are dropped as they are pulled.
+    Records updated mid-pull can otherwise be returned in more than one change-version window or page.
+    Ids are tracked in memory, spilling to a SQLite file in `tmp_dir` for very large resources.
+
+    If `content_hash_variable` is set, a full pull (without change versions) is hashed as it is paged.
+    If the hash matches the one saved for the endpoint in that Airflow Variable, the upload is skipped (and so is the load).
+    The hash is returned as the third item of the XCom, to be saved once the load succeeds. Full refreshes ignore saved hashes.
+
+    If `school_years` is set, a multi-year ODS is pulled once (without a `schoolYear` filter) for all of those years.
+    Records are routed into one landing file per year by their `schoolYear` (see `SchoolYearRoutingWriter`),
+    and `{school_year}` in the destination key is replaced by each year. Each year's (endpoint, key, content_hash) tuple
+    is pushed to the XCom key `school_year_{year}` for that year's load. Checkpointed windows are not supported in this mode.
+
+    If `spill_space` is set (a dict of `SpillSpaceManager` arguments, e.g., `quota_mb` and `reserve_mb`),
+    each pull reserves space in `tmp_dir` against a quota shared by every task on the worker, waiting while the disk is full.
+    Temporary files left by crashed tasks are removed when the next task starts.
+
+    If the Ed-Fi connection's extras define `rate_limit` (`requests_per_second`, `max_concurrent_requests`, and/or `burst`),
+    every request to the ODS is throttled by a limiter shared with all other tasks on the worker that hit the same ODS.
     """
     template_fields = (
         'resource', 'namespace', 'page_size', 'num_retries', 'change_version_step_size', 'query_parameters',
+        'max_concurrent_requests', 'expected_row_count',
         'adls_destination_key', 'adls_destination_dir', 'adls_destination_filename',
         'min_change_version', 'max_change_version', 'enabled_endpoints',
     )
@@ -39,11 +111,20 @@ class EdFiToADLSOperator(BaseOperator):
                  adls_destination_key: Optional[str] = None,
                  adls_destination_dir: Optional[str] = None,
                  adls_destination_filename: Optional[str] = None,
+                 stream_to_adls: bool = False,
+                 compression: Optional[str] = None,
+                 serializer: str = 'json',
+                 landing_format: str = 'jsonl',
+                 row_group_pages: int = 100,
+                 checkpoint_windows: bool = False,
+                 max_part_mb: Optional[float] = None,
+                 school_years: Optional[List[int]] = None,
 
                  get_deletes: bool = False,
                  get_key_changes: bool = False,
                  min_change_version: Optional[int] = None,
                  max_change_version: Optional[int] = None,
+                 expected_row_count: Optional[int] = None,
                  use_edfi_token_cache: bool = False,
 
                  namespace: str = 'ed-fi',
@@ -52,6 +133,13 @@ class EdFiToADLSOperator(BaseOperator):
                  change_version_step_size: int = 50000,
                  reverse_paging: bool = True,
                  query_parameters: Optional[dict] = None,
+                 max_concurrent_requests: int = 1,
+                 adaptive_page_size: Optional[dict] = None,
+                 page_size_variable: Optional[str] = None,
+                 target_rows_per_window: Optional[int] = None,
+                 deduplicate_records: bool = False,
+                 content_hash_variable: Optional[str] = None,
+                 spill_space: Optional[dict] = None,
 
                  enabled_endpoints: Optional[List[str]] = None,
                  offset: int = 0,
@@ -68,6 +156,7 @@ class EdFiToADLSOperator(BaseOperator):
         self.get_key_changes = get_key_changes
         self.min_change_version = min_change_version
         self.max_change_version = max_change_version
+        self.expected_row_count = expected_row_count
         self.use_edfi_token_cache = use_edfi_token_cache
 
         # Storage variables
@@ -76,6 +165,15 @@ class EdFiToADLSOperator(BaseOperator):
         self.adls_destination_key = adls_destination_key
         self.adls_destination_dir = adls_destination_dir
         self.adls_destination_filename = adls_destination_filename
+        self.stream_to_adls = stream_to_adls
+        self.compression = compression
+        self.serializer = serializer
+        self.landing_format = landing_format
+        self.row_group_pages = row_group_pages
+        self.checkpoint_windows = checkpoint_windows
+        self.max_part_mb = max_part_mb
+        self.spill_space = spill_space
+        self.school_years = school_years
 
         # Endpoint-pagination variables
         self.namespace = namespace
@@ -84,11 +182,26 @@ class EdFiToADLSOperator(BaseOperator):
         self.change_version_step_size = change_version_step_size
         self.reverse_paging = reverse_paging
         self.query_parameters = query_parameters
+        self.max_concurrent_requests = max_concurrent_requests
+        self.adaptive_page_size = adaptive_page_size
+        self.page_size_variable = page_size_variable or f"edfi_page_sizes__{edfi_conn_id}"
+        self.target_rows_per_window = target_rows_per_window
+        self.deduplicate_records = deduplicate_records
+        self.content_hash_variable = content_hash_variable
+        self.previous_content_hashes: Dict[str, str] = {}
+
+        # Shared pool for change-version window requests, set by the bulk operator to cap window requests across concurrent endpoints.
+        self.request_executor: Optional[ThreadPoolExecutor] = None
+        self.rate_limiter: Optional[ODSRateLimiter] = None
+        self.spill_space_manager: Optional[SpillSpaceManager] = None
 
         # Optional variable to allow immediate skips when endpoint not specified in dynamic get-change-version output.
         self.enabled_endpoints = enabled_endpoints
         self.offset = offset
 
+        if self.school_years and self.checkpoint_windows:
+            raise ValueError("Checkpointed windows cannot be landed per school year; unset `checkpoint_windows` or `school_years`.")
+
     def execute(self, context) -> str:
         """
 
@@ -111,21 +224,130 @@ class EdFiToADLSOperator(BaseOperator):
                 )
             self.adls_destination_key = os.path.join(self.adls_destination_dir, self.adls_destination_filename)
 
+        self.adls_destination_key = self.get_landing_key(self.adls_destination_key)
+
         # Check the validity of min and max change-versions.
         self.check_change_version_window_validity(self.min_change_version, self.max_change_version)
 
         # Complete the pull and write to ADLS
         edfi_conn = EdFiHook(self.edfi_conn_id, use_token_cache=self.use_edfi_token_cache).get_conn()
+        self.rate_limiter = self.build_rate_limiter()
+        self.spill_space_manager = self.build_spill_space_manager()
+        self.previous_content_hashes = self.load_content_hashes(context)
 
-        self.pull_edfi_to_adls(
-            edfi_conn=edfi_conn,
-            resource=self.resource, namespace=self.namespace, page_size=self.page_size,
-            num_retries=self.num_retries, change_version_step_size=self.change_version_step_size,
-            min_change_version=self.min_change_version, max_change_version=self.max_change_version,
-            query_parameters=self.query_parameters, adls_destination_key=self.adls_destination_key, offset=self.offset
-        )
+        try:
+            landed_key, content_hash = self.pull_edfi_to_adls(
+                edfi_conn=edfi_conn,
+                resource=self.resource, namespace=self.namespace, page_size=self.page_size,
+                num_retries=self.num_retries, change_version_step_size=self.change_version_step_size,
+                min_change_version=self.min_change_version, max_change_version=self.max_change_version,
+                query_parameters=self.query_parameters, adls_destination_key=self.adls_destination_key, offset=self.offset,
+                max_concurrent_requests=self.max_concurrent_requests, expected_row_count=self.expected_row_count
+            )
+        finally:
+            if self.rate_limiter:
+                self.rate_limiter.log_wait_time()
+
+        if self.school_years:
+            for school_year, endpoint_tuples in self.split_school_year_tuples([(self.resource, landed_key, content_hash)]).items():
+                context['ti'].xcom_push(key=self.get_school_year_xcom_key(school_year), value=endpoint_tuples[0])
+            landed_key = self.adls_destination_key
+
+        return (self.resource, landed_key, content_hash)
+
+    @staticmethod
+    def get_school_year_xcom_key(school_year: int) -> str:
+        return f"school_year_{school_year}"
+
+    @staticmethod
+    def get_school_year_key(adls_destination_key: str, school_year: int) -> str:
+        return adls_destination_key.replace("{school_year}", str(school_year))
+
+    @staticmethod
+    def split_school_year_tuples(endpoint_tuples: List[Tuple[str, Dict[int, str], Optional[str]]]) -> Dict[int, List[Tuple[str, str, Optional[str]]]]:
+        """
+        Split (endpoint, {school_year: landed_key}, content_hash) tuples into (endpoint, landed_key, content_hash) tuples per year.
+        """
+        school_year_tuples = {}
+        for resource, landed_keys, content_hash in endpoint_tuples:
+            for school_year, landed_key in landed_keys.items():
+                school_year_tuples.setdefault(school_year, []).append((resource, landed_key, content_hash))
+        return school_year_tuples
+
+    def load_content_hashes(self, context) -> Dict[str, str]:
+        """
+        Load the content hashes saved for each endpoint by the last successful load (none in a full refresh).
+        """
+        if not self.content_hash_variable or airflow_util.is_full_refresh(context):
+            return {}
+
+        return Variable.get(self.content_hash_variable, default_var={}, deserialize_json=True)
+
+    def build_rate_limiter(self) -> Optional[ODSRateLimiter]:
+        """
+        Build a rate limiter for the ODS if `rate_limit` is defined in the Ed-Fi connection's extras.
+        """
+        edfi_conn = Connection.get_connection_from_secrets(self.edfi_conn_id)
+        rate_limit = edfi_conn.extra_dejson.get('rate_limit')
+
+        if not rate_limit:
+            return None
+
+        logging.info(f"    Throttling requests to `{edfi_conn.host}`: {rate_limit}")
+        return ODSRateLimiter(edfi_conn.host, **rate_limit)
+
+    def build_spill_space_manager(self) -> Optional[SpillSpaceManager]:
+        """
+        Build a spill-space manager for `tmp_dir` if `spill_space` is set, clearing files left by crashed tasks.
+        """
+        if not self.spill_space:
+            return None
+
+        spill_space_manager = SpillSpaceManager(self.tmp_dir, **self.spill_space)
+        spill_space_manager.log_usage()
+        return spill_space_manager
+
+    @contextmanager
+    def reserve_spill_space(self, adls_destination_key: str) -> Iterator[None]:
+        """
+        Reserve space for the temporary files of a pull, if a spill-space manager is set.
+        Files are written to `{tmp_dir}/{key}` (and its suffixed siblings), or to part files beneath `{tmp_dir}/{dir}/{name}/`.
+        """
+        if not self.spill_space_manager:
+            yield
+            return
+
+        destination_keys = [adls_destination_key] + [
+            self.get_school_year_key(adls_destination_key, school_year) for school_year in (self.school_years or [])
+        ]
+
+        tmp_paths = []
+        for destination_key in destination_keys:
+            part_dir, _ = self.get_part_prefix(destination_key)
+            tmp_paths.extend([os.path.join(self.tmp_dir, destination_key), os.path.join(self.tmp_dir, part_dir)])
+
+        with self.spill_space_manager.reserve(tmp_paths):
+            yield
+
+    def throttle(self, paged_iter: Iterator[List[dict]], request_timer: Optional[RequestTimer] = None) -> Iterator[List[dict]]:
+        """
+        Rate-limit each page request of a paged iterator, if a rate limiter is set.
+        If a request timer is passed, it times the requests themselves (not the time spent waiting on the limiter).
+        """
+        if request_timer:
+            paged_iter = request_timer.time(paged_iter)
+
+        if not self.rate_limiter:
+            return paged_iter
+
+        return self.rate_limiter.throttle(paged_iter)
+
+    def get_total_count(self, resource_endpoint: 'EdFiEndpoint') -> int:
+        if not self.rate_limiter:
+            return resource_endpoint.total_count()
 
-        return (self.resource, self.adls_destination_key)
+        with self.rate_limiter.request():
+            return resource_endpoint.total_count()
 
     @staticmethod
     def check_change_version_window_validity(min_change_version: Optional[int], max_change_version: Optional[int]):
@@ -157,11 +379,65 @@ class EdFiToADLSOperator(BaseOperator):
                           max_change_version: Optional[int],
                           query_parameters: dict,
                           adls_destination_key: str,
-                          offset: Optional[int],
+                          offset: Optional[int] = None,
+                          max_concurrent_requests: int = 1,
+                          expected_row_count: Optional[int] = None,
                           ):
         """
         Break out EdFi-to-S3 logic to allow code-duplication in bulk version of operator.
+        Return the ADLS key (or part-file pattern) the resource was landed to, and its content hash (if hashing is enabled).
+        If `school_years` is set, the landed keys are returned as a {school_year: key} dictionary.
         """
+        if self.school_years and "{school_year}" not in adls_destination_key:
+            raise ValueError("The destination key must contain `{school_year}` to land records per school year.")
+
+        # Delta counts are taken without query parameters (e.g., `schoolYear` in multiyear ODSes), so they only apply without them.
+        if not isinstance(expected_row_count, int) or query_parameters:
+            expected_row_count = None
+
+        # Start from the page size learned in previous runs if adaptive paging is enabled.
+        page_size_controller = self.build_page_size_controller(resource, namespace, page_size)
+        if page_size_controller:
+            page_size = page_size_controller.page_size
+
+        deduplicator = self.build_deduplicator(adls_destination_key)
+
+        try:
+            with self.reserve_spill_space(adls_destination_key):
+                return self._pull_edfi_to_adls(
+                    edfi_conn=edfi_conn,
+                    resource=resource, namespace=namespace, page_size=page_size,
+                    num_retries=num_retries, change_version_step_size=change_version_step_size,
+                    min_change_version=min_change_version, max_change_version=max_change_version,
+                    query_parameters=query_parameters, adls_destination_key=adls_destination_key,
+                    max_concurrent_requests=max_concurrent_requests, page_size_controller=page_size_controller,
+                    expected_row_count=expected_row_count, deduplicator=deduplicator
+                )
+
+        # Save the tuned page size even if the pull fails, so a retry starts from a page size that has been backed off.
+        finally:
+            if page_size_controller:
+                self.save_page_size(resource, namespace, page_size_controller.page_size)
+            if deduplicator:
+                deduplicator.close()
+
+    def _pull_edfi_to_adls(self,
+                           *,
+                           edfi_conn: 'Connection',
+                           resource: str,
+                           namespace: str,
+                           page_size: int,
+                           num_retries: int,
+                           change_version_step_size: int,
+                           min_change_version: Optional[int],
+                           max_change_version: Optional[int],
+                           query_parameters: dict,
+                           adls_destination_key: str,
+                           max_concurrent_requests: int,
+                           page_size_controller: Optional[AdaptivePageSizeController],
+                           expected_row_count: Optional[int],
+                           deduplicator: Optional[RecordDeduplicator],
+                           ):
         ### Connect to EdFi and write resource data to a temp file.
         # Prepare the EdFiEndpoint for the resource.
         logging.info(
@@ -176,38 +452,137 @@ class EdFiToADLSOperator(BaseOperator):
             min_change_version=min_change_version, max_change_version=max_change_version
         )
 
+        # Turn off change version stepping if min and max change versions have not been defined.
+        step_change_version = (min_change_version is not None and max_change_version is not None)
+
+        # Land each change-version window as its own part file, resuming from any windows landed by a previous try.
+        if self.checkpoint_windows and step_change_version:
+            total_rows, landed_key = self.pull_checkpointed_windows(
+                edfi_conn=edfi_conn,
+                resource=resource, namespace=namespace, page_size=page_size,
+                num_retries=num_retries, change_version_step_size=change_version_step_size,
+                min_change_version=min_change_version, max_change_version=max_change_version,
+                query_parameters=query_parameters, adls_destination_key=adls_destination_key,
+                max_concurrent_requests=max_concurrent_requests, page_size_controller=page_size_controller,
+                expected_row_count=expected_row_count, deduplicator=deduplicator
+            )
+
+            self.log_expected_row_count(resource_endpoint, resource, total_rows, expected_rows=expected_row_count)
+
+            if total_rows == 0:
+                logging.info(f"    No results returned for `{resource}`")
+                raise AirflowSkipException
+
+            return landed_key, None
+
         # Iterate the ODS, paginating across offset and change version steps.
-        # Write each result to the temp file.
+        # Write each result to the output sink (either a temp file or a streaming ADLS file).
         tmp_file = os.path.join(self.tmp_dir, adls_destination_key)
         total_rows = 0
 
-        try:
-            # Turn off change version stepping if min and max change versions have not been defined.
-            step_change_version = (min_change_version is not None and max_change_version is not None)
-
-            paged_iter = resource_endpoint.get_pages(
-                page_size=page_size,
-                step_change_version=step_change_version, change_version_step_size=change_version_step_size,
-                reverse_paging=self.reverse_paging,
-                retry_on_failure=True, max_retries=num_retries
+        # Content hashes only apply to full pulls; a change-version delta differs run to run.
+        content_hasher = ContentHasher() if self.content_hash_variable and not step_change_version else None
+
+        # Route records into one writer per school year, each built the first time its year receives a record.
+        if self.school_years:
+            landed_keys = {}
+
+            def build_school_year_writer(school_year: int) -> JsonlLandingWriter:
+                school_year_writer, landed_keys[school_year] = self.build_output_writer(
+                    self.get_school_year_key(adls_destination_key, school_year), page_size=page_size
+                )
+                return school_year_writer
+
+            def delete_school_year(school_year: int):
+                self.delete_landed_key(landed_keys[school_year])
+
+            writer = SchoolYearRoutingWriter(
+                build_school_year_writer, school_years=self.school_years, delete_year=delete_school_year
             )
 
-            # Output each page of results as JSONL strings to the output file.
-            os.makedirs(os.path.dirname(tmp_file), exist_ok=True)  # Create its parent-directory in not extant.
+        else:
+            writer, landed_key = self.build_output_writer(adls_destination_key, page_size=page_size)
 
-            with open(tmp_file, 'wb') as fp:
-                for page_result in paged_iter:
-                    fp.write(self.to_jsonl_string(page_result))
-                    total_rows += len(page_result)
+        try:
+            # Page each change-version window independently, then write the windows in order.
+            # Adaptive paging and planned windows also use this path, as `get_pages()` only steps by a fixed size.
+            if step_change_version and (
+                max_concurrent_requests > 1 or page_size_controller or self.target_rows_per_window or self.request_executor
+            ):
+                total_rows = self.write_change_version_windows(
+                    writer,
+                    edfi_conn=edfi_conn,
+                    resource=resource, namespace=namespace, page_size=page_size,
+                    num_retries=num_retries, change_version_step_size=change_version_step_size,
+                    min_change_version=min_change_version, max_change_version=max_change_version,
+                    query_parameters=query_parameters, tmp_file=tmp_file,
+                    max_concurrent_requests=max_concurrent_requests, page_size_controller=page_size_controller,
+                    expected_row_count=expected_row_count, deduplicator=deduplicator
+                )
+
+            else:
+                request_timer = RequestTimer()
+                paged_iter = self.throttle(resource_endpoint.get_pages(
+                    page_size=page_size,
+                    step_change_version=step_change_version, change_version_step_size=change_version_step_size,
+                    reverse_paging=self.reverse_paging,
+                    retry_on_failure=True, max_retries=num_retries
+                ), request_timer=request_timer)
+
+                if content_hasher:
+                    paged_iter = content_hasher.hash_pages(paged_iter)
+
+                # Output each page of results to the landing file.
+                total_rows = self.write_pages(
+                    writer, paged_iter, request_timer,
+                    page_size_controller=page_size_controller, deduplicator=deduplicator
+                )
 
-        # In the case of any failures, we need to delete the temporary files written, then reraise the error.
+        # In the case of any failures, we need to delete the partial files written, then reraise the error.
+        # A single-call pull cannot be resumed at a smaller page size, but the task retry can start from one.
         except Exception as err:
-            self.delete_path(tmp_file)
+            writer.abort()
+            if page_size_controller and not step_change_version:
+                page_size_controller.backoff()
             raise err
 
-        # Check whether the number of rows returned matched the number expected.
+        self.log_expected_row_count(resource_endpoint, resource, total_rows, expected_rows=expected_row_count)
+
+        # Raise a Skip if no data was collected.
+        if total_rows == 0:
+            logging.info(f"    No results returned for `{resource}`")
+            writer.abort()
+            raise AirflowSkipException
+
+        # Skip the upload (and downstream load) if the endpoint is unchanged since it was last loaded.
+        content_hash = content_hasher.hexdigest() if content_hasher else None
+        if content_hash and self.previous_content_hashes.get(resource) == content_hash:
+            logging.info(f"    `{resource}` is unchanged since the last load (content hash: {content_hash[:12]}). Skipping...")
+            writer.abort()
+            raise AirflowSkipException
+
+        ### Push to ADLS (or finalize the streamed file).
+        writer.commit()
+
+        if self.school_years:
+            landed_key = {school_year: landed_keys[school_year] for school_year in writer.landed_years}
+
+        return landed_key, content_hash
+
+    def log_expected_row_count(self,
+                               resource_endpoint: 'EdFiEndpoint',
+                               resource: str,
+                               total_rows: int,
+                               expected_rows: Optional[int] = None
+                               ):
+        """
+        Check whether the number of rows returned matched the number expected.
+        Only query the ODS for the expected number if it has not already been provided.
+        """
         try:
-            expected_rows = resource_endpoint.total_count()
+            if expected_rows is None:
+                expected_rows = self.get_total_count(resource_endpoint)
+
             if total_rows != expected_rows:
                 logging.warning(f"    Expected {expected_rows} rows for `{resource}`.")
             else:
@@ -219,21 +594,478 @@ class EdFiToADLSOperator(BaseOperator):
         finally:
             logging.info(f"    {total_rows} rows were returned for `{resource}`.")
 
-        # Raise a Skip if no data was collected.
-        if total_rows == 0:
-            logging.info(f"    No results returned for `{resource}`")
-            self.delete_path(tmp_file)
-            raise AirflowSkipException
+    def build_page_size_controller(self, resource: str, namespace: str, page_size: int) -> Optional[AdaptivePageSizeController]:
+        """
+        Build a page-size controller if adaptive paging is enabled, starting from the last page size saved for the endpoint.
+        """
+        if not self.adaptive_page_size:
+            return None
+
+        saved_page_sizes = Variable.get(self.page_size_variable, default_var={}, deserialize_json=True)
+        saved_page_size = saved_page_sizes.get(self.get_page_size_key(resource, namespace))
+        if saved_page_size is not None:
+            logging.info(f"    Starting from learned page size {saved_page_size} (configured: {page_size}).")
+            page_size = int(saved_page_size)
+
+        return AdaptivePageSizeController(page_size, **self.adaptive_page_size)
 
-        ### Connect to ADLS and push
+    def get_page_size_key(self, resource: str, namespace: str) -> str:
+        key = f"{namespace}/{resource}"
+
+        # Deletes and key-changes return much smaller rows than the resource itself.
+        if self.get_deletes:
+            key += "/deletes"
+        if self.get_key_changes:
+            key += "/key_changes"
+
+        return key
+
+    def save_page_size(self, resource: str, namespace: str, page_size: int):
+        """
+        Re-read the page-size variable before saving, so sizes saved by other endpoints since the pull began are kept.
+        """
         try:
-            adls_hook = AzureDataLakeStorageV2Hook(adls_conn_id=self.adls_conn_id)
-            with open(tmp_file, "rb") as data:
-                adls_hook.create_file(file_name=self.adls_destination_key, file_system_name="ed-fi").upload_data(
-                    data=data, overwrite=True)
+            with _page_size_lock:
+                saved_page_sizes = Variable.get(self.page_size_variable, default_var={}, deserialize_json=True)
+                saved_page_sizes[self.get_page_size_key(resource, namespace)] = page_size
+                Variable.set(self.page_size_variable, saved_page_sizes, serialize_json=True)
+        except Exception:
+            logging.warning(f"    Unable to save learned page size for `{resource}`.")
 
-        finally:
-            self.delete_path(tmp_file)
+    def build_deduplicator(self, adls_destination_key: str) -> Optional[RecordDeduplicator]:
+        if not self.deduplicate_records:
+            return None
+
+        return RecordDeduplicator(os.path.join(self.tmp_dir, f"{adls_destination_key}.dedup.sqlite"))
+
+    @staticmethod
+    def write_pages(writer: JsonlLandingWriter,
+                    paged_iter: Iterator[List[dict]],
+                    request_timer: RequestTimer,
+                    page_size_controller: Optional[AdaptivePageSizeController] = None,
+                    deduplicator: Optional[Union[RecordDeduplicator, DeduplicationAttempt]] = None
+                    ) -> int:
+        """
+        Write each page of results to the landing writer and return the number of rows written.
+        If a page-size controller is provided, report the time spent waiting on the ODS (as measured by the request timer
+        of the paged iterator, excluding rate limiting) and the bytes written to it.
+        If a deduplicator is provided, drop rows already written at the same or a newer version.
+        """
+        total_rows = 0
+        num_pages = 0
+        start_seconds = request_timer.seconds
+        start_bytes = writer.bytes_written
+
+        for page_result in paged_iter:
+            if deduplicator:
+                page_result = deduplicator.filter(page_result)
+            total_rows += writer.write_rows(page_result)
+            num_pages += 1
+
+        if page_size_controller:
+            page_size_controller.observe_window(
+                num_pages=num_pages, request_seconds=request_timer.seconds - start_seconds,
+                num_bytes=writer.bytes_written - start_bytes
+            )
+
+        return total_rows
+
+    def build_output_writer(self, adls_destination_key: str, *, page_size: int) -> Tuple[JsonlLandingWriter, str]:
+        """
+        Build the writer for a pull and return it with the key (or part-file pattern) it lands to.
+        If `max_part_mb` is set, roll output into part files, clearing any parts landed by a previous try first.
+        """
+        if self.max_part_mb:
+            part_dir, part_extension = self.get_part_prefix(adls_destination_key)
+            delete_adls_directory(self.adls_conn_id, part_dir)
+
+            writer = self.build_part_writer(os.path.join(part_dir, "part"), part_extension, page_size=page_size)
+            return writer, os.path.join(part_dir, f"part-*{part_extension}")
+
+        tmp_file = os.path.join(self.tmp_dir, adls_destination_key)
+        return self.build_landing_writer(adls_destination_key, tmp_file=tmp_file, page_size=page_size), adls_destination_key
+
+    def delete_landed_key(self, landed_key: str):
+        """
+        Delete a landed file from ADLS, or the directory of a part-file pattern.
+        """
+        if '*' in landed_key:
+            delete_adls_directory(self.adls_conn_id, os.path.dirname(landed_key))
+        else:
+            delete_adls_file(self.adls_conn_id, landed_key)
+
+    def build_landing_writer(self, adls_destination_key: str, *, tmp_file: str, page_size: int) -> JsonlLandingWriter:
+        """
+        Build the output sink (a temp file or a streaming ADLS file) and wrap it in a writer for the landing format.
+        """
+        if self.stream_to_adls:
+            sink = ADLSStreamingSink(self.adls_conn_id, adls_destination_key)
+        else:
+            sink = LocalFileSink(self.adls_conn_id, adls_destination_key, tmp_path=tmp_file)
+
+        if self.landing_format == 'parquet':
+            return ParquetLandingWriter(
+                sink, spool_path=f"{tmp_file}.spool", serializer=self.serializer,
+                compression=self.compression, row_group_size=page_size * self.row_group_pages
+            )
+
+        if self.compression:
+            sink = CompressedSink(sink, self.compression)
+
+        return JsonlLandingWriter(sink, serializer=self.serializer)
+
+    def build_part_writer(self, part_prefix: str, part_extension: str, *, page_size: int) -> RollingLandingWriter:
+        """
+        Build a writer that rolls output into numbered part files of about `max_part_mb` each.
+        """
+        return RollingLandingWriter(
+            lambda part_key: self.build_landing_writer(part_key, tmp_file=os.path.join(self.tmp_dir, part_key), page_size=page_size),
+            part_prefix=part_prefix, part_extension=part_extension,
+            max_part_bytes=int(self.max_part_mb * 1024 ** 2),
+            delete_part=lambda part_key: delete_adls_file(self.adls_conn_id, part_key)
+        )
+
+    def get_landing_key(self, adls_destination_key: str) -> str:
+        """
+        Set the extension of the destination key for the landing format and compression.
+        """
+        if self.landing_format == 'parquet':
+            return os.path.splitext(adls_destination_key)[0] + '.parquet'
+
+        if self.landing_format != 'jsonl':
+            raise ValueError(f"Landing format `{self.landing_format}` is not one of the expected values: ['jsonl', 'parquet'].")
+
+        if not self.compression:
+            return adls_destination_key
+
+        if self.compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError(
+                f"Compression `{self.compression}` is not one of the expected values: {list(COMPRESSION_EXTENSIONS.keys())}."
+            )
+
+        return adls_destination_key + COMPRESSION_EXTENSIONS[self.compression]
+
+    def get_change_version_windows(self,
+                                   edfi_conn: 'Connection',
+                                   *,
+                                   resource: str,
+                                   namespace: str,
+                                   query_parameters: dict,
+                                   change_version_step_size: int,
+                                   min_change_version: int,
+                                   max_change_version: int,
+                                   expected_row_count: Optional[int] = None,
+                                   ) -> List[Tuple[int, int]]:
+        """
+        Split the change-version range into windows: step-sized by default, or density-planned if `target_rows_per_window` is set.
+        """
+        if not self.target_rows_per_window:
+            return change_version_windows.get_change_version_windows(
+                min_change_version, max_change_version, change_version_step_size
+            )
+
+        def count_rows(window_min: int, window_max: int) -> int:
+            return self.get_total_count(edfi_conn.resource(
+                resource, namespace=namespace, params=query_parameters,
+                get_deletes=self.get_deletes, get_key_changes=self.get_key_changes,
+                min_change_version=window_min, max_change_version=window_max
+            ))
+
+        return change_version_windows.plan_change_version_windows(
+            count_rows, min_change_version, max_change_version,
+            target_rows_per_window=self.target_rows_per_window, total_rows=expected_row_count
+        )
+
+    def get_window_pages(self,
+                         edfi_conn: 'Connection',
+                         *,
+                         resource: str,
+                         namespace: str,
+                         page_size: int,
+                         num_retries: int,
+                         query_parameters: dict,
+                         window_min: int,
+                         window_max: int,
+                         request_timer: RequestTimer
+                         ) -> Iterator[List[dict]]:
+        """
+        Page a single change-version window of a resource, timing its requests with the request timer.
+        """
+        window_endpoint = edfi_conn.resource(
+            resource, namespace=namespace, params=query_parameters,
+            get_deletes=self.get_deletes, get_key_changes=self.get_key_changes,
+            min_change_version=window_min, max_change_version=window_max
+        )
+
+        # Each endpoint covers exactly one window, so a single step spans the entire range.
+        return self.throttle(window_endpoint.get_pages(
+            page_size=page_size,
+            step_change_version=True, change_version_step_size=(window_max - window_min),
+            reverse_paging=self.reverse_paging,
+            retry_on_failure=True, max_retries=num_retries
+        ), request_timer=request_timer)
+
+    def write_change_version_windows(self,
+                                     writer: JsonlLandingWriter,
+                                     *,
+                                     edfi_conn: 'Connection',
+                                     resource: str,
+                                     namespace: str,
+                                     page_size: int,
+                                     num_retries: int,
+                                     change_version_step_size: int,
+                                     min_change_version: int,
+                                     max_change_version: int,
+                                     query_parameters: dict,
+                                     tmp_file: str,
+                                     max_concurrent_requests: int,
+                                     page_size_controller: Optional[AdaptivePageSizeController] = None,
+                                     expected_row_count: Optional[int] = None,
+                                     deduplicator: Optional[RecordDeduplicator] = None,
+                                     ) -> int:
+        """
+        Page each change-version window in a bounded thread pool, landing each window in its own temporary file.
+        Append the window files to the landing writer in change-version order and return the total number of rows written.
+        If a page-size controller is provided, each window starts at its current page size and a failed window is retried
+        at a smaller page size.
+        """
+        windows = self.get_change_version_windows(
+            edfi_conn,
+            resource=resource, namespace=namespace, query_parameters=query_parameters,
+            change_version_step_size=change_version_step_size,
+            min_change_version=min_change_version, max_change_version=max_change_version,
+            expected_row_count=expected_row_count
+        )
+        logging.info(
+            f"    Pulling {len(windows)} change-version windows with up to {max_concurrent_requests} concurrent requests."
+        )
+
+        os.makedirs(os.path.dirname(tmp_file), exist_ok=True)  # Not created by sinks that write directly to ADLS.
+
+        def pull_window(window_idx: int, window_min: int, window_max: int) -> Tuple[str, int]:
+            window_file = f"{tmp_file}.window{window_idx:05d}"
+
+            while True:
+                try:
+                    request_timer = RequestTimer()
+                    paged_iter = self.get_window_pages(
+                        edfi_conn,
+                        resource=resource, namespace=namespace, num_retries=num_retries,
+                        page_size=page_size_controller.page_size if page_size_controller else page_size,
+                        query_parameters=query_parameters, window_min=window_min, window_max=window_max,
+                        request_timer=request_timer
+                    )
+
+                    with open(window_file, 'wb') as window_fp, self.deduplication_attempt(deduplicator) as window_deduplicator:
+                        # Writers (and their serializers) reuse a buffer and cannot be shared across threads.
+                        window_writer = JsonlLandingWriter(window_fp, serializer=self.serializer)
+                        window_rows = self.write_pages(
+                            window_writer, paged_iter, request_timer,
+                            page_size_controller=page_size_controller, deduplicator=window_deduplicator
+                        )
+
+                    return window_file, window_rows
+
+                except Exception as err:
+                    self.delete_path(window_file)
+                    if not (page_size_controller and page_size_controller.backoff()):
+                        raise err
+
+        total_rows = 0
+        window_futures = []
+        num_windows_written = 0
+
+        with self.get_window_executor(max_concurrent_requests) as executor:
+            try:
+                for window_idx, (window_min, window_max) in enumerate(windows):
+                    window_futures.append(executor.submit(pull_window, window_idx, window_min, window_max))
+
+                # Futures are consumed in submission order to preserve change-version ordering in the output.
+                for window_idx, window_future in enumerate(window_futures, start=1):
+                    window_file, window_rows = window_future.result()
+
+                    with open(window_file, 'rb') as window_fp:
+                        writer.write_jsonl(window_fp)
+                    self.delete_path(window_file)
+
+                    logging.info(f"    [WINDOW {window_idx} / {len(windows)}] {window_rows} rows")
+                    total_rows += window_rows
+                    num_windows_written += 1
+
+            # Cancel any windows that have not started, wait on those in flight, and remove what they wrote.
+            except Exception as err:
+                for window_future in window_futures:
+                    window_future.cancel()
+
+                wait(window_futures)
+
+                for window_future in window_futures[num_windows_written:]:
+                    if not window_future.cancelled() and not window_future.exception():
+                        self.delete_path(window_future.result()[0])
+
+                raise err
+
+        return total_rows
+
+    @staticmethod
+    @contextmanager
+    def deduplication_attempt(deduplicator: Optional[RecordDeduplicator]) -> Iterator[Optional[DeduplicationAttempt]]:
+        """
+        Scope a window's deduplication to a single attempt, so a retried window is not deduplicated against itself.
+        """
+        if not deduplicator:
+            yield None
+        else:
+            with deduplicator.attempt() as attempt:
+                yield attempt
+
+    @contextmanager
+    def get_window_executor(self, max_concurrent_requests: int) -> Iterator[ThreadPoolExecutor]:
+        """
+        Yield the shared request pool if one is set; otherwise, a pool of `max_concurrent_requests` threads for this pull only.
+        """
+        if self.request_executor:
+            yield self.request_executor
+        else:
+            with ThreadPoolExecutor(max_workers=max_concurrent_requests) as executor:
+                yield executor
+
+    @staticmethod
+    def get_part_prefix(adls_destination_key: str) -> Tuple[str, str]:
+        """
+        Split a destination key into the directory its part files are landed in and their extension.
+        e.g., `resources/students.jsonl.gz` -> (`resources/students`, `.jsonl.gz`)
+        """
+        parent_dir, filename = os.path.split(adls_destination_key)
+        name, _, extension = filename.partition('.')
+        return os.path.join(parent_dir, name), f".{extension}" if extension else ""
+
+    def pull_checkpointed_windows(self,
+                                  *,
+                                  edfi_conn: 'Connection',
+                                  resource: str,
+                                  namespace: str,
+                                  page_size: int,
+                                  num_retries: int,
+                                  change_version_step_size: int,
+                                  min_change_version: int,
+                                  max_change_version: int,
+                                  query_parameters: dict,
+                                  adls_destination_key: str,
+                                  max_concurrent_requests: int,
+                                  page_size_controller: Optional[AdaptivePageSizeController] = None,
+                                  expected_row_count: Optional[int] = None,
+                                  deduplicator: Optional[RecordDeduplicator] = None,
+                                  ) -> Tuple[int, str]:
+        """
+        Land each change-version window as a numbered part file under `{destination_dir}/{name}/`.
+        Each landed window is recorded in a checkpoint manifest under `{destination_dir}/_checkpoints/`,
+        and windows already recorded by a previous try are not pulled again.
+
+        If `max_part_mb` is set, each window is itself rolled into `part-{window}-{part}` files.
+
+        Remaining windows are still attempted after a window fails, so a retry has as little left to pull as possible.
+        Return the total number of rows landed and a `part-*` pattern matching every part file.
+        """
+        part_dir, part_extension = self.get_part_prefix(adls_destination_key)
+        manifest_key = os.path.join(os.path.dirname(part_dir), '_checkpoints', f"{os.path.basename(part_dir)}.json")
+
+        checkpoint = ADLSWindowCheckpoint(
+            self.adls_conn_id, manifest_key, part_dir=part_dir,
+            plan={
+                'resource': resource, 'namespace': namespace, 'query_parameters': query_parameters,
+                'get_deletes': self.get_deletes, 'get_key_changes': self.get_key_changes,
+                'min_change_version': min_change_version, 'max_change_version': max_change_version,
+                'change_version_step_size': change_version_step_size, 'part_extension': part_extension,
+                'target_rows_per_window': self.target_rows_per_window, 'max_part_mb': self.max_part_mb,
+            }
+        )
+        completed_windows = checkpoint.load()
+
+        # Reuse the windows of the try being resumed; density-planned windows would shift if planned again.
+        if checkpoint.window_bounds is None:
+            checkpoint.window_bounds = self.get_change_version_windows(
+                edfi_conn,
+                resource=resource, namespace=namespace, query_parameters=query_parameters,
+                change_version_step_size=change_version_step_size,
+                min_change_version=min_change_version, max_change_version=max_change_version,
+                expected_row_count=expected_row_count
+            )
+        windows = checkpoint.window_bounds
+
+        pending_windows = [
+            (window_idx, window_min, window_max)
+            for window_idx, (window_min, window_max) in enumerate(windows)
+            if window_idx not in completed_windows
+        ]
+        logging.info(
+            f"    Pulling {len(pending_windows)} of {len(windows)} change-version windows with up to {max_concurrent_requests} concurrent requests."
+        )
+
+        def pull_window(window_idx: int, window_min: int, window_max: int) -> int:
+            part_key = os.path.join(part_dir, f"part-{window_idx:05d}{part_extension}")
+
+            while True:
+                window_page_size = page_size_controller.page_size if page_size_controller else page_size
+                if self.max_part_mb:
+                    writer = self.build_part_writer(os.path.join(part_dir, f"part-{window_idx:05d}"), part_extension, page_size=window_page_size)
+                else:
+                    writer = self.build_landing_writer(part_key, tmp_file=os.path.join(self.tmp_dir, part_key), page_size=window_page_size)
+
+                try:
+                    request_timer = RequestTimer()
+                    paged_iter = self.get_window_pages(
+                        edfi_conn,
+                        resource=resource, namespace=namespace, page_size=window_page_size, num_retries=num_retries,
+                        query_parameters=query_parameters, window_min=window_min, window_max=window_max,
+                        request_timer=request_timer
+                    )
+                    with self.deduplication_attempt(deduplicator) as window_deduplicator:
+                        window_rows = self.write_pages(
+                            writer, paged_iter, request_timer,
+                            page_size_controller=page_size_controller, deduplicator=window_deduplicator
+                        )
+                    break
+
+                except Exception as err:
+                    writer.abort()
+                    if not (page_size_controller and page_size_controller.backoff()):
+                        raise err
+
+            # Empty windows are still checkpointed, but no part file is landed.
+            if window_rows:
+                writer.commit()
+            else:
+                writer.abort()
+
+            return window_rows
+
+        failed_windows = []
+
+        with self.get_window_executor(max_concurrent_requests) as executor:
+            window_futures = {
+                executor.submit(pull_window, window_idx, window_min, window_max): window_idx
+                for window_idx, window_min, window_max in pending_windows
+            }
+
+            # Manifest updates are made only from this thread, as each window completes.
+            for window_future in as_completed(window_futures):
+                window_idx = window_futures[window_future]
+
+                try:
+                    window_rows = window_future.result()
+                except Exception as err:
+                    logging.warning(f"    [WINDOW {window_idx + 1} / {len(windows)}] Failed: {err}")
+                    failed_windows.append(err)
+                    continue
+
+                checkpoint.record_window(window_idx, window_rows)
+                logging.info(f"    [WINDOW {window_idx + 1} / {len(windows)}] {window_rows} rows")
+
+        if failed_windows:
+            raise failed_windows[0]
+
+        return checkpoint.total_rows, os.path.join(part_dir, f"part-*{part_extension}")
 
     @staticmethod
     def delete_path(path: str):
@@ -243,16 +1075,6 @@ class EdFiToADLSOperator(BaseOperator):
         except FileNotFoundError:
             logging.error("File not found.")
 
-    @staticmethod
-    def to_jsonl_string(rows: Iterator[dict]) -> bytes:
-        """
-        :return:
-        """
-        return b''.join(
-            json.dumps(row).encode('utf8') + b'\n'
-            for row in rows
-        )
-
 
 class BulkEdFiToADLSOperator(EdFiToADLSOperator):
     """
@@ -265,13 +1087,34 @@ class BulkEdFiToADLSOperator(EdFiToADLSOperator):
     - num_retries
     - change_version_step_size
     - query_parameters
+    - max_concurrent_requests
     - min_change_version
+    - expected_row_count (optional)
     - s3_destination_filename
 
+    If `max_concurrent_endpoints` is greater than one, endpoints are pulled in a thread pool that shares one Ed-Fi connection.
+    (Each endpoint can still make up to its `max_concurrent_requests` requests at once.)
+
+    If `max_in_flight_requests` is set, change-version windows are instead paged in one shared pool of that many threads
+    (in place of each endpoint's `max_concurrent_requests`). With `max_concurrent_endpoints` above one, the windows of
+    the endpoints pulled at once share this cap. Only endpoints paged by change-version windows use the pool;
+    endpoints paged without windows (e.g., without change versions) make their requests from their endpoint thread.
+
     If all endpoints skip, raise an AirflowSkipException.
     If at least one endpoint fails, push the XCom and raise an AirflowFailException.
     Otherwise, return a successful XCom.
     """
+    @apply_defaults
+    def __init__(self,
+                 *,
+                 max_concurrent_endpoints: int = 1,
+                 max_in_flight_requests: Optional[int] = None,
+                 **kwargs
+                 ) -> None:
+        super(BulkEdFiToADLSOperator, self).__init__(**kwargs)
+        self.max_concurrent_endpoints = max_concurrent_endpoints
+        self.max_in_flight_requests = max_in_flight_requests
+
     def execute(self, context) -> str:
         """
 
@@ -287,6 +1130,10 @@ class BulkEdFiToADLSOperator(EdFiToADLSOperator):
         # Make connection outside of loop to not re-authenticate at every resource.
         edfi_conn = EdFiHook(self.edfi_conn_id, use_token_cache=self.use_edfi_token_cache).get_conn()
 
+        self.rate_limiter = self.build_rate_limiter()
+        self.spill_space_manager = self.build_spill_space_manager()
+        self.previous_content_hashes = self.load_content_hashes(context)
+
         # Gather DAG-level endpoints outside of loop.
         config_endpoints = airflow_util.get_config_endpoints(context)
 
@@ -302,23 +1149,24 @@ class BulkEdFiToADLSOperator(EdFiToADLSOperator):
             self.num_retries,
             self.change_version_step_size,
             self.query_parameters,
+            self.max_concurrent_requests,
             self.adls_destination_filename,
+            self.expected_row_count or [None] * len(self.resource),
         ]
 
-        for idx, (resource, min_change_version, namespace, page_size, num_retries, change_version_step_size, query_parameters, adls_destination_filename) \
-            in enumerate(zip(*zip_arguments), start=1):
-
-            logging.info(f"[ENDPOINT {idx} / {len(self.resource)}]")
+        def pull_endpoint(idx, resource, min_change_version, namespace, page_size, num_retries, change_version_step_size, query_parameters, max_concurrent_requests, adls_destination_filename, expected_row_count) \
+                -> Optional[Tuple[str, str, Optional[str]]]:
+            logging.info(f"[ENDPOINT {idx} / {len(self.resource)}] {namespace}/{resource}")
 
             # If doing a resource-specific run, confirm resource is in the list.
             if config_endpoints and resource not in config_endpoints:
                 logging.info(f"    Endpoint {resource} not specified in DAG config endpoints. Skipping...")
-                continue
+                return None
 
             # Confirm resource is in XCom-list if passed (used for dynamic XComs retrieved from get-change-version operator).
             if self.enabled_endpoints and resource not in self.enabled_endpoints:
                 logging.info(f"    Endpoint {resource} not specified in run endpoints. Skipping...")
-                continue
+                return None
 
             try:
                 # Retrieve the min_change_version for this resource specifically.
@@ -326,25 +1174,65 @@ class BulkEdFiToADLSOperator(EdFiToADLSOperator):
 
                 # Complete the pull and write to S3
                 adls_destination_key = os.path.join(self.adls_destination_dir, adls_destination_filename)
+                adls_destination_key = self.get_landing_key(adls_destination_key)
 
-                self.pull_edfi_to_adls(
+                landed_key, content_hash = self.pull_edfi_to_adls(
                     edfi_conn=edfi_conn,
                     resource=resource, namespace=namespace, page_size=page_size,
                     num_retries=num_retries, change_version_step_size=change_version_step_size,
                     min_change_version=min_change_version, max_change_version=self.max_change_version,
-                    query_parameters=query_parameters, adls_destination_key=adls_destination_key
+                    query_parameters=query_parameters, adls_destination_key=adls_destination_key,
+                    max_concurrent_requests=max_concurrent_requests, expected_row_count=expected_row_count
                 )
-                return_tuples.append((resource, adls_destination_key))
+                return (resource, landed_key, content_hash)
 
             except AirflowSkipException:
-                continue
+                return None
 
-            except Exception:
-                failed_endpoints.append(resource)
-                logging.warning(
-                    f"    Unable to complete ingestion of endpoint: {namespace}/{resource}"
-                )
-                continue
+        if self.max_in_flight_requests:
+            logging.info(f"Paging change-version windows with up to {self.max_in_flight_requests} requests in flight.")
+            self.request_executor = ThreadPoolExecutor(max_workers=self.max_in_flight_requests)
+
+        # Results are collected in endpoint order, regardless of the order in which the endpoints complete.
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_endpoints) as executor:
+                endpoint_futures = [
+                    (endpoint_args[0], endpoint_args[2], executor.submit(pull_endpoint, idx, *endpoint_args))
+                    for idx, endpoint_args in enumerate(zip(*zip_arguments), start=1)
+                ]
+
+                for resource, namespace, endpoint_future in endpoint_futures:
+                    try:
+                        endpoint_tuple = endpoint_future.result()
+
+                    except Exception as err:
+                        failed_endpoints.append(resource)
+                        logging.warning(
+                            f"    Unable to complete ingestion of endpoint: {namespace}/{resource} ({err})"
+                        )
+                        continue
+
+                    if endpoint_tuple:
+                        return_tuples.append(endpoint_tuple)
+
+        finally:
+            if self.request_executor:
+                self.request_executor.shutdown(wait=True)
+                self.request_executor = None
+
+        if self.rate_limiter:
+            self.rate_limiter.log_wait_time()
+
+        # Push each school year's tuples for its own load, and return the destination pattern in place of the per-year keys.
+        if self.school_years:
+            for school_year, school_year_tuples in self.split_school_year_tuples(return_tuples).items():
+                context['ti'].xcom_push(key=self.get_school_year_xcom_key(school_year), value=school_year_tuples)
+
+            destination_filenames = dict(zip(self.resource, self.adls_destination_filename))
+            return_tuples = [
+                (resource, self.get_landing_key(os.path.join(self.adls_destination_dir, destination_filenames[resource])), content_hash)
+                for resource, _, content_hash in return_tuples
+            ]
 
         if failed_endpoints:
             context['ti'].xcom_push(key='return_value', value=return_tuples)
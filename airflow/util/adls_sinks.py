@@ -0,0 +1,212 @@
+import gzip
+import logging
+import os
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from airflow.providers.microsoft.azure.hooks.data_lake import AzureDataLakeStorageV2Hook
+
+# Landing-file extensions appended to the destination key for each supported compression codec.
+COMPRESSION_EXTENSIONS = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+
+class LocalFileSink:
+    """
+    Write bytes to a temporary file in `tmp_dir`.
+    Once writing is complete, upload the full file to ADLS on `commit()`.
+    The temporary file is removed on both `commit()` and `abort()`.
+    """
+    def __init__(self,
+                 adls_conn_id: str,
+                 adls_destination_key: str,
+                 *,
+                 tmp_path: str,
+                 file_system_name: str = "ed-fi"
+                 ) -> None:
+        self.adls_conn_id = adls_conn_id
+        self.adls_destination_key = adls_destination_key
+        self.file_system_name = file_system_name
+        self.tmp_path = tmp_path
+        self.bytes_written = 0
+
+        os.makedirs(os.path.dirname(self.tmp_path), exist_ok=True)  # Create its parent-directory in not extant.
+        self.fp = open(self.tmp_path, 'wb')
+
+    def write(self, data: bytes) -> int:
+        self.fp.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+    def commit(self):
+        """
+        Upload the temporary file to ADLS, then remove it.
+        """
+        self.fp.close()
+
+        try:
+            adls_hook = AzureDataLakeStorageV2Hook(adls_conn_id=self.adls_conn_id)
+            with open(self.tmp_path, "rb") as data:
+                adls_hook.create_file(file_name=self.adls_destination_key, file_system_name=self.file_system_name).upload_data(
+                    data=data, overwrite=True)
+
+        finally:
+            self._remove_tmp_file()
+
+    def abort(self):
+        """
+        Remove the temporary file without uploading.
+        """
+        self.fp.close()
+        self._remove_tmp_file()
+
+    def _remove_tmp_file(self):
+        logging.info(f"    Removing temporary files written to `{self.tmp_path}`")
+        try:
+            os.remove(self.tmp_path)
+        except FileNotFoundError:
+            logging.error("File not found.")
+
+
+class ADLSStreamingSink:
+    """
+    Append bytes directly to an in-progress ADLS file, without a local copy.
+
+    Writes are buffered in memory and appended once `chunk_size` bytes have accumulated.
+    Each append is flushed, so extraction and upload overlap and memory use stays bounded.
+    Data is written to `{adls_destination_key}.inprogress` and only renamed to the destination on `commit()`.
+    On `abort()`, the in-progress file is deleted so partial data is never loaded downstream.
+    """
+    in_progress_suffix = ".inprogress"
+
+    def __init__(self,
+                 adls_conn_id: str,
+                 adls_destination_key: str,
+                 *,
+                 file_system_name: str = "ed-fi",
+                 chunk_size: int = 4 * 1024 * 1024
+                 ) -> None:
+        self.adls_conn_id = adls_conn_id
+        self.adls_destination_key = adls_destination_key
+        self.file_system_name = file_system_name
+        self.chunk_size = chunk_size
+        self.bytes_written = 0
+
+        self.buffer = bytearray()
+        self.offset = 0  # Number of bytes already appended to the ADLS file.
+
+        # Creating the file overwrites any in-progress file left behind by a previous attempt.
+        adls_hook = AzureDataLakeStorageV2Hook(adls_conn_id=self.adls_conn_id)
+        self.file_client = adls_hook.create_file(
+            file_name=self.adls_destination_key + self.in_progress_suffix, file_system_name=self.file_system_name
+        )
+
+    def write(self, data: bytes) -> int:
+        self.buffer.extend(data)
+        self.bytes_written += len(data)
+
+        if len(self.buffer) >= self.chunk_size:
+            self._append_buffer()
+
+        return len(data)
+
+    def commit(self):
+        """
+        Append any remaining bytes, close the file, and move it to its final destination.
+        """
+        self._append_buffer(close=True)
+        self.file_client.rename_file(f"{self.file_system_name}/{self.adls_destination_key}")
+        logging.info(f"    Streamed {self.offset} bytes to `{self.adls_destination_key}`")
+
+    def abort(self):
+        """
+        Delete the in-progress file in ADLS.
+        """
+        self.buffer.clear()
+        logging.info(f"    Removing partial file written to `{self.adls_destination_key}{self.in_progress_suffix}`")
+        try:
+            self.file_client.delete_file()
+        except Exception:
+            logging.error("Unable to remove partial file from ADLS.")
+
+    def _append_buffer(self, close: bool = False):
+        if self.buffer:
+            self.file_client.append_data(data=bytes(self.buffer), offset=self.offset, length=len(self.buffer))
+            self.offset += len(self.buffer)
+            self.buffer.clear()
+
+        self.file_client.flush_data(self.offset, close=close)
+
+
+class CompressedSink:
+    """
+    Compress bytes with `compression` before passing them through to an underlying sink.
+    The compression stream is closed on `commit()` so its trailer is written before the sink is finalized.
+    """
+    def __init__(self, sink, compression: str, *, compression_level: int = 3) -> None:
+        self.sink = sink
+        self.compression = compression
+        self.bytes_written = 0
+
+        if compression == 'gzip':
+            self.stream = gzip.GzipFile(fileobj=self.sink, mode='wb', compresslevel=compression_level)
+
+        elif compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("Package `zstandard` must be installed to write zstd-compressed landing files.")
+
+            self.stream = zstandard.ZstdCompressor(level=compression_level).stream_writer(self.sink, closefd=False)
+
+        else:
+            raise ValueError(
+                f"Compression `{compression}` is not one of the expected values: {list(COMPRESSION_EXTENSIONS.keys())}."
+            )
+
+    @property
+    def compressed_bytes_written(self) -> int:
+        return self.sink.bytes_written
+
+    def write(self, data: bytes) -> int:
+        self.stream.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+    def commit(self):
+        self.stream.close()
+        logging.info(
+            f"    Compressed {self.bytes_written} bytes to {self.compressed_bytes_written} bytes using {self.compression}."
+        )
+        self.sink.commit()
+
+    def abort(self):
+        try:
+            self.stream.close()
+        finally:
+            self.sink.abort()
+
+
+def delete_adls_file(adls_conn_id: str, adls_key: str, *, file_system_name: str = "ed-fi"):
+    """
+    Delete a file from ADLS, if it exists.
+    """
+    adls_hook = AzureDataLakeStorageV2Hook(adls_conn_id=adls_conn_id)
+    try:
+        adls_hook.get_file_system(file_system_name).get_file_client(adls_key).delete_file()
+    except ResourceNotFoundError:
+        pass
+
+
+def delete_adls_directory(adls_conn_id: str, adls_dir: str, *, file_system_name: str = "ed-fi"):
+    """
+    Delete a directory (and every file in it) from ADLS, if it exists.
+    """
+    adls_hook = AzureDataLakeStorageV2Hook(adls_conn_id=adls_conn_id)
+    try:
+        adls_hook.delete_directory(file_system_name=file_system_name, directory_name=adls_dir)
+        logging.info(f"    Removed previously-landed files in `{adls_dir}`")
+    except ResourceNotFoundError:
+        pass
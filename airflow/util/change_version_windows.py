@@ -0,0 +1,88 @@
+import logging
+
+from typing import Callable, List, Optional, Tuple
+
+
+def get_change_version_windows(
+        min_change_version: int,
+        max_change_version: int,
+        change_version_step_size: int
+) -> List[Tuple[int, int]]:
+    """
+    Split a change-version range into contiguous, step-sized (min, max) windows.
+    Ed-Fi treats both bounds as inclusive, so each window starts one past the previous window's max
+    (as `EdFiEndpoint.get_pages(step_change_version=True)` does) and no change version is pulled twice.
+    """
+    windows = []
+
+    window_min = min_change_version
+    while window_min <= max_change_version:
+        window_max = min(window_min + change_version_step_size, max_change_version)
+        windows.append((window_min, window_max))
+        window_min = window_max + 1
+
+    return windows
+
+
+def plan_change_version_windows(
+        count_rows: Callable[[int, int], int],
+        min_change_version: int,
+        max_change_version: int,
+        *,
+        target_rows_per_window: int,
+        total_rows: Optional[int] = None,
+        min_step_size: int = 1000,
+        max_probes: int = 200
+) -> List[Tuple[int, int]]:
+    """
+    Split a change-version range into contiguous (min, max) windows of roughly `target_rows_per_window` rows each.
+    As in Ed-Fi, both bounds of a window (and of a probed range) are inclusive, so no two windows share a change version.
+
+    `count_rows(min, max)` returns the number of records in a change-version range (i.e., a `totalCount` query).
+    The range is bisected until each piece holds at most the target number of rows,
+    is narrower than `min_step_size`, or `max_probes` counts have been made.
+    Each split costs one probe, as the right half's count is the parent's count minus the left half's.
+    Adjacent pieces are then merged while they fit within the target, so sparse and empty ranges cost no extra round-trips.
+    If the range's `total_rows` is already known, the first probe is skipped.
+    """
+    num_probes = 0
+    if total_rows is None:
+        total_rows = count_rows(min_change_version, max_change_version)
+        num_probes += 1
+
+    # Depth-first, left-to-right, so pieces are collected in change-version order.
+    pieces: List[Tuple[int, int, int]] = []
+    stack = [(min_change_version, max_change_version, total_rows)]
+
+    while stack:
+        piece_min, piece_max, piece_rows = stack.pop()
+
+        if piece_rows <= target_rows_per_window or piece_max - piece_min <= min_step_size or num_probes >= max_probes:
+            pieces.append((piece_min, piece_max, piece_rows))
+            continue
+
+        piece_mid = (piece_min + piece_max) // 2
+        left_rows = count_rows(piece_min, piece_mid)
+        num_probes += 1
+
+        # Counts can drift while probing; never let the derived count go negative.
+        stack.append((piece_mid + 1, piece_max, max(piece_rows - left_rows, 0)))
+        stack.append((piece_min, piece_mid, left_rows))
+
+    windows = []
+    window_min, window_rows = min_change_version, 0
+
+    for piece_min, piece_max, piece_rows in pieces:
+        if window_rows and window_rows + piece_rows > target_rows_per_window:
+            windows.append((window_min, piece_min - 1))
+            window_min, window_rows = piece_min, 0
+
+        window_rows += piece_rows
+
+    windows.append((window_min, max_change_version))
+
+    logging.info(
+        f"    Planned {len(windows)} change-version windows for {total_rows} rows "
+        f"(target: {target_rows_per_window} rows per window; {num_probes} count probes)."
+    )
+    return windows
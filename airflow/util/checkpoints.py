@@ -0,0 +1,89 @@
+import json
+import logging
+
+from typing import Dict, List, Optional, Tuple
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from airflow.providers.microsoft.azure.hooks.data_lake import AzureDataLakeStorageV2Hook
+
+
+class ADLSWindowCheckpoint:
+    """
+    Record the change-version windows of a pull that have been landed as part files, in a JSON manifest in ADLS.
+
+    The manifest stores the window plan (resource and change-version range/step) and the window bounds
+    alongside the completed windows.
+    A retried task instance resumes from the manifest (and its window bounds) only if its plan is identical.
+    Otherwise (or if no manifest exists), any part files already in `part_dir` are removed and the pull starts over.
+    """
+    def __init__(self,
+                 adls_conn_id: str,
+                 manifest_key: str,
+                 *,
+                 part_dir: str,
+                 plan: dict,
+                 file_system_name: str = "ed-fi"
+                 ) -> None:
+        self.adls_conn_id = adls_conn_id
+        self.manifest_key = manifest_key
+        self.part_dir = part_dir
+        self.plan = plan
+        self.file_system_name = file_system_name
+
+        self.adls_hook = AzureDataLakeStorageV2Hook(adls_conn_id=self.adls_conn_id)
+        self.windows: Dict[int, int] = {}  # Completed window index to number of rows landed.
+        self.window_bounds: Optional[List[Tuple[int, int]]] = None  # (min, max) change versions of every window.
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.windows.values())
+
+    def load(self) -> Dict[int, int]:
+        """
+        Load completed windows from the manifest, or reset the part directory if the manifest cannot be reused.
+        """
+        manifest = self.read_manifest()
+
+        if manifest and manifest.get('plan') == self.plan:
+            self.windows = {int(idx): rows for idx, rows in manifest['windows'].items()}
+            if manifest.get('window_bounds'):
+                self.window_bounds = [tuple(bounds) for bounds in manifest['window_bounds']]
+            logging.info(f"    Resuming from checkpoint `{self.manifest_key}`: {len(self.windows)} windows already landed.")
+
+        else:
+            if manifest:
+                logging.info(f"    Checkpoint `{self.manifest_key}` was built for a different window plan. Starting over.")
+
+            self.windows = {}
+            self.window_bounds = None
+            self.delete_part_dir()
+
+        return self.windows
+
+    def record_window(self, window_idx: int, num_rows: int):
+        """
+        Mark a window as landed and save the manifest.
+        """
+        self.windows[window_idx] = num_rows
+        self.save()
+
+    def save(self):
+        manifest = json.dumps({'plan': self.plan, 'window_bounds': self.window_bounds, 'windows': self.windows}).encode('utf8')
+        self.adls_hook.create_file(file_name=self.manifest_key, file_system_name=self.file_system_name).upload_data(
+            data=manifest, overwrite=True)
+
+    def read_manifest(self) -> Optional[dict]:
+        file_client = self.adls_hook.get_file_system(self.file_system_name).get_file_client(self.manifest_key)
+
+        try:
+            return json.loads(file_client.download_file().readall())
+        except ResourceNotFoundError:
+            return None
+
+    def delete_part_dir(self):
+        try:
+            self.adls_hook.delete_directory(file_system_name=self.file_system_name, directory_name=self.part_dir)
+            logging.info(f"    Removed previously-landed part files in `{self.part_dir}`")
+        except ResourceNotFoundError:
+            pass  # Nothing has been landed yet.
@@ -0,0 +1,33 @@
+import hashlib
+import json
+
+from typing import Iterator, List
+
+
+class ContentHasher:
+    """
+    Order-independent hash of the rows returned for an endpoint.
+
+    Each row is hashed as canonical JSON (sorted keys), and the row digests are summed modulo 2^256.
+    Ed-Fi pages by offset without a guaranteed ordering, so the same rows returned in a different order hash the same.
+    """
+    MODULUS = 2 ** 256
+
+    def __init__(self) -> None:
+        self.total = 0
+
+    def update(self, rows: List[dict]):
+        for row in rows:
+            row_bytes = json.dumps(row, sort_keys=True, separators=(',', ':')).encode('utf8')
+            self.total = (self.total + int.from_bytes(hashlib.sha256(row_bytes).digest(), 'big')) % self.MODULUS
+
+    def hash_pages(self, paged_iter: Iterator[List[dict]]) -> Iterator[List[dict]]:
+        """
+        Hash each page of a paged iterator as it is consumed.
+        """
+        for page in paged_iter:
+            self.update(page)
+            yield page
+
+    def hexdigest(self) -> str:
+        return f"{self.total:064x}"
@@ -0,0 +1,171 @@
+import atexit
+import logging
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+from airflow.providers.databricks.hooks.databricks_sql import DatabricksSqlHook
+
+
+class DatabricksConnectionPool:
+    """
+    Pool of Databricks SQL connections for one Airflow connection, shared by every thread and callable of the process.
+    Airflow runs each task in its own process, so connections are only reused within a task.
+
+    Opening a connection (TLS handshake and session setup against the warehouse) costs seconds, so connections are
+    reused across a task's statements and threads instead of opened per call. A connection idle for more than `health_check_seconds`
+    is checked with `SELECT 1` before reuse; connections idle for more than `max_idle_seconds` are closed.
+    A connection that raises while in use is discarded instead of returned to the pool.
+    At most `max_size` idle connections are kept; more may be open at once while in use.
+    """
+    def __init__(self,
+                 databricks_conn_id: str,
+                 *,
+                 max_size: int = 8,
+                 max_idle_seconds: float = 600.0,
+                 health_check_seconds: float = 60.0
+                 ) -> None:
+        self.databricks_conn_id = databricks_conn_id
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_seconds = health_check_seconds
+
+        self.lock = threading.Lock()
+        self.idle: List[Tuple[Any, float]] = []  # (connection, time returned to the pool)
+        self.num_opened = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Check out a healthy connection for the duration of the block.
+        """
+        conn = self.checkout()
+        try:
+            yield conn
+        except Exception:
+            self.close_connection(conn)
+            raise
+        else:
+            self.checkin(conn)
+
+    def checkout(self) -> Any:
+        while True:
+            with self.lock:
+                self.evict_idle()
+                if not self.idle:
+                    break
+                conn, returned_at = self.idle.pop()
+
+            if time.monotonic() - returned_at < self.health_check_seconds or self.is_healthy(conn):
+                return conn
+            self.close_connection(conn)
+
+        # Each hook caches its own connection, so a new hook is built for every connection opened.
+        conn = DatabricksSqlHook(databricks_conn_id=self.databricks_conn_id).get_conn()
+        with self.lock:
+            self.num_opened += 1
+        logging.info(f"    Opened Databricks connection {self.num_opened} for `{self.databricks_conn_id}`.")
+        return conn
+
+    def checkin(self, conn: Any):
+        with self.lock:
+            if len(self.idle) < self.max_size:
+                self.idle.append((conn, time.monotonic()))
+                return
+        self.close_connection(conn)
+
+    def evict_idle(self):
+        """
+        Close connections idle for more than `max_idle_seconds`. Called under the lock.
+        """
+        min_returned_at = time.monotonic() - self.max_idle_seconds
+        expired = [conn for conn, returned_at in self.idle if returned_at < min_returned_at]
+        self.idle = [(conn, returned_at) for conn, returned_at in self.idle if returned_at >= min_returned_at]
+
+        for conn in expired:
+            self.close_connection(conn)
+
+    @staticmethod
+    def is_healthy(conn: Any) -> bool:
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            return True
+        except Exception as err:
+            logging.info(f"    Discarding unhealthy Databricks connection ({err})")
+            return False
+
+    @staticmethod
+    def close_connection(conn: Any):
+        try:
+            conn.close()
+        except Exception:
+            pass  # The connection is already unusable.
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for conn, _ in idle:
+            self.close_connection(conn)
+
+    def run(self, sql: Union[str, List[str]]):
+        """
+        Run one or more statements in order over a single pooled connection (i.e., one session).
+        """
+        if isinstance(sql, str):
+            sql = [sql]
+
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                for statement in sql:
+                    cursor.execute(statement)
+
+    def get_records(self, sql: str) -> List[tuple]:
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql)
+                return [tuple(row) for row in cursor.fetchall()]
+
+    def insert_rows(self, table: str, rows: List[list], target_fields: List[str]):
+        """
+        Insert rows in a single multi-row INSERT statement, binding every value as a named parameter.
+        """
+        parameters: Dict[str, Any] = {}
+        row_markers = []
+
+        for row_idx, row in enumerate(rows):
+            markers = []
+            for col_idx, cell in enumerate(row):
+                parameters[f"r{row_idx}c{col_idx}"] = cell
+                markers.append(f":r{row_idx}c{col_idx}")
+            row_markers.append(f"({', '.join(markers)})")
+
+        sql = f"INSERT INTO {table} ({', '.join(target_fields)}) VALUES\n" + ",\n".join(row_markers)
+
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, parameters)
+
+
+_pools: Dict[str, DatabricksConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_databricks_pool(databricks_conn_id: str) -> DatabricksConnectionPool:
+    """
+    Return the process-wide connection pool of a Databricks connection, creating it on first use.
+    """
+    with _pools_lock:
+        if databricks_conn_id not in _pools:
+            _pools[databricks_conn_id] = DatabricksConnectionPool(databricks_conn_id)
+        return _pools[databricks_conn_id]
+
+
+@atexit.register
+def close_databricks_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
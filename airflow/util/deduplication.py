@@ -0,0 +1,170 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class RecordDeduplicator:
+    """
+    Drop Ed-Fi records whose `id` has already been written at the same or a newer version.
+
+    Records updated mid-pull can be returned in more than one change-version window (or page, with reverse paging).
+    Each record's `id` is reduced to a 64-bit hash and mapped to its version: `changeVersion` for deletes/key-changes,
+    otherwise `_lastModifiedDate`. A repeated `id` is dropped unless its version is newer than the one already written.
+    (Output is streamed, so an older copy that has already been written cannot be removed; the newer copy is also kept.)
+    Records without an `id` are always kept.
+
+    Versions are kept in a dict until `max_memory_keys` ids have been seen, then spilled to a SQLite file at `spill_path`.
+    Pages may be filtered from several window threads at once, so all lookups are made under a lock.
+    Pages filtered within an `attempt()` are rolled back if the attempt fails, so a retried window is not deduplicated against itself.
+    """
+    def __init__(self, spill_path: str, *, max_memory_keys: int = 1000000) -> None:
+        self.spill_path = spill_path
+        self.max_memory_keys = max_memory_keys
+
+        self.lock = threading.Lock()
+        self.versions: Dict[int, str] = {}
+        self.db: Optional[sqlite3.Connection] = None
+        self.num_dropped = 0
+
+    @staticmethod
+    def hash_id(record_id: str) -> int:
+        return int.from_bytes(hashlib.blake2b(record_id.encode('utf8'), digest_size=8).digest(), 'big', signed=True)
+
+    @staticmethod
+    def get_version(row: dict) -> str:
+        version = row.get('changeVersion', row.get('_lastModifiedDate'))
+
+        if version is None:
+            return ''
+        if isinstance(version, int):
+            return f"{version:020d}"  # Zero-pad so change versions compare correctly as strings.
+        return str(version)
+
+    @contextmanager
+    def attempt(self) -> Iterator['DeduplicationAttempt']:
+        """
+        Yield a filter whose recorded versions (and dropped rows) are undone if the block raises.
+        """
+        attempt = DeduplicationAttempt(self)
+        try:
+            yield attempt
+        except Exception:
+            self.rollback(attempt)
+            raise
+
+    def filter(self, rows: Iterable[dict], undo_log: Optional[List[Tuple[int, Optional[str]]]] = None) -> List[dict]:
+        """
+        Return the rows of a page that have not already been written at the same or a newer version.
+        If an undo log is passed, the previous version of every id recorded is appended to it.
+        """
+        rows = list(rows)
+        keys = [
+            (self.hash_id(row['id']), self.get_version(row)) if row.get('id') else None
+            for row in rows
+        ]
+
+        with self.lock:
+            seen = self.lookup([key[0] for key in keys if key])
+            updates = {}
+            output = []
+
+            for row, key in zip(rows, keys):
+                if key is None:
+                    output.append(row)
+                    continue
+
+                id_hash, version = key
+                previous_version = updates.get(id_hash, seen.get(id_hash))
+
+                if previous_version is not None and version <= previous_version:
+                    self.num_dropped += 1
+                    continue
+
+                if undo_log is not None and id_hash not in updates:
+                    undo_log.append((id_hash, seen.get(id_hash)))
+
+                updates[id_hash] = version
+                output.append(row)
+
+            self.store(updates)
+
+        return output
+
+    def lookup(self, id_hashes: List[int]) -> Dict[int, str]:
+        if self.db is None:
+            return {id_hash: self.versions[id_hash] for id_hash in id_hashes if id_hash in self.versions}
+
+        seen = {}
+        for idx in range(0, len(id_hashes), 500):  # Stay under SQLite's limit on query parameters.
+            chunk = id_hashes[idx: idx + 500]
+            seen.update(self.db.execute(
+                f"select id_hash, version from versions where id_hash in ({', '.join('?' * len(chunk))})", chunk
+            ))
+        return seen
+
+    def store(self, updates: Dict[int, str]):
+        if self.db is None:
+            self.versions.update(updates)
+            if len(self.versions) > self.max_memory_keys:
+                self.spill()
+        else:
+            self.db.executemany("insert or replace into versions values (?, ?)", updates.items())
+
+    def rollback(self, attempt: 'DeduplicationAttempt'):
+        with self.lock:
+            self.num_dropped -= attempt.num_dropped
+
+            for id_hash, version in reversed(attempt.undo_log):
+                if self.db is None:
+                    if version is None:
+                        self.versions.pop(id_hash, None)
+                    else:
+                        self.versions[id_hash] = version
+                elif version is None:
+                    self.db.execute("delete from versions where id_hash = ?", (id_hash,))
+                else:
+                    self.db.execute("insert or replace into versions values (?, ?)", (id_hash, version))
+
+    def spill(self):
+        logging.info(f"    Spilling {len(self.versions)} record ids to `{self.spill_path}`")
+        os.makedirs(os.path.dirname(self.spill_path), exist_ok=True)
+
+        self.db = sqlite3.connect(self.spill_path, check_same_thread=False, isolation_level=None)
+        self.db.execute("pragma journal_mode = off")
+        self.db.execute("pragma synchronous = off")
+        self.db.execute("create table if not exists versions (id_hash integer primary key, version text)")
+        self.db.executemany("insert or replace into versions values (?, ?)", self.versions.items())
+        self.versions = {}
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+            try:
+                os.remove(self.spill_path)
+            except FileNotFoundError:
+                pass
+
+        if self.num_dropped:
+            logging.info(f"    Dropped {self.num_dropped} duplicate records.")
+
+
+class DeduplicationAttempt:
+    """
+    Filter pages through a `RecordDeduplicator`, keeping what is needed to undo them if the attempt fails.
+    """
+    def __init__(self, deduplicator: RecordDeduplicator) -> None:
+        self.deduplicator = deduplicator
+        self.undo_log: List[Tuple[int, Optional[str]]] = []
+        self.num_dropped = 0
+
+    def filter(self, rows: Iterable[dict]) -> List[dict]:
+        rows = list(rows)
+        output = self.deduplicator.filter(rows, undo_log=self.undo_log)
+        self.num_dropped += len(rows) - len(output)
+        return output
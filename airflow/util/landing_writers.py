@@ -0,0 +1,499 @@
+import io
+import json
+import logging
+import os
+import shutil
+
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from tn_edu_airflow.util.serializers import get_serializer
+
+
+class SinkFile(io.RawIOBase):
+    """
+    Minimal writable file object over an output sink, for libraries that require file semantics (e.g., `tell()`).
+    """
+    def __init__(self, sink) -> None:
+        super().__init__()
+        self.sink = sink
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.sink.write(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+
+class JsonlLandingWriter:
+    """
+    Write pages of rows to an output sink as JSON lines.
+    """
+    def __init__(self, sink, *, serializer: str = 'json') -> None:
+        self.sink = sink
+        self.serializer = get_serializer(serializer)
+
+    @property
+    def bytes_written(self) -> int:
+        """
+        Number of bytes of rows serialized by `write_rows()` (before any compression or Parquet conversion).
+        """
+        return self.serializer.bytes_written
+
+    def write_rows(self, rows: Iterable[dict]) -> int:
+        return self.serializer.write_rows(rows, self.sink)
+
+    def write_jsonl(self, fp: BinaryIO):
+        """
+        Append already-serialized JSON lines (e.g., a change-version window file) to the output.
+        """
+        shutil.copyfileobj(fp, self.sink)
+
+    def commit(self):
+        self.sink.commit()
+
+    def abort(self):
+        self.sink.abort()
+
+
+class ParquetLandingWriter(JsonlLandingWriter):
+    """
+    Write pages of rows to an output sink as a single Parquet file.
+
+    Nested Ed-Fi references and collections are kept as struct and list columns.
+    Ed-Fi records are not uniform (e.g., optional fields that are null for the first thousands of rows),
+    so a schema inferred from the first batch alone is not safe to write every row group with.
+    Rows are instead spooled to `spool_path` as JSON lines while pulling.
+    On `commit()`, the spool is read twice in batches of `row_group_size` rows:
+    once to infer the type of every field across all rows, then again to write one row group per batch.
+
+    Fields are typed so that the variant parsed from the Parquet file matches the one parsed from JSON lines:
+    integers and floats in the same field are landed as doubles, and scalars of mixed types (e.g., a number in one row
+    and a string in another) as their JSON text. Structs and lists keep their nested fields, however sparse.
+    Empty structs (e.g., `_ext: {}`) cannot be written to Parquet, so they are dropped.
+    Only a field that is a struct or list in one row and a scalar in another is landed as a JSON string (with a warning).
+    """
+    def __init__(self,
+                 sink,
+                 *,
+                 spool_path: str,
+                 serializer: str = 'json',
+                 compression: Optional[str] = None,
+                 row_group_size: int = 50000
+                 ) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Package `pyarrow` must be installed to land Parquet files.")
+
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+
+        self.sink = sink
+        self.spool_path = spool_path
+        self.serializer = get_serializer(serializer)
+        self.compression = compression or 'snappy'
+        self.row_group_size = row_group_size
+
+        os.makedirs(os.path.dirname(self.spool_path), exist_ok=True)  # Create its parent-directory in not extant.
+        self.spool = open(self.spool_path, 'wb')
+
+    def write_rows(self, rows: Iterable[dict]) -> int:
+        return self.serializer.write_rows(rows, self.spool)
+
+    def write_jsonl(self, fp: BinaryIO):
+        shutil.copyfileobj(fp, self.spool)
+
+    def commit(self):
+        """
+        Convert the spooled rows to Parquet, write them to the sink, and finalize the sink.
+        """
+        self.spool.close()
+
+        try:
+            row_type = ('struct', {})
+            for batch in self.iter_spool_batches():
+                for row in batch:
+                    row_type = self.merge_types(row_type, self.infer_type(row))
+
+            row_arrow_type = self.to_arrow_type(row_type)
+            schema = self.pa.schema(
+                [row_arrow_type.field(idx) for idx in range(row_arrow_type.num_fields)] if row_arrow_type else []
+            )
+
+            if json_fields := self.find_fields(row_type, 'json'):
+                logging.warning(f"    Fields are structured in some rows and scalar in others; landing as JSON strings: {json_fields}")
+
+            # Rows only need converting if any field (at any depth) is landed as text; Arrow drops keys not in the schema.
+            needs_conversion = bool(json_fields or self.find_fields(row_type, 'text'))
+
+            writer = self.pq.ParquetWriter(SinkFile(self.sink), schema, compression=self.compression)
+            num_row_groups = 0
+
+            for batch in self.iter_spool_batches():
+                if needs_conversion:
+                    batch = [self.conform_value(row, row_type) for row in batch]
+                writer.write_table(self.pa.Table.from_pylist(batch, schema=schema), row_group_size=self.row_group_size)
+                num_row_groups += 1
+
+            writer.close()
+            logging.info(f"    Wrote {num_row_groups} Parquet row groups with {len(schema)} top-level columns.")
+
+        except Exception as err:
+            self.sink.abort()
+            raise err
+
+        finally:
+            self._remove_spool()
+
+        self.sink.commit()
+
+    def abort(self):
+        self.spool.close()
+        self._remove_spool()
+        self.sink.abort()
+
+    def iter_spool_batches(self) -> Iterator[List[dict]]:
+        batch = []
+        with open(self.spool_path, 'rb') as fp:
+            for line in fp:
+                batch.append(json.loads(line))
+
+                if len(batch) >= self.row_group_size:
+                    yield batch
+                    batch = []
+
+        if batch:
+            yield batch
+
+    @classmethod
+    def infer_type(cls, value) -> Union[None, str, tuple]:
+        """
+        Infer the type of a JSON value: None (null), a scalar name (`bool`, `int`, `float`, `string`),
+        `('list', <item type>)`, or `('struct', {<field>: <field type>})`.
+        """
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            return 'bool'
+        if isinstance(value, int):
+            return 'int'
+        if isinstance(value, float):
+            return 'float'
+        if isinstance(value, str):
+            return 'string'
+
+        if isinstance(value, list):
+            item_type = None
+            for item in value:
+                item_type = cls.merge_types(item_type, cls.infer_type(item))
+            return ('list', item_type)
+
+        if isinstance(value, dict):
+            return ('struct', {key: cls.infer_type(item) for key, item in value.items()})
+
+        return 'json'
+
+    @classmethod
+    def merge_types(cls, left, right) -> Union[None, str, tuple]:
+        """
+        Merge two inferred types (merging struct fields into `left` in place).
+        Nulls take the other type, integers and floats widen to `float`, and other mixed scalars become `text`.
+        A struct or list mixed with anything else becomes `json`.
+        """
+        if left is None:
+            return right
+        if right is None or left == right:
+            return left
+
+        if isinstance(left, tuple) and isinstance(right, tuple) and left[0] == right[0]:
+            if left[0] == 'list':
+                return ('list', cls.merge_types(left[1], right[1]))
+
+            for key, field_type in right[1].items():
+                left[1][key] = cls.merge_types(left[1].get(key), field_type)
+            return left
+
+        if not (isinstance(left, str) and isinstance(right, str)) or 'json' in (left, right):
+            return 'json'
+
+        if (left, right) in (('int', 'float'), ('float', 'int')):
+            return 'float'
+
+        return 'text'
+
+    def to_arrow_type(self, data_type) -> Optional['pyarrow.DataType']:
+        """
+        Convert an inferred type to its Arrow type, or None for empty structs (and lists of them), which are dropped.
+        Fields that were null in every row have no inferable type, so they are landed as strings.
+        """
+        if data_type == 'bool':
+            return self.pa.bool_()
+        if data_type == 'int':
+            return self.pa.int64()
+        if data_type == 'float':
+            return self.pa.float64()
+
+        if isinstance(data_type, tuple) and data_type[0] == 'list':
+            item_type = self.to_arrow_type(data_type[1])
+            return None if item_type is None else self.pa.list_(item_type)
+
+        if isinstance(data_type, tuple):
+            fields = [
+                self.pa.field(key, arrow_type) for key, field_type in data_type[1].items()
+                if (arrow_type := self.to_arrow_type(field_type)) is not None
+            ]
+            return self.pa.struct(fields) if fields else None
+
+        return self.pa.string()
+
+    @classmethod
+    def find_fields(cls, data_type, scalar_type: str, path: str = '') -> List[str]:
+        """
+        Return the dotted paths of the fields of a scalar type (e.g., `json`) at any depth.
+        """
+        if data_type == scalar_type:
+            return [path]
+        if isinstance(data_type, tuple) and data_type[0] == 'list':
+            return cls.find_fields(data_type[1], scalar_type, f"{path}[]")
+        if isinstance(data_type, tuple):
+            return [
+                field_path for key, field_type in data_type[1].items()
+                for field_path in cls.find_fields(field_type, scalar_type, f"{path}.{key}" if path else key)
+            ]
+        return []
+
+    @classmethod
+    def conform_value(cls, value, data_type):
+        """
+        Convert the values of `text` fields to their JSON text (strings are kept as-is), and of `json` fields to JSON strings.
+        """
+        if value is None:
+            return None
+
+        if data_type in ('text', 'json'):
+            return value if isinstance(value, str) else json.dumps(value)
+
+        if isinstance(data_type, tuple) and data_type[0] == 'list':
+            return [cls.conform_value(item, data_type[1]) for item in value]
+
+        if isinstance(data_type, tuple):
+            return {key: cls.conform_value(value.get(key), field_type) for key, field_type in data_type[1].items()}
+
+        return value
+
+    def _remove_spool(self):
+        logging.info(f"    Removing temporary files written to `{self.spool_path}`")
+        try:
+            os.remove(self.spool_path)
+        except FileNotFoundError:
+            logging.error("File not found.")
+
+
+class RollingLandingWriter:
+    """
+    Write pages of rows across numbered part files (`{part_prefix}-00000{extension}`, `{part_prefix}-00001{extension}`, ...).
+
+    Each part is written by its own landing writer from `build_writer(part_key)`.
+    Once at least `max_part_bytes` of JSON lines have been written to a part, it is committed and a new part is started.
+    (With compression or Parquet, the cap applies to the JSON lines before conversion, so landed parts are smaller.)
+    Committed parts are deleted with `delete_part(part_key)` if the writer is aborted.
+    """
+    def __init__(self,
+                 build_writer: Callable[[str], JsonlLandingWriter],
+                 *,
+                 part_prefix: str,
+                 part_extension: str,
+                 max_part_bytes: int,
+                 delete_part: Callable[[str], None]
+                 ) -> None:
+        self.build_writer = build_writer
+        self.part_prefix = part_prefix
+        self.part_extension = part_extension
+        self.max_part_bytes = max_part_bytes
+        self.delete_part = delete_part
+
+        self.committed_keys: List[str] = []
+        self.writer: Optional[JsonlLandingWriter] = None
+        self.part_bytes = 0
+        self.bytes_written = 0
+
+    @property
+    def part_key(self) -> str:
+        return f"{self.part_prefix}-{len(self.committed_keys):05d}{self.part_extension}"
+
+    def current_writer(self) -> JsonlLandingWriter:
+        if self.writer is None:
+            self.writer = self.build_writer(self.part_key)
+            self.part_bytes = 0
+        return self.writer
+
+    def write_rows(self, rows: Iterable[dict]) -> int:
+        writer = self.current_writer()
+
+        start_bytes = writer.bytes_written
+        num_rows = writer.write_rows(rows)
+        self.add_bytes(writer.bytes_written - start_bytes)
+
+        return num_rows
+
+    def write_jsonl(self, fp: BinaryIO, chunk_size: int = 8 * 1024 * 1024):
+        """
+        Append already-serialized JSON lines, rolling between chunks of whole lines.
+        """
+        while lines := fp.readlines(chunk_size):
+            chunk = b''.join(lines)
+            self.current_writer().write_jsonl(io.BytesIO(chunk))
+            self.add_bytes(len(chunk))
+
+    def add_bytes(self, num_bytes: int):
+        self.part_bytes += num_bytes
+        self.bytes_written += num_bytes
+
+        if self.part_bytes >= self.max_part_bytes:
+            self.commit_part()
+
+    def commit_part(self):
+        part_key = self.part_key
+        self.writer.commit()
+        self.committed_keys.append(part_key)
+        self.writer = None
+        logging.info(f"    Landed part file `{part_key}` ({self.part_bytes} bytes of JSON lines)")
+
+    def commit(self):
+        if self.writer is not None and self.part_bytes:
+            self.commit_part()
+        elif self.writer is not None:
+            self.writer.abort()  # Never land an empty trailing part.
+            self.writer = None
+
+    def abort(self):
+        if self.writer is not None:
+            self.writer.abort()
+            self.writer = None
+
+        for part_key in self.committed_keys:
+            self.delete_part(part_key)
+        self.committed_keys = []
+
+
+class SchoolYearRoutingWriter:
+    """
+    Route pages of rows into one landing writer per school year, from a single pull of a multi-year ODS.
+
+    Each row's year is the one the ODS `schoolYear` filter matches on: its own `schoolYear`,
+    else that of the first of `SCHOOL_YEAR_REFERENCES` it holds. Other year-bearing references
+    (e.g., `classOfSchoolYearTypeReference`, a graduation cohort) are never used.
+    Rows without a school year (e.g., students or deletes) are written to every year, as a year-filtered pull would return them.
+    Rows for years outside `school_years` are dropped.
+    Each year's writer is only built once it receives a row, from `build_writer(school_year)`.
+    If any year fails to commit, every year is aborted or deleted with `delete_year(school_year)`.
+    """
+    SCHOOL_YEAR_REFERENCES = ('schoolYearTypeReference', 'sessionReference', 'calendarReference', 'calendarDateReference')
+
+    def __init__(self,
+                 build_writer: Callable[[int], JsonlLandingWriter],
+                 *,
+                 school_years: List[int],
+                 delete_year: Callable[[int], None]
+                 ) -> None:
+        self.build_writer = build_writer
+        self.school_years = [int(school_year) for school_year in school_years]
+        self.delete_year = delete_year
+
+        self.writers: Dict[int, JsonlLandingWriter] = {}
+        self.num_dropped = 0
+
+    @property
+    def bytes_written(self) -> int:
+        return sum(writer.bytes_written for writer in self.writers.values())
+
+    @property
+    def landed_years(self) -> List[int]:
+        return sorted(self.writers.keys())
+
+    @classmethod
+    def get_school_year(cls, row: dict) -> Optional[int]:
+        if row.get('schoolYear') is not None:
+            return int(row['schoolYear'])
+
+        for reference_name in cls.SCHOOL_YEAR_REFERENCES:
+            reference = row.get(reference_name)
+            if isinstance(reference, dict) and reference.get('schoolYear') is not None:
+                return int(reference['schoolYear'])
+
+        return None
+
+    def write_rows(self, rows: Iterable[dict]) -> int:
+        """
+        Route the rows to their years' writers, and return the number of rows received.
+        """
+        year_rows = {school_year: [] for school_year in self.school_years}
+        num_rows = 0
+
+        for row in rows:
+            num_rows += 1
+            school_year = self.get_school_year(row)
+
+            if school_year is None:
+                for rows_to_write in year_rows.values():
+                    rows_to_write.append(row)
+            elif school_year in year_rows:
+                year_rows[school_year].append(row)
+            else:
+                self.num_dropped += 1
+
+        for school_year, rows_to_write in year_rows.items():
+            if rows_to_write:
+                if school_year not in self.writers:
+                    self.writers[school_year] = self.build_writer(school_year)
+                self.writers[school_year].write_rows(rows_to_write)
+
+        return num_rows
+
+    def write_jsonl(self, fp: BinaryIO, batch_size: int = 10000):
+        """
+        Route already-serialized JSON lines (e.g., a change-version window file), in batches of rows.
+        """
+        batch = []
+        for line in fp:
+            batch.append(json.loads(line))
+
+            if len(batch) >= batch_size:
+                self.write_rows(batch)
+                batch = []
+
+        if batch:
+            self.write_rows(batch)
+
+    def commit(self):
+        if self.num_dropped:
+            logging.info(f"    Dropped {self.num_dropped} rows for school years outside {self.school_years}.")
+
+        committed_years = []
+        try:
+            for school_year in self.landed_years:
+                self.writers[school_year].commit()
+                committed_years.append(school_year)
+
+        # Never leave some years landed without the others.
+        except Exception:
+            for school_year, writer in self.writers.items():
+                if school_year not in committed_years:
+                    writer.abort()
+            for school_year in committed_years:
+                self.delete_year(school_year)
+
+            self.writers = {}
+            raise
+
+    def abort(self):
+        for writer in self.writers.values():
+            writer.abort()
+        self.writers = {}
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+
+from typing import Iterator, TypeVar
+
+T = TypeVar('T')
+
+
+class AdaptivePageSizeController:
+    """
+    Additive-increase/multiplicative-decrease (AIMD) controller for Ed-Fi page sizes.
+
+    After each change-version window, the mean request time and payload size per page are compared against targets.
+    If either is over target, the page size is cut by `decrease_factor`; otherwise it grows by `increase_step`.
+    Failed requests (`backoff()`) also cut the page size, so a retried window asks the ODS for less at a time.
+    The page size always stays within [`min_page_size`, `max_page_size`].
+
+    Observations may arrive from several window threads at once, so all updates are made under a lock.
+    """
+    def __init__(self,
+                 page_size: int,
+                 *,
+                 min_page_size: int = 100,
+                 max_page_size: int = 500,
+                 target_page_seconds: float = 5.0,
+                 max_page_mb: float = 16.0,
+                 increase_step: int = 100,
+                 decrease_factor: float = 0.5
+                 ) -> None:
+        if not 0 < min_page_size <= max_page_size:
+            raise ValueError("Adaptive page sizes require `0 < min_page_size <= max_page_size`.")
+
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.target_page_seconds = target_page_seconds
+        self.max_page_bytes = max_page_mb * 1024 ** 2
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self.lock = threading.Lock()
+        self.page_size = self.clamp(page_size)
+
+    def clamp(self, page_size: int) -> int:
+        return max(self.min_page_size, min(self.max_page_size, int(page_size)))
+
+    def observe_window(self, *, num_pages: int, request_seconds: float, num_bytes: int):
+        """
+        Update the page size from the mean request time and payload size of a completed window.
+        """
+        if not num_pages:
+            return
+
+        seconds_per_page = request_seconds / num_pages
+        bytes_per_page = num_bytes / num_pages
+
+        with self.lock:
+            previous_page_size = self.page_size
+
+            if seconds_per_page > self.target_page_seconds or bytes_per_page > self.max_page_bytes:
+                self.page_size = self.clamp(self.page_size * self.decrease_factor)
+            else:
+                self.page_size = self.clamp(self.page_size + self.increase_step)
+
+            if self.page_size != previous_page_size:
+                logging.info(
+                    f"    Page size {previous_page_size} -> {self.page_size} "
+                    f"({seconds_per_page:.2f} sec/page; {bytes_per_page / 1024:.0f} KB/page)"
+                )
+
+    def backoff(self) -> bool:
+        """
+        Cut the page size after a failed request. Return False if it is already at the minimum.
+        """
+        with self.lock:
+            if self.page_size <= self.min_page_size:
+                return False
+
+            self.page_size = self.clamp(self.page_size * self.decrease_factor)
+            logging.warning(f"    Request failed. Reducing page size to {self.page_size}.")
+            return True
+
+
+class RequestTimer:
+    """
+    Time spent inside the requests of a paged iterator (e.g., `get_pages()`).
+
+    Wrap the underlying iterator before any rate limiter, so time spent waiting on local throttling
+    is not counted as ODS latency (which would shrink pages and only cause more requests to throttle).
+    """
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def time(self, iterator: Iterator[T]) -> Iterator[T]:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.seconds += time.perf_counter() - start
+
+            yield item
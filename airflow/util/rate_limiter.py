@@ -0,0 +1,155 @@
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+from contextlib import contextmanager
+from typing import Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class ODSRateLimiter:
+    """
+    Token-bucket rate limiter and concurrency cap for one Ed-Fi ODS, shared by every process on the worker.
+
+    Limiter state (available tokens and in-flight requests) is kept in a JSON file named for the ODS base URL,
+    read and updated under an exclusive `fcntl` lock. Tasks of every DAG that hit the same ODS therefore share one budget.
+    Requests held by processes that are no longer running are released automatically.
+
+    Each request waits until a token is available (`requests_per_second`, with bursts of up to `burst` requests)
+    and fewer than `max_concurrent_requests` requests are in flight. Time spent waiting is tracked in `wait_seconds`.
+    """
+    def __init__(self,
+                 base_url: str,
+                 *,
+                 requests_per_second: Optional[float] = None,
+                 max_concurrent_requests: Optional[int] = None,
+                 burst: Optional[int] = None,
+                 state_dir: str = "/tmp/edfi_rate_limits",
+                 poll_seconds: float = 0.05
+                 ) -> None:
+        self.base_url = base_url
+        self.requests_per_second = requests_per_second
+        self.max_concurrent_requests = max_concurrent_requests
+        self.burst = burst or max(1, int(requests_per_second or 1))
+        self.poll_seconds = poll_seconds
+
+        os.makedirs(state_dir, exist_ok=True)
+        url_hash = hashlib.sha1(base_url.encode('utf8')).hexdigest()[:16]
+        self.state_path = os.path.join(state_dir, f"{url_hash}.json")
+
+        self.lock = threading.Lock()  # Guards the counters below across threads of this process.
+        self.wait_seconds = 0.0
+        self.num_requests = 0
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """
+        Hold a request slot for the duration of the block.
+        """
+        holder = self.acquire()
+        try:
+            yield
+        finally:
+            self.release(holder)
+
+    def throttle(self, iterator: Iterator[T]) -> Iterator[T]:
+        """
+        Wrap an iterator that makes one request per item (e.g., `get_pages()`) so every request is rate-limited.
+        """
+        while True:
+            with self.request():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+
+            yield item
+
+    def acquire(self) -> str:
+        holder = f"{os.getpid()}:{uuid.uuid4().hex}"
+        start = time.monotonic()
+
+        while True:
+            with self.locked_state() as state:
+                self.refill(state)
+                self.release_dead_holders(state)
+
+                has_token = self.requests_per_second is None or state['tokens'] >= 1
+                has_slot = self.max_concurrent_requests is None or len(state['in_flight']) < self.max_concurrent_requests
+
+                if has_token and has_slot:
+                    if self.requests_per_second is not None:
+                        state['tokens'] -= 1
+                    state['in_flight'][holder] = time.time()
+                    break
+
+                # Sleep until the next token is due, or poll for a free slot.
+                if not has_token:
+                    sleep_seconds = (1 - state['tokens']) / self.requests_per_second
+                else:
+                    sleep_seconds = self.poll_seconds
+
+            time.sleep(max(sleep_seconds, self.poll_seconds))
+
+        with self.lock:
+            self.wait_seconds += time.monotonic() - start
+            self.num_requests += 1
+
+        return holder
+
+    def release(self, holder: str):
+        with self.locked_state() as state:
+            state['in_flight'].pop(holder, None)
+
+    def refill(self, state: dict):
+        now = time.time()
+        if self.requests_per_second is not None:
+            elapsed = max(now - state['updated'], 0.0)
+            state['tokens'] = min(self.burst, state['tokens'] + elapsed * self.requests_per_second)
+        state['updated'] = now
+
+    @staticmethod
+    def release_dead_holders(state: dict):
+        for holder in list(state['in_flight']):
+            pid = int(holder.split(':')[0])
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                state['in_flight'].pop(holder)
+            except PermissionError:
+                pass  # The process exists, but belongs to another user.
+
+    @contextmanager
+    def locked_state(self) -> Iterator[dict]:
+        """
+        Read the shared state under an exclusive lock, and write it back when the block exits.
+        """
+        with open(self.state_path, 'a+') as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                fp.seek(0)
+                try:
+                    state = json.loads(fp.read())
+                except ValueError:  # A new (or unreadable) state file starts with a full bucket.
+                    state = {'tokens': self.burst, 'updated': time.time(), 'in_flight': {}}
+
+                yield state
+
+                fp.seek(0)
+                fp.truncate()
+                fp.write(json.dumps(state))
+                fp.flush()
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+
+    def log_wait_time(self):
+        if self.num_requests:
+            logging.info(
+                f"    Waited {self.wait_seconds:.1f} seconds on the `{self.base_url}` rate limit over {self.num_requests} requests."
+            )
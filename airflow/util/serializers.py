@@ -0,0 +1,94 @@
+import json
+
+from typing import Iterable
+
+
+class JsonlSerializer:
+    """
+    Serialize rows as JSON lines into a reusable output buffer using the standard-library `json` module.
+
+    The buffer is cleared and refilled on every call to `write_rows()`, then written to the output in one call.
+    The running total of bytes written is kept in `bytes_written`.
+    Serializers are not thread-safe; create one per thread.
+    """
+    name = 'json'
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.encoder = json.JSONEncoder()
+        self.bytes_written = 0
+
+    def write_rows(self, rows: Iterable[dict], output) -> int:
+        """
+        Serialize `rows` and write them to any file-like `output`. Return the number of rows written.
+        """
+        self.buffer.clear()
+
+        num_rows = 0
+        for row in rows:
+            self.encode_row(row)
+            self.buffer.extend(b'\n')
+            num_rows += 1
+
+        output.write(self.buffer)
+        self.bytes_written += len(self.buffer)
+        return num_rows
+
+    def encode_row(self, row: dict):
+        self.buffer.extend(self.encoder.encode(row).encode('utf8'))
+
+
+class OrjsonSerializer(JsonlSerializer):
+    """
+    Serialize rows using `orjson`, which returns UTF-8 bytes directly.
+    """
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError("Package `orjson` must be installed to use the `orjson` serializer.")
+
+        self.dumps = orjson.dumps
+
+    def encode_row(self, row: dict):
+        self.buffer.extend(self.dumps(row))
+
+
+class MsgspecSerializer(JsonlSerializer):
+    """
+    Serialize rows using `msgspec`, which encodes each row in place at the end of the output buffer.
+    """
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError("Package `msgspec` must be installed to use the `msgspec` serializer.")
+
+        self.msgspec_encoder = msgspec.json.Encoder()
+
+    def encode_row(self, row: dict):
+        self.msgspec_encoder.encode_into(row, self.buffer, -1)  # An offset of -1 appends to the buffer.
+
+
+SERIALIZERS = {
+    serializer.name: serializer
+    for serializer in (JsonlSerializer, OrjsonSerializer, MsgspecSerializer)
+}
+
+
+def get_serializer(name: str = 'json') -> JsonlSerializer:
+    """
+    Initialize a new serializer by name.
+    """
+    if name not in SERIALIZERS:
+        raise ValueError(f"Serializer `{name}` is not one of the expected values: {list(SERIALIZERS.keys())}.")
+
+    return SERIALIZERS[name]()
@@ -0,0 +1,235 @@
+import fcntl
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class SpillSpaceManager:
+    """
+    Disk-space reservations for the temporary files written to `tmp_dir`, shared by every process on the worker.
+
+    Reservations are kept in a JSON file in `tmp_dir`, read and updated under an exclusive `fcntl` lock.
+    Each pull reserves `reserve_mb` before writing; it waits (backing off up to `max_poll_seconds`) while
+    the reservations of other pulls would exceed `quota_mb`, or the disk has less than `min_free_mb` free beyond the reservation.
+    A reservation is always granted if no others are held, so a single pull is never blocked by its own size.
+
+    Each reservation records the temporary paths it writes to. When a reservation's process is no longer running,
+    its files are removed and the reservation is released. On startup, files older than `orphan_hours` that are not
+    claimed by a running reservation are also removed (e.g., those left by a worker that crashed).
+    """
+    STATE_FILENAME = ".spill_space.json"
+
+    def __init__(self,
+                 tmp_dir: str,
+                 *,
+                 quota_mb: Optional[float] = None,
+                 reserve_mb: float = 1024,
+                 min_free_mb: float = 1024,
+                 orphan_hours: Optional[float] = 24,
+                 poll_seconds: float = 1.0,
+                 max_poll_seconds: float = 60.0,
+                 max_wait_seconds: float = 3600.0
+                 ) -> None:
+        self.tmp_dir = tmp_dir
+        self.quota_bytes = int(quota_mb * 1024 ** 2) if quota_mb else None
+        self.reserve_bytes = int(reserve_mb * 1024 ** 2)
+        self.min_free_bytes = int(min_free_mb * 1024 ** 2)
+        self.poll_seconds = poll_seconds
+        self.max_poll_seconds = max_poll_seconds
+        self.max_wait_seconds = max_wait_seconds
+
+        os.makedirs(tmp_dir, exist_ok=True)
+        self.state_path = os.path.join(tmp_dir, self.STATE_FILENAME)
+
+        self.lock = threading.Lock()  # Guards the counter below across threads of this process.
+        self.wait_seconds = 0.0
+
+        with self.locked_state() as state:
+            self.release_dead_holders(state)
+            if orphan_hours is not None:
+                self.remove_orphaned_files(state, max_age_seconds=orphan_hours * 3600)
+
+    @contextmanager
+    def reserve(self, paths: List[str]) -> Iterator[None]:
+        """
+        Hold a reservation for the temporary files written under `paths` for the duration of the block.
+        """
+        holder = self.acquire(paths)
+        try:
+            yield
+        finally:
+            self.release(holder)
+
+    def acquire(self, paths: List[str]) -> str:
+        holder = f"{os.getpid()}:{uuid.uuid4().hex}"
+        start = time.monotonic()
+        sleep_seconds = self.poll_seconds
+
+        while True:
+            with self.locked_state() as state:
+                self.release_dead_holders(state)
+
+                reserved_bytes = self.get_reserved_bytes(state)
+                free_bytes = shutil.disk_usage(self.tmp_dir).free
+
+                has_quota = self.quota_bytes is None or reserved_bytes + self.reserve_bytes <= self.quota_bytes
+                has_disk = free_bytes - self.reserve_bytes >= self.min_free_bytes
+
+                if not state['reservations'] or (has_quota and has_disk):
+                    state['reservations'][holder] = {'bytes': self.reserve_bytes, 'paths': paths, 'since': time.time()}
+                    break
+
+            waited_seconds = time.monotonic() - start
+            if waited_seconds > self.max_wait_seconds:
+                raise TimeoutError(
+                    f"Unable to reserve {self.reserve_bytes / 1024 ** 2:.0f} MB in `{self.tmp_dir}` after {waited_seconds:.0f} seconds."
+                )
+
+            logging.info(
+                f"    Waiting on spill space in `{self.tmp_dir}` "
+                f"({reserved_bytes / 1024 ** 2:.0f} MB reserved; {free_bytes / 1024 ** 2:.0f} MB free)."
+            )
+            time.sleep(sleep_seconds)
+            sleep_seconds = min(sleep_seconds * 2, self.max_poll_seconds)
+
+        with self.lock:
+            self.wait_seconds += time.monotonic() - start
+
+        return holder
+
+    def release(self, holder: str):
+        with self.locked_state() as state:
+            reservation = state['reservations'].pop(holder, None)
+
+            # Clear anything the pull left behind (e.g., after a failure), unless the path is claimed again.
+            if reservation:
+                self.remove_paths(reservation['paths'], claimed_paths=self.get_claimed_paths(state))
+
+    def usage(self) -> Dict[str, int]:
+        """
+        Return the bytes reserved in `tmp_dir`, the number of reservations, and the bytes used and free on its disk.
+        """
+        with self.locked_state() as state:
+            self.release_dead_holders(state)
+            reservations = state['reservations']
+
+        disk_usage = shutil.disk_usage(self.tmp_dir)
+        return {
+            'reserved_bytes': self.get_reserved_bytes({'reservations': reservations}),
+            'num_reservations': len(reservations),
+            'used_bytes': disk_usage.used,
+            'free_bytes': disk_usage.free,
+        }
+
+    def log_usage(self):
+        usage = self.usage()
+        logging.info(
+            f"    Spill space in `{self.tmp_dir}`: {usage['reserved_bytes'] / 1024 ** 2:.0f} MB reserved by {usage['num_reservations']} pulls; "
+            f"{usage['used_bytes'] / 1024 ** 2:.0f} MB used; {usage['free_bytes'] / 1024 ** 2:.0f} MB free."
+        )
+
+    @staticmethod
+    def get_reserved_bytes(state: dict) -> int:
+        return sum(reservation['bytes'] for reservation in state['reservations'].values())
+
+    def release_dead_holders(self, state: dict):
+        for holder in list(state['reservations']):
+            pid = int(holder.split(':')[0])
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                reservation = state['reservations'].pop(holder)
+                logging.info(f"    Removing spill files of exited process {pid}.")
+                self.remove_paths(reservation['paths'], claimed_paths=self.get_claimed_paths(state))
+            except PermissionError:
+                pass  # The process exists, but belongs to another user.
+
+    def remove_orphaned_files(self, state: dict, max_age_seconds: float):
+        """
+        Remove files older than `max_age_seconds` that are not claimed by a running reservation.
+        """
+        claimed_paths = self.get_claimed_paths(state)
+        min_mtime = time.time() - max_age_seconds
+
+        for parent_dir, _, filenames in os.walk(self.tmp_dir):
+            for filename in filenames:
+                path = os.path.join(parent_dir, filename)
+
+                if path == self.state_path or self.is_claimed(path, claimed_paths):
+                    continue
+
+                try:
+                    if os.path.getmtime(path) < min_mtime:
+                        logging.info(f"    Removing orphaned spill file `{path}`")
+                        os.remove(path)
+                except FileNotFoundError:
+                    pass  # Removed by its own process in the meantime.
+
+    @staticmethod
+    def get_claimed_paths(state: dict) -> List[str]:
+        return [path for reservation in state['reservations'].values() for path in reservation['paths']]
+
+    @staticmethod
+    def is_claimed(path: str, claimed_paths: List[str]) -> bool:
+        """
+        A path is claimed by a reservation of `{tmp_file}` if it is the file, one of its suffixed siblings
+        (e.g., `.spool` or `.window00001`), or a file beneath it as a directory (e.g., part files).
+        """
+        return any(
+            path == claimed_path or path.startswith(claimed_path + '.') or path.startswith(claimed_path + os.sep)
+            for claimed_path in claimed_paths
+        )
+
+    def remove_paths(self, paths: List[str], claimed_paths: Optional[List[str]] = None):
+        """
+        Remove the files written under each path, leaving any still claimed by a running reservation (e.g., a task retry).
+        """
+        claimed_paths = claimed_paths or []
+
+        for path in paths:
+            if self.is_claimed(path, claimed_paths):
+                continue
+
+            parent_dir, name = os.path.split(path)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+            if not os.path.isdir(parent_dir):
+                continue
+
+            for filename in os.listdir(parent_dir):
+                if filename == name or filename.startswith(name + '.'):
+                    try:
+                        os.remove(os.path.join(parent_dir, filename))
+                    except (FileNotFoundError, IsADirectoryError):
+                        pass
+
+    @contextmanager
+    def locked_state(self) -> Iterator[dict]:
+        """
+        Read the shared state under an exclusive lock, and write it back when the block exits.
+        """
+        with open(self.state_path, 'a+') as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                fp.seek(0)
+                try:
+                    state = json.loads(fp.read())
+                except ValueError:  # A new (or unreadable) state file starts with no reservations.
+                    state = {'reservations': {}}
+
+                yield state
+
+                fp.seek(0)
+                fp.truncate()
+                fp.write(json.dumps(state))
+                fp.flush()
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
@@ -24,6 +24,9 @@ CONSTRAINT_URL="https://raw.githubusercontent.com/apache/airflow/constraints-${A
 pip install "apache-airflow[amazon, snowflake, slack, postgres, ssh, sftp]==${AIRFLOW_VERSION}" --constraint "${CONSTRAINT_URL}"  --quiet
 pip install airflow-dbt
 pip install pysftp
+pip install zstandard
+pip install orjson msgspec
+pip install pyarrow
 
 pip install edfi_api_client=="${EDFI_API_CLIENT_VERSION}"
 pip install earthmover=="${EARTHMOVER_VERSION}"
@@ -0,0 +1,19 @@
+import importlib.util
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_DIR = os.path.join(REPO_DIR, 'airflow')
+
+# The repository root would shadow the `airflow` library with the package directory of the same name.
+sys.path[:] = [path for path in sys.path if os.path.abspath(path or os.curdir) != REPO_DIR]
+
+# The `airflow` directory is deployed as the `tn_edu_airflow` package; import it from the checkout if not installed.
+try:
+    import tn_edu_airflow
+except ImportError:
+    spec = importlib.util.spec_from_file_location(
+        'tn_edu_airflow', os.path.join(PACKAGE_DIR, '__init__.py'), submodule_search_locations=[PACKAGE_DIR]
+    )
+    sys.modules['tn_edu_airflow'] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sys.modules['tn_edu_airflow'])
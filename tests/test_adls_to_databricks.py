@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("airflow.providers.databricks")
+pytest.importorskip("edu_edfi_airflow")
+
+from airflow.exceptions import AirflowFailException
+
+from tn_edu_airflow.providers.databricks.transfers.adls_to_databricks import BulkADLSToDatabricksOperator
+
+
+def build_operator(**kwargs) -> BulkADLSToDatabricksOperator:
+    return BulkADLSToDatabricksOperator(
+        task_id='copy_all_endpoints_into_databricks',
+        tenant_code='tenant', api_year=2025, resource=[], table_name=[],
+        databricks_conn_id='databricks', max_concurrent_loads=4, **kwargs
+    )
+
+
+class RecordingLoads:
+    """
+    Stand in for `run_sql_queries`, recording which endpoints of each table are loaded at the same time.
+    """
+    def __init__(self, failing_names=()):
+        self.failing_names = failing_names
+        self.lock = threading.Lock()
+        self.running = {}
+        self.max_running = {}
+        self.names = []
+
+    def __call__(self, *, name, table, adls_key, full_refresh=False, resource_tables=frozenset()):
+        with self.lock:
+            self.names.append(name)
+            self.running[table] = self.running.get(table, 0) + 1
+            self.max_running[table] = max(self.max_running.get(table, 0), self.running[table])
+        time.sleep(0.02)
+        with self.lock:
+            self.running[table] -= 1
+
+        if name in self.failing_names:
+            raise RuntimeError(f"Failed loading {name}")
+
+
+ENDPOINTS = [
+    ('academic_subject_descriptors', '_descriptors', 'descriptors/academic_subject_descriptors.jsonl'),
+    ('grade_level_descriptors', '_descriptors', 'descriptors/grade_level_descriptors.jsonl'),
+    ('sex_descriptors', '_descriptors', 'descriptors/sex_descriptors.jsonl'),
+    ('students', 'students', 'resources/students.jsonl'),
+    ('schools', 'schools', 'resources/schools.jsonl'),
+]
+
+
+@pytest.mark.parametrize("kwargs, full_refresh", [({'upsert': True}, False), ({'apply_deletes': True}, False), ({}, True)])
+def test_shared_tables_load_sequentially_unless_appending(kwargs, full_refresh):
+    operator = build_operator(**kwargs)
+    operator.run_sql_queries = loads = RecordingLoads()
+
+    operator.run_concurrent_sql_queries(ENDPOINTS, full_refresh=full_refresh)
+    assert loads.max_running['_descriptors'] == 1
+
+
+def test_appends_load_concurrently():
+    operator = build_operator()
+    operator.run_sql_queries = loads = RecordingLoads()
+
+    operator.run_concurrent_sql_queries(ENDPOINTS)
+    assert loads.max_running['_descriptors'] > 1
+
+
+def test_every_endpoint_is_attempted_before_failing():
+    operator = build_operator(upsert=True)
+    operator.run_sql_queries = loads = RecordingLoads(failing_names=('academic_subject_descriptors', 'students'))
+
+    with pytest.raises(AirflowFailException, match="academic_subject_descriptors.*students"):
+        operator.run_concurrent_sql_queries(ENDPOINTS)
+    assert sorted(loads.names) == sorted(name for name, _, _ in ENDPOINTS)
+
+
+class FakePool:
+    """
+    Stand in for the Databricks connection pool, recording the statements run.
+    """
+    def __init__(self, tables):
+        self.tables = tables
+        self.statements = []
+
+    def get_records(self, sql):
+        self.statements.append(sql)
+        return [('schema', table, False) for table in self.tables]
+
+    def run(self, sql):
+        self.statements.extend([sql] if isinstance(sql, str) else sql)
+
+
+class FakeTaskInstance:
+    def __init__(self):
+        self.xcoms = {}
+
+    def xcom_push(self, key, value):
+        self.xcoms[key] = value
+
+
+@pytest.mark.parametrize("load_kwargs", [{}, {'batch_load': True}, {'max_concurrent_loads': 4}])
+def test_existing_tables_are_listed_once_per_task(monkeypatch, load_kwargs):
+    from tn_edu_airflow.providers.databricks.transfers import adls_to_databricks
+
+    pool = FakePool(tables=['_deletes', 'students'])
+    monkeypatch.setattr(adls_to_databricks, 'get_databricks_pool', lambda databricks_conn_id: pool)
+    monkeypatch.setattr(adls_to_databricks.airflow_util, 'get_params_from_conn', lambda *args: ('db', 'schema'))
+    monkeypatch.setattr(adls_to_databricks.airflow_util, 'is_full_refresh', lambda context: False)
+
+    operator = BulkADLSToDatabricksOperator(
+        task_id='copy_all_endpoints_into_databricks',
+        tenant_code='tenant', api_year=2025, databricks_conn_id='databricks',
+        resource=['students', 'schools', 'sections'], table_name='_deletes',
+        adls_destination_key=[f'resource_deletes/{name}.jsonl' for name in ('students', 'schools', 'sections')],
+        ods_version='7.1', data_model_version='5.0', apply_deletes=True, **load_kwargs
+    )
+    task_instance = FakeTaskInstance()
+    operator.execute({'ti': task_instance})
+
+    assert sum(statement.startswith("SHOW TABLES") for statement in pool.statements) == 1
+    assert [statement.split()[2] for statement in pool.statements if statement.strip().startswith("DELETE FROM")] == ['db.schema.students']
+    assert task_instance.xcoms['loaded_tables'] == ['_deletes', 'students']
+
+
+def test_batch_load_reports_failed_endpoints(monkeypatch):
+    from tn_edu_airflow.providers.databricks.transfers import adls_to_databricks
+
+    class FailingPool(FakePool):
+        def run(self, sql):
+            if any("schools" in statement for statement in sql):
+                raise RuntimeError("COPY INTO failed")
+            super().run(sql)
+
+    pool = FailingPool(tables=[])
+    monkeypatch.setattr(adls_to_databricks, 'get_databricks_pool', lambda databricks_conn_id: pool)
+    monkeypatch.setattr(adls_to_databricks.airflow_util, 'get_params_from_conn', lambda *args: ('db', 'schema'))
+
+    operator = build_operator(batch_load=True)
+    operator.ods_version, operator.data_model_version = '7.1', '5.0'
+
+    with pytest.raises(AirflowFailException, match=r"\['schools'\]"):
+        operator.run_batch_sql_queries(ENDPOINTS)
+
+    # The descriptors share one COPY INTO; the other resource is still loaded.
+    copied_tables = [statement.split()[2] for statement in pool.statements if statement.strip().startswith("COPY INTO")]
+    assert sorted(copied_tables) == ['db.schema._descriptors', 'db.schema.students']
@@ -0,0 +1,107 @@
+import pytest
+
+from tn_edu_airflow.util.change_version_windows import get_change_version_windows, plan_change_version_windows
+
+
+def covered_change_versions(windows):
+    return [change_version for window_min, window_max in windows for change_version in range(window_min, window_max + 1)]
+
+
+def test_windows_do_not_overlap():
+    assert get_change_version_windows(0, 120, 50) == [(0, 50), (51, 101), (102, 120)]
+    assert covered_change_versions(get_change_version_windows(0, 120, 50)) == list(range(0, 121))
+
+
+@pytest.mark.parametrize("min_change_version, max_change_version, step_size", [
+    (0, 120, 50), (0, 100, 50), (7, 1000, 1), (3, 4, 50), (500, 123456, 50000),
+])
+def test_windows_cover_every_change_version_once(min_change_version, max_change_version, step_size):
+    windows = get_change_version_windows(min_change_version, max_change_version, step_size)
+    assert covered_change_versions(windows) == list(range(min_change_version, max_change_version + 1))
+
+
+def test_single_change_version():
+    assert get_change_version_windows(5, 5, 50) == [(5, 5)]
+
+
+def test_empty_range():
+    assert get_change_version_windows(6, 5, 50) == []
+
+
+@pytest.mark.parametrize("min_change_version, max_change_version, step_size", [(0, 120, 50), (5, 5, 50), (10, 9999, 700)])
+def test_windows_match_library_stepping(min_change_version, max_change_version, step_size):
+    """
+    Every change version pulled by `get_pages(step_change_version=True)` is pulled exactly once by the windows.
+    """
+    edfi_params = pytest.importorskip("edfi_api_client.edfi_params")
+
+    params = edfi_params.EdFiParams(minChangeVersion=min_change_version, maxChangeVersion=max_change_version)
+    params.init_page_by_change_version_step(step_size)
+
+    library_windows = []
+    while True:
+        library_windows.append((params['minChangeVersion'], params['maxChangeVersion']))
+        try:
+            params.page_by_change_version_step()
+        except StopIteration:
+            break
+
+    windows = get_change_version_windows(min_change_version, max_change_version, step_size)
+    assert covered_change_versions(windows) == covered_change_versions(library_windows)
+
+
+class FakeCountRows:
+    """
+    Count the rows of an inclusive change-version range over a fixed list of record change versions.
+    """
+    def __init__(self, change_versions):
+        self.change_versions = change_versions
+        self.probes = []
+
+    def __call__(self, window_min, window_max):
+        self.probes.append((window_min, window_max))
+        return sum(window_min <= change_version <= window_max for change_version in self.change_versions)
+
+
+@pytest.mark.parametrize("change_versions", [
+    list(range(0, 121)),                                    # One record per change version.
+    list(range(0, 10)) + list(range(5000, 5100)) + [9999],  # Dense clusters in a sparse range.
+    [0, 1, 1, 1, 64, 64, 65, 128],                          # Repeated and boundary change versions.
+])
+def test_planned_windows_pull_each_record_once(change_versions):
+    count_rows = FakeCountRows(change_versions)
+    windows = plan_change_version_windows(
+        count_rows, 0, max(change_versions), target_rows_per_window=10, min_step_size=1
+    )
+
+    assert covered_change_versions(windows) == list(range(0, max(change_versions) + 1))
+    assert sum(count_rows(window_min, window_max) for window_min, window_max in windows) == len(change_versions)
+
+
+def test_planned_windows_respect_target():
+    count_rows = FakeCountRows(list(range(0, 1000)))
+    windows = plan_change_version_windows(count_rows, 0, 999, target_rows_per_window=100, min_step_size=1)
+
+    assert all(count_rows(window_min, window_max) <= 100 for window_min, window_max in windows)
+    assert len(windows) <= 20
+
+
+def test_planned_window_derived_counts_match_probes():
+    """
+    The right half of each split is never probed, so its count is derived from its parent's; it must match a real count.
+    With a target of one row, every window then holds at most one row, or a single change version.
+    """
+    change_versions = [0, 3, 3, 4, 7, 8, 8, 8, 15, 16]
+    count_rows = FakeCountRows(change_versions)
+    windows = plan_change_version_windows(count_rows, 0, 16, target_rows_per_window=1, min_step_size=0)
+
+    for window_min, window_max in windows:
+        assert count_rows(window_min, window_max) <= 1 or window_min == window_max
+
+    assert covered_change_versions(windows) == list(range(0, 17))
+
+
+def test_planned_windows_skip_first_probe_with_known_total():
+    count_rows = FakeCountRows(list(range(0, 50)))
+    assert plan_change_version_windows(count_rows, 0, 49, target_rows_per_window=100, total_rows=50) == [(0, 49)]
+    assert count_rows.probes == []
@@ -0,0 +1,98 @@
+import pytest
+
+pytest.importorskip("azure.core")
+pytest.importorskip("airflow.providers.microsoft.azure")
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from tn_edu_airflow.util import checkpoints
+from tn_edu_airflow.util.checkpoints import ADLSWindowCheckpoint
+
+
+class FakeADLS:
+    """
+    Stand in for the ADLS hook, keeping files in a dict keyed by path.
+    """
+    def __init__(self):
+        self.files = {}
+
+    def __call__(self, adls_conn_id):
+        return self
+
+    def create_file(self, file_name, file_system_name):
+        return FakeFileClient(self, file_name)
+
+    def get_file_system(self, file_system_name):
+        return self
+
+    def get_file_client(self, file_name):
+        return FakeFileClient(self, file_name)
+
+    def delete_directory(self, file_system_name, directory_name):
+        keys = [key for key in self.files if key.startswith(directory_name + '/')]
+        if not keys:
+            raise ResourceNotFoundError("Directory not found.")
+        for key in keys:
+            del self.files[key]
+
+
+class FakeFileClient:
+    def __init__(self, adls, file_name):
+        self.adls = adls
+        self.file_name = file_name
+
+    def upload_data(self, data, overwrite=False):
+        self.adls.files[self.file_name] = data
+
+    def download_file(self):
+        if self.file_name not in self.adls.files:
+            raise ResourceNotFoundError("File not found.")
+        return self
+
+    def readall(self):
+        return self.adls.files[self.file_name]
+
+
+PLAN = {'resource': 'students', 'min_change_version': 0, 'max_change_version': 1000, 'change_version_step_size': 100}
+
+
+@pytest.fixture
+def adls(monkeypatch):
+    fake_adls = FakeADLS()
+    monkeypatch.setattr(checkpoints, 'AzureDataLakeStorageV2Hook', fake_adls)
+    return fake_adls
+
+
+def build_checkpoint(plan=PLAN) -> ADLSWindowCheckpoint:
+    return ADLSWindowCheckpoint(
+        'adls', 'students/_checkpoints/students.json', part_dir='students/students', plan=plan
+    )
+
+
+def test_retry_resumes_from_landed_windows(adls):
+    checkpoint = build_checkpoint()
+    assert checkpoint.load() == {}
+
+    checkpoint.window_bounds = [(0, 100), (101, 200), (201, 1000)]
+    checkpoint.record_window(0, 250)
+    checkpoint.record_window(2, 50)
+    adls.files['students/students/part-00000.jsonl'] = b''
+
+    retried_checkpoint = build_checkpoint()
+    assert retried_checkpoint.load() == {0: 250, 2: 50}
+    assert retried_checkpoint.window_bounds == [(0, 100), (101, 200), (201, 1000)]
+    assert retried_checkpoint.total_rows == 300
+    assert 'students/students/part-00000.jsonl' in adls.files
+
+
+def test_changed_plan_starts_over(adls):
+    checkpoint = build_checkpoint()
+    checkpoint.load()
+    checkpoint.window_bounds = [(0, 1000)]
+    checkpoint.record_window(0, 250)
+    adls.files['students/students/part-00000.jsonl'] = b''
+
+    retried_checkpoint = build_checkpoint({**PLAN, 'max_change_version': 2000})
+    assert retried_checkpoint.load() == {}
+    assert retried_checkpoint.window_bounds is None
+    assert 'students/students/part-00000.jsonl' not in adls.files
@@ -0,0 +1,32 @@
+from tn_edu_airflow.util.content_hash import ContentHasher
+
+
+def hash_rows(*pages) -> str:
+    hasher = ContentHasher()
+    for page in pages:
+        hasher.update(page)
+    return hasher.hexdigest()
+
+
+def test_hash_ignores_row_and_key_order():
+    rows = [{'id': 'a', 'name': 'Ada'}, {'id': 'b', 'name': 'Bo'}, {'id': 'c', 'name': 'Cy'}]
+    reordered = [{'name': 'Cy', 'id': 'c'}, {'name': 'Ada', 'id': 'a'}, {'name': 'Bo', 'id': 'b'}]
+
+    assert hash_rows(rows) == hash_rows(reordered[:1], reordered[1:])
+    assert len(hash_rows(rows)) == 64
+
+
+def test_hash_changes_with_content():
+    rows = [{'id': 'a', 'name': 'Ada'}, {'id': 'b', 'name': 'Bo'}]
+
+    assert hash_rows(rows) != hash_rows([{'id': 'a', 'name': 'Ada'}, {'id': 'b', 'name': 'Bob'}])
+    assert hash_rows(rows) != hash_rows(rows + rows[:1])
+    assert hash_rows([]) != hash_rows(rows)
+
+
+def test_pages_are_hashed_as_consumed():
+    pages = [[{'id': 'a'}], [{'id': 'b'}, {'id': 'c'}]]
+    hasher = ContentHasher()
+
+    assert list(hasher.hash_pages(iter(pages))) == pages
+    assert hasher.hexdigest() == hash_rows(*pages)
@@ -0,0 +1,98 @@
+import pytest
+
+pytest.importorskip("airflow.providers.databricks")
+
+from tn_edu_airflow.util import databricks_pool
+from tn_edu_airflow.util.databricks_pool import DatabricksConnectionPool
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def execute(self, sql, parameters=None):
+        if self.connection.broken:
+            raise ConnectionError("Connection reset")
+        self.connection.statements.append((sql, parameters))
+
+    def fetchall(self):
+        return [(1,)]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+        self.broken = False
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    opened = []
+
+    class FakeHook:
+        def __init__(self, databricks_conn_id):
+            pass
+
+        def get_conn(self):
+            opened.append(FakeConnection())
+            return opened[-1]
+
+    monkeypatch.setattr(databricks_pool, 'DatabricksSqlHook', FakeHook)
+    return opened
+
+
+def test_connections_are_reused(connections):
+    pool = DatabricksConnectionPool('databricks')
+    pool.run("SELECT 1")
+    pool.run(["SELECT 2", "SELECT 3"])
+
+    assert len(connections) == 1
+    assert [sql for sql, _ in connections[0].statements] == ["SELECT 1", "SELECT 2", "SELECT 3"]
+
+
+def test_failed_connections_are_discarded(connections):
+    pool = DatabricksConnectionPool('databricks')
+    pool.run("SELECT 1")
+    connections[0].broken = True
+
+    with pytest.raises(ConnectionError):
+        pool.run("SELECT 2")
+
+    pool.run("SELECT 3")
+    assert connections[0].closed
+    assert len(connections) == 2
+
+
+def test_unhealthy_idle_connections_are_replaced(connections):
+    pool = DatabricksConnectionPool('databricks', health_check_seconds=0)
+    pool.run("SELECT 1")
+    connections[0].broken = True
+
+    pool.run("SELECT 2")
+    assert connections[0].closed
+    assert connections[1].statements == [("SELECT 2", None)]
+
+
+def test_insert_rows_binds_values(connections):
+    pool = DatabricksConnectionPool('databricks')
+    pool.insert_rows('db.schema.table', [["it's", 1, None], ["back\\slash", 2, True]], ['name', 'version', 'active'])
+
+    sql, parameters = connections[0].statements[0]
+    assert sql == "INSERT INTO db.schema.table (name, version, active) VALUES\n(:r0c0, :r0c1, :r0c2),\n(:r1c0, :r1c1, :r1c2)"
+    assert parameters == {
+        'r0c0': "it's", 'r0c1': 1, 'r0c2': None,
+        'r1c0': "back\\slash", 'r1c1': 2, 'r1c2': True,
+    }
@@ -0,0 +1,66 @@
+import pytest
+
+from tn_edu_airflow.util.deduplication import RecordDeduplicator
+
+
+@pytest.fixture
+def deduplicator(tmp_path):
+    deduplicator = RecordDeduplicator(str(tmp_path / "dedupe" / "ids.sqlite"))
+    yield deduplicator
+    deduplicator.close()
+
+
+def ids(rows):
+    return [row.get('id') for row in rows]
+
+
+def test_repeated_ids_are_dropped_unless_newer(deduplicator):
+    first = [{'id': 'a', '_lastModifiedDate': '2025-01-01'}, {'id': 'b', '_lastModifiedDate': '2025-01-01'}]
+    second = [
+        {'id': 'a', '_lastModifiedDate': '2025-01-01'},  # Same version: dropped.
+        {'id': 'b', '_lastModifiedDate': '2025-02-01'},  # Newer version: kept.
+        {'id': 'b', '_lastModifiedDate': '2024-12-01'},  # Older version: dropped.
+        {'name': 'no id'},
+    ]
+
+    assert ids(deduplicator.filter(first)) == ['a', 'b']
+    assert ids(deduplicator.filter(second)) == ['b', None]
+    assert deduplicator.num_dropped == 2
+
+
+def test_change_versions_compare_numerically(deduplicator):
+    deduplicator.filter([{'id': 'a', 'changeVersion': 9}])
+
+    assert ids(deduplicator.filter([{'id': 'a', 'changeVersion': 10}])) == ['a']
+    assert ids(deduplicator.filter([{'id': 'a', 'changeVersion': 10}])) == []
+
+
+def test_versions_spill_to_sqlite(tmp_path):
+    deduplicator = RecordDeduplicator(str(tmp_path / "dedupe" / "ids.sqlite"), max_memory_keys=2)
+    rows = [{'id': str(idx), 'changeVersion': 1} for idx in range(5)]
+
+    assert len(deduplicator.filter(rows)) == 5
+    assert deduplicator.db is not None and not deduplicator.versions
+    assert deduplicator.filter(rows) == []
+    assert ids(deduplicator.filter([{'id': '3', 'changeVersion': 2}, {'id': '5', 'changeVersion': 1}])) == ['3', '5']
+
+    deduplicator.close()
+    assert not (tmp_path / "dedupe" / "ids.sqlite").exists()
+
+
+@pytest.mark.parametrize("max_memory_keys", [1000, 1])
+def test_failed_attempt_is_rolled_back(tmp_path, max_memory_keys):
+    deduplicator = RecordDeduplicator(str(tmp_path / "dedupe" / "ids.sqlite"), max_memory_keys=max_memory_keys)
+    deduplicator.filter([{'id': 'a', 'changeVersion': 1}])
+
+    with pytest.raises(RuntimeError):
+        with deduplicator.attempt() as attempt:
+            attempt.filter([{'id': 'a', 'changeVersion': 1}, {'id': 'a', 'changeVersion': 2}, {'id': 'b', 'changeVersion': 1}])
+            raise RuntimeError("Window failed")
+
+    # The retried window is filtered as if the failed attempt never happened.
+    assert deduplicator.num_dropped == 0
+    with deduplicator.attempt() as attempt:
+        assert ids(attempt.filter([{'id': 'a', 'changeVersion': 2}, {'id': 'b', 'changeVersion': 1}])) == ['a', 'b']
+
+    deduplicator.close()
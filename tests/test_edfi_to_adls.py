@@ -0,0 +1,66 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("airflow.models")
+pytest.importorskip("edu_edfi_airflow")
+
+from tn_edu_airflow.providers.edfi.transfers import edfi_to_adls
+from tn_edu_airflow.providers.edfi.transfers.edfi_to_adls import EdFiToADLSOperator
+
+
+class FakeVariables:
+    """
+    Stand in for Airflow Variables, storing values as the metadata database would.
+    """
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key, default_var=None, deserialize_json=False):
+        if key not in self.store:
+            return default_var
+        return json.loads(self.store[key]) if deserialize_json else self.store[key]
+
+    def set(self, key, value, serialize_json=False):
+        self.store[key] = json.dumps(value) if serialize_json else str(value)
+
+
+@pytest.fixture
+def variables(monkeypatch):
+    fake_variables = FakeVariables()
+    monkeypatch.setattr(edfi_to_adls, 'Variable', fake_variables)
+    return fake_variables
+
+
+def build_operator(**kwargs) -> EdFiToADLSOperator:
+    return EdFiToADLSOperator(
+        task_id='pull_students', edfi_conn_id='edfi', resource='students', tmp_dir='/tmp', adls_conn_id='adls',
+        adaptive_page_size={'min_page_size': 100, 'max_page_size': 1000},
+        page_size_variable='edfi_page_sizes__tenant__2025', **kwargs
+    )
+
+
+def test_page_sizes_share_one_variable(variables):
+    operator = build_operator()
+    resources = [f"resource_{idx}" for idx in range(20)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda resource: operator.save_page_size(resource, 'ed-fi', 300), resources))
+
+    build_operator(get_deletes=True).save_page_size('students', 'ed-fi', 900)
+
+    assert list(variables.store) == ['edfi_page_sizes__tenant__2025']
+    saved_page_sizes = variables.get('edfi_page_sizes__tenant__2025', deserialize_json=True)
+    assert saved_page_sizes == {
+        **{f"ed-fi/{resource}": 300 for resource in resources},
+        'ed-fi/students/deletes': 900,
+    }
+
+
+def test_controller_starts_from_saved_page_size(variables):
+    build_operator().save_page_size('students', 'ed-fi', 700)
+
+    assert build_operator().build_page_size_controller('students', 'ed-fi', 500).page_size == 700
+    assert build_operator().build_page_size_controller('schools', 'ed-fi', 500).page_size == 500
+    assert build_operator(get_key_changes=True).build_page_size_controller('students', 'ed-fi', 500).page_size == 500
@@ -0,0 +1,205 @@
+import io
+import json
+
+import pytest
+
+from tn_edu_airflow.util.landing_writers import JsonlLandingWriter, ParquetLandingWriter, RollingLandingWriter
+from tn_edu_airflow.util.landing_writers import SchoolYearRoutingWriter
+
+
+class MemorySink(io.BytesIO):
+    """
+    In-memory output sink, recording whether it was committed or aborted.
+    """
+    committed = False
+    aborted = False
+
+    def commit(self):
+        self.committed = True
+
+    def abort(self):
+        self.aborted = True
+
+
+def land_parquet(tmp_path, rows, row_group_size=2):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+    sink = MemorySink()
+    writer = ParquetLandingWriter(sink, spool_path=str(tmp_path / "spool" / "rows.jsonl"), row_group_size=row_group_size)
+    writer.write_rows(rows)
+    writer.commit()
+
+    assert sink.committed
+    assert not (tmp_path / "spool" / "rows.jsonl").exists()
+    return pyarrow_parquet.read_table(io.BytesIO(sink.getvalue()))
+
+
+def test_empty_structs_are_dropped(tmp_path):
+    table = land_parquet(tmp_path, [
+        {'id': 'a', '_ext': {}, 'schoolReference': {'schoolId': 1, '_ext': {}}},
+        {'id': 'b', '_ext': {}, 'schoolReference': {'schoolId': 2}},
+        {'id': 'c', '_ext': {}, 'schoolReference': None},
+    ])
+
+    assert table.column_names == ['id', 'schoolReference']
+    assert table.to_pylist() == [
+        {'id': 'a', 'schoolReference': {'schoolId': 1}},
+        {'id': 'b', 'schoolReference': {'schoolId': 2}},
+        {'id': 'c', 'schoolReference': None},
+    ]
+
+
+def test_numbers_and_strings_across_batches(tmp_path):
+    # With two rows per row group, the field is numeric in the first batch and a string in the second.
+    table = land_parquet(tmp_path, [
+        {'id': 'a', 'code': 1},
+        {'id': 'b', 'code': 2.5},
+        {'id': 'c', 'code': '3A'},
+        {'id': 'd', 'code': True},
+    ])
+
+    assert str(table.schema.field('code').type) == 'string'
+    assert table.column('code').to_pylist() == ['1', '2.5', '3A', 'true']
+
+
+def test_integers_and_floats_widen_to_doubles(tmp_path):
+    table = land_parquet(tmp_path, [{'gpa': 3}, {'gpa': 3.5}, {'gpa': None}])
+
+    assert str(table.schema.field('gpa').type) == 'double'
+    assert table.column('gpa').to_pylist() == [3.0, 3.5, None]
+
+
+def test_integers_stay_integers(tmp_path):
+    table = land_parquet(tmp_path, [{'changeVersion': 10 ** 15 + 1}, {'changeVersion': 2}])
+
+    assert str(table.schema.field('changeVersion').type) == 'int64'
+    assert table.column('changeVersion').to_pylist() == [10 ** 15 + 1, 2]
+
+
+def test_sparse_nested_fields_stay_navigable(tmp_path):
+    table = land_parquet(tmp_path, [
+        {'addresses': [{'city': 'Nashville', 'periods': []}]},
+        {'addresses': [{'city': 'Memphis', 'postalCode': '38103', 'periods': [{'beginDate': '2024-08-01'}]}]},
+        {'addresses': []},
+    ])
+
+    assert table.to_pylist() == [
+        {'addresses': [{'city': 'Nashville', 'periods': [], 'postalCode': None}]},
+        {'addresses': [{'city': 'Memphis', 'periods': [{'beginDate': '2024-08-01'}], 'postalCode': '38103'}]},
+        {'addresses': []},
+    ]
+
+
+def test_structured_and_scalar_fields_land_as_json(tmp_path):
+    table = land_parquet(tmp_path, [{'value': {'a': 1}}, {'value': 'b'}, {'value': None}])
+
+    assert table.column('value').to_pylist() == ['{"a": 1}', 'b', None]
+
+
+def test_null_fields_land_as_strings(tmp_path):
+    table = land_parquet(tmp_path, [{'id': 'a', 'endDate': None}, {'id': 'b', 'endDate': None}])
+
+    assert str(table.schema.field('endDate').type) == 'string'
+
+
+def build_jsonl_writers():
+    """
+    Return a `build_writer` callable writing JSON lines to in-memory sinks, and the sinks it built by key.
+    """
+    sinks = {}
+
+    def build_writer(key):
+        sinks[key] = MemorySink()
+        return JsonlLandingWriter(sinks[key])
+
+    return build_writer, sinks
+
+
+def read_jsonl(sink):
+    return [json.loads(line) for line in sink.getvalue().splitlines()]
+
+
+def test_parts_roll_over_at_max_bytes():
+    build_writer, sinks = build_jsonl_writers()
+    deleted = []
+    writer = RollingLandingWriter(
+        build_writer, part_prefix='students/part', part_extension='.jsonl', max_part_bytes=40, delete_part=deleted.append
+    )
+
+    for idx in range(5):
+        writer.write_rows([{'id': f"{idx:020d}"}])  # 31 bytes per row
+    writer.commit()
+
+    assert writer.committed_keys == [
+        'students/part-00000.jsonl', 'students/part-00001.jsonl', 'students/part-00002.jsonl'
+    ]
+    assert [len(read_jsonl(sinks[key])) for key in writer.committed_keys] == [2, 2, 1]
+    assert all(sink.committed for sink in sinks.values())
+    assert not deleted
+
+
+def test_empty_trailing_part_is_never_landed():
+    build_writer, sinks = build_jsonl_writers()
+    writer = RollingLandingWriter(
+        build_writer, part_prefix='students/part', part_extension='.jsonl', max_part_bytes=1, delete_part=None
+    )
+
+    writer.write_rows([{'id': 'a'}])
+    writer.write_rows([])
+    writer.commit()
+
+    assert writer.committed_keys == ['students/part-00000.jsonl']
+    assert sinks['students/part-00001.jsonl'].aborted
+
+
+def test_abort_deletes_committed_parts():
+    build_writer, sinks = build_jsonl_writers()
+    deleted = []
+    writer = RollingLandingWriter(
+        build_writer, part_prefix='students/part', part_extension='.jsonl', max_part_bytes=1, delete_part=deleted.append
+    )
+
+    writer.write_jsonl(io.BytesIO(b'{"id": "a"}\n{"id": "b"}\n'), chunk_size=1)
+    writer.write_rows([{'id': 'c'}])
+    writer.abort()
+
+    assert deleted == ['students/part-00000.jsonl', 'students/part-00001.jsonl', 'students/part-00002.jsonl']
+    assert writer.committed_keys == []
+
+
+def test_rows_are_routed_by_school_year():
+    build_writer, sinks = build_jsonl_writers()
+    writer = SchoolYearRoutingWriter(build_writer, school_years=[2024, 2025], delete_year=None)
+
+    rows = [
+        {'id': 'a', 'schoolYear': 2024},
+        {'id': 'b', 'sessionReference': {'schoolYear': 2025}},
+        {'id': 'c', 'classOfSchoolYearTypeReference': {'schoolYear': 2024}},
+        {'id': 'd', 'schoolYear': 2023},
+    ]
+    assert writer.write_rows(rows) == 4
+    writer.commit()
+
+    assert writer.landed_years == [2024, 2025]
+    assert [row['id'] for row in read_jsonl(sinks[2024])] == ['a', 'c']
+    assert [row['id'] for row in read_jsonl(sinks[2025])] == ['b', 'c']
+    assert writer.num_dropped == 1
+
+
+def test_failed_school_year_unlands_every_year():
+    build_writer, sinks = build_jsonl_writers()
+    deleted = []
+    writer = SchoolYearRoutingWriter(build_writer, school_years=[2024, 2025, 2026], delete_year=deleted.append)
+
+    writer.write_jsonl(io.BytesIO(b'{"schoolYear": 2024}\n{"schoolYear": 2025}\n{"schoolYear": 2026}\n'), batch_size=2)
+
+    def fail_upload():
+        raise RuntimeError("Upload failed")
+    sinks[2025].commit = fail_upload
+
+    with pytest.raises(RuntimeError):
+        writer.commit()
+
+    assert deleted == [2024]
+    assert sinks[2026].aborted
+    assert writer.landed_years == []
@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from tn_edu_airflow.util.page_size_controller import AdaptivePageSizeController, RequestTimer
+
+
+def build_controller(page_size=500) -> AdaptivePageSizeController:
+    return AdaptivePageSizeController(
+        page_size, min_page_size=100, max_page_size=1000, target_page_seconds=2.0, max_page_mb=1.0,
+        increase_step=100, decrease_factor=0.5
+    )
+
+
+def test_page_size_grows_additively_and_is_cut_multiplicatively():
+    controller = build_controller()
+
+    controller.observe_window(num_pages=4, request_seconds=4.0, num_bytes=4 * 1024)
+    assert controller.page_size == 600
+
+    controller.observe_window(num_pages=4, request_seconds=12.0, num_bytes=4 * 1024)  # Slow pages.
+    assert controller.page_size == 300
+
+    controller.observe_window(num_pages=2, request_seconds=1.0, num_bytes=4 * 1024 ** 2)  # Large pages.
+    assert controller.page_size == 150
+
+    controller.observe_window(num_pages=0, request_seconds=0.0, num_bytes=0)
+    assert controller.page_size == 150
+
+
+def test_page_size_stays_within_bounds():
+    assert build_controller(5000).page_size == 1000
+    assert build_controller(10).page_size == 100
+
+    controller = build_controller(950)
+    controller.observe_window(num_pages=1, request_seconds=0.1, num_bytes=1024)
+    assert controller.page_size == 1000
+
+
+def test_backoff_stops_at_the_minimum():
+    controller = build_controller(300)
+
+    assert controller.backoff() and controller.page_size == 150
+    assert controller.backoff() and controller.page_size == 100
+    assert not controller.backoff()
+    assert controller.page_size == 100
+
+
+def test_invalid_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        AdaptivePageSizeController(500, min_page_size=600, max_page_size=500)
+
+
+def test_request_timer_excludes_time_spent_by_the_consumer():
+    def slow_pages():
+        for page in range(3):
+            time.sleep(0.02)
+            yield page
+
+    timer = RequestTimer()
+    pages = []
+    for page in timer.time(slow_pages()):
+        time.sleep(0.05)
+        pages.append(page)
+
+    assert pages == [0, 1, 2]
+    assert 0.06 <= timer.seconds < 0.15
@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from tn_edu_airflow.util.rate_limiter import ODSRateLimiter
+
+
+def build_rate_limiter(tmp_path, **kwargs) -> ODSRateLimiter:
+    return ODSRateLimiter("https://ods.example.org", state_dir=str(tmp_path / "rate_limits"), poll_seconds=0.005, **kwargs)
+
+
+def get_dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_requests_in_flight_are_capped_across_limiters(tmp_path):
+    # Two limiters on the same ODS stand in for two tasks on the worker.
+    rate_limiters = [build_rate_limiter(tmp_path, max_concurrent_requests=2) for _ in range(2)]
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def request(idx):
+        with rate_limiters[idx % 2].request():
+            with lock:
+                in_flight.append(idx)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(idx)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(request, range(12)))
+
+    assert max(max_in_flight) == 2
+    assert sum(rate_limiter.num_requests for rate_limiter in rate_limiters) == 12
+
+
+def test_requests_wait_for_tokens(tmp_path):
+    rate_limiter = build_rate_limiter(tmp_path, requests_per_second=50, burst=2)
+
+    start = time.monotonic()
+    assert list(rate_limiter.throttle(iter(range(6)))) == list(range(6))
+
+    # The burst is spent at once; each request after it waits 1/50 second.
+    assert time.monotonic() - start >= 0.07
+    assert rate_limiter.wait_seconds > 0
+
+
+def test_requests_held_by_exited_processes_are_released(tmp_path):
+    rate_limiter = build_rate_limiter(tmp_path, max_concurrent_requests=1)
+    with open(rate_limiter.state_path, 'w') as fp:
+        json.dump({'tokens': 1, 'updated': time.time(), 'in_flight': {f"{get_dead_pid()}:held": time.time()}}, fp)
+
+    with rate_limiter.request():
+        with open(rate_limiter.state_path) as fp:
+            assert len(json.load(fp)['in_flight']) == 1
+
+    with open(rate_limiter.state_path) as fp:
+        assert json.load(fp)['in_flight'] == {}
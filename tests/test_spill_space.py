@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from tn_edu_airflow.util.spill_space import SpillSpaceManager
+
+
+def build_manager(tmp_path, **kwargs) -> SpillSpaceManager:
+    kwargs = {'quota_mb': 10, 'reserve_mb': 6, 'min_free_mb': 0, 'poll_seconds': 0.01, 'max_poll_seconds': 0.01, **kwargs}
+    return SpillSpaceManager(str(tmp_path), **kwargs)
+
+
+def touch(path, age_seconds: float = 0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as fp:
+        fp.write("rows")
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+
+
+def get_dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_reservations_wait_on_the_quota(tmp_path):
+    manager = build_manager(tmp_path, max_wait_seconds=0.05)
+    oversized_manager = build_manager(tmp_path, reserve_mb=50)
+
+    # A lone reservation is always granted, even beyond the quota.
+    with oversized_manager.reserve([str(tmp_path / "students.jsonl")]):
+        assert manager.usage()['num_reservations'] == 1
+
+    with manager.reserve([str(tmp_path / "students.jsonl")]):
+        with pytest.raises(TimeoutError):
+            manager.acquire([str(tmp_path / "schools.jsonl")])
+
+        assert manager.usage()['reserved_bytes'] == 6 * 1024 ** 2
+
+    assert manager.usage()['num_reservations'] == 0
+
+
+def test_release_removes_the_files_of_a_reservation(tmp_path):
+    manager = build_manager(tmp_path, quota_mb=None)
+    students_path = str(tmp_path / "students" / "students.jsonl")
+    students_part_dir = str(tmp_path / "students" / "students")
+    schools_path = str(tmp_path / "students" / "schools.jsonl")
+
+    with manager.reserve([schools_path]):
+        with manager.reserve([students_path, students_part_dir]):
+            for path in (students_path, students_path + ".spool", students_path + ".window00001",
+                         os.path.join(students_part_dir, "part-00000.parquet"), schools_path):
+                touch(path)
+
+        assert os.listdir(tmp_path / "students") == ["schools.jsonl"]
+
+    assert os.listdir(tmp_path / "students") == []
+
+
+def test_claimed_paths_include_suffixed_siblings_and_children():
+    claimed_paths = ["/tmp/edfi/students.jsonl"]
+
+    assert SpillSpaceManager.is_claimed("/tmp/edfi/students.jsonl", claimed_paths)
+    assert SpillSpaceManager.is_claimed("/tmp/edfi/students.jsonl.spool", claimed_paths)
+    assert SpillSpaceManager.is_claimed("/tmp/edfi/students.jsonl/part-00000.jsonl", claimed_paths)
+    assert not SpillSpaceManager.is_claimed("/tmp/edfi/students.jsonl_copy", claimed_paths)
+
+
+def test_startup_removes_files_of_exited_processes_and_orphans(tmp_path):
+    dead_path = str(tmp_path / "dead" / "students.jsonl")
+    live_path = str(tmp_path / "live" / "schools.jsonl")
+    touch(dead_path)
+    touch(live_path, age_seconds=7200)
+    touch(str(tmp_path / "orphan.jsonl"), age_seconds=7200)
+    touch(str(tmp_path / "recent.jsonl"))
+
+    with open(tmp_path / SpillSpaceManager.STATE_FILENAME, 'w') as fp:
+        json.dump({'reservations': {
+            f"{get_dead_pid()}:dead": {'bytes': 1, 'paths': [dead_path], 'since': time.time()},
+            f"{os.getpid()}:live": {'bytes': 1, 'paths': [live_path], 'since': time.time()},
+        }}, fp)
+
+    manager = build_manager(tmp_path, orphan_hours=1)
+
+    assert not os.path.exists(dead_path)
+    assert not os.path.exists(tmp_path / "orphan.jsonl")
+    assert os.path.exists(live_path)
+    assert os.path.exists(tmp_path / "recent.jsonl")
+    assert manager.usage()['num_reservations'] == 1
@@ -0,0 +1,113 @@
+import json
+from contextlib import contextmanager
+
+import pytest
+
+pytest.importorskip("airflow.exceptions")
+pytest.importorskip("croniter")
+pytest.importorskip("edfi_api_client")
+
+from airflow.exceptions import AirflowSkipException
+
+from tn_edu_airflow.callables import table_maintenance
+from tn_edu_airflow.callables.table_maintenance import TABLE_MAINTENANCE_VARIABLE, maintain_raw_tables
+
+
+class FakeVariables:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key, default_var=None, deserialize_json=False):
+        return json.loads(self.store[key]) if key in self.store else default_var
+
+    def set(self, key, value, serialize_json=False):
+        self.store[key] = json.dumps(value)
+
+
+class FakePool:
+    """
+    Stand in for the Databricks pool, describing tables from `details` and compacting them on OPTIMIZE.
+    """
+    def __init__(self, details):
+        self.details = details
+        self.statements = []
+
+    def run(self, queries):
+        self.statements.extend(query for query in queries if "STATEMENT_TIMEOUT" not in query)
+        for query in queries:
+            if query.startswith("OPTIMIZE"):
+                self.details[query.split()[1]]['numFiles'] = 1
+
+    @contextmanager
+    def connection(self):
+        yield self
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    def execute(self, sql):
+        self.detail = self.details[sql.split()[-1]]
+        self.description = [(column,) for column in self.detail]
+
+    def fetchone(self):
+        return tuple(self.detail.values())
+
+
+@pytest.fixture
+def variables(monkeypatch):
+    fake_variables = FakeVariables()
+    monkeypatch.setattr(table_maintenance, 'Variable', fake_variables)
+    monkeypatch.setattr(table_maintenance.airflow_util, 'get_params_from_conn', lambda conn_id, extra: ('raw', 'edfi'))
+    return fake_variables
+
+
+def use_pool(monkeypatch, details) -> FakePool:
+    pool = FakePool(details)
+    monkeypatch.setattr(table_maintenance, 'get_databricks_pool', lambda conn_id: pool)
+    return pool
+
+
+def test_tables_past_a_threshold_are_optimized(monkeypatch, variables):
+    pool = use_pool(monkeypatch, {
+        'raw.edfi.students': {'numFiles': 600, 'sizeInBytes': 10, 'clusteringColumns': []},
+        'raw.edfi._descriptors': {'numFiles': 20, 'sizeInBytes': 2 * 1024 ** 3, 'clusteringColumns': ['name']},
+        'raw.edfi.schools': {'numFiles': 20, 'sizeInBytes': 10, 'clusteringColumns': []},
+    })
+
+    maintain_raw_tables('databricks', [['students', 'schools'], None, ['_descriptors', 'students']], min_new_files=500)
+
+    assert pool.statements == [
+        "OPTIMIZE raw.edfi.students ZORDER BY (tenant_code, api_year, name)",
+        "VACUUM raw.edfi.students RETAIN 168 HOURS",
+        "OPTIMIZE raw.edfi._descriptors",
+        "VACUUM raw.edfi._descriptors RETAIN 168 HOURS",
+    ]
+
+    saved_state = variables.get(TABLE_MAINTENANCE_VARIABLE, deserialize_json=True)
+    assert sorted(saved_state) == ['raw.edfi._descriptors', 'raw.edfi.students']
+    assert saved_state['raw.edfi.students']['num_files'] == 1
+
+
+def test_recently_optimized_tables_wait(monkeypatch, variables):
+    pool = use_pool(monkeypatch, {'raw.edfi.students': {'numFiles': 600, 'sizeInBytes': 10, 'clusteringColumns': []}})
+    maintain_raw_tables('databricks', [['students']], min_new_files=500)
+
+    pool.details['raw.edfi.students']['numFiles'] = 1200
+    with pytest.raises(AirflowSkipException):
+        maintain_raw_tables('databricks', [['students']], min_new_files=500)
+
+    assert len(pool.statements) == 2
+
+
+def test_nothing_runs_past_the_budget(monkeypatch, variables):
+    pool = use_pool(monkeypatch, {'raw.edfi.students': {'numFiles': 600, 'sizeInBytes': 10, 'clusteringColumns': []}})
+    maintain_raw_tables('databricks', [['students']], min_new_files=500, max_minutes=-1)
+
+    assert pool.statements == []
+    assert TABLE_MAINTENANCE_VARIABLE not in variables.store
+
+
+def test_skipped_loads_skip_maintenance(variables):
+    with pytest.raises(AirflowSkipException):
+        maintain_raw_tables('databricks', [None, []])